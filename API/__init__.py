@@ -2,10 +2,147 @@
 Vintrace V6 API Client Package
 
 Provides Python client for Vintrace V6 REST API.
+
+Pydantic models, AsyncVintraceAPIClient and the optional helpers (cache,
+coalescer, metrics, pager, sync, ...) are imported lazily on first access
+(e.g. ``from API import WorkOrder``), so scripts that only use raw dict
+responses do not pay their import cost.
 """
 
+import importlib
+
 from .vintrace_api_client import VintraceAPIClient
+from .vintrace_rate_limit import RateLimiter
 from .vintrace_api_utils import VintraceDataFetcher, create_client_from_env
-from .vintrace_models import *
 
-__all__ = ['VintraceAPIClient', 'VintraceDataFetcher', 'create_client_from_env']
+# Attribute name -> submodule that defines it (imported on first access)
+_LAZY_ATTRS = {
+    'AsyncVintraceAPIClient': '.vintrace_async_client',
+    'ResponseCache': '.vintrace_cache',
+    'RequestCoalescer': '.vintrace_coalesce',
+    'CircuitBreaker': '.vintrace_circuit_breaker',
+    'CircuitOpenError': '.vintrace_circuit_breaker',
+    'MetricsRecorder': '.vintrace_metrics',
+    'JSONLinesExporter': '.vintrace_metrics',
+    'AdaptivePager': '.vintrace_pager',
+    'PageSizeStore': '.vintrace_pager',
+    'TransactionDayCache': '.vintrace_transaction_cache',
+    'IncrementalSync': '.vintrace_sync',
+    'AdditionOps': '.vintrace_models',
+    'AdditionSummaryItem': '.vintrace_models',
+    'AdditionsSummary': '.vintrace_models',
+    'Additives': '.vintrace_models',
+    'Address': '.vintrace_models',
+    'AnalysisOps': '.vintrace_models',
+    'AssignWorkData': '.vintrace_models',
+    'AssignWorkResponse': '.vintrace_models',
+    'Attachment': '.vintrace_models',
+    'BasicBatchDetails': '.vintrace_models',
+    'BeverageTypeProperties': '.vintrace_models',
+    'BrandAllocation': '.vintrace_models',
+    'Codeable': '.vintrace_models',
+    'Components': '.vintrace_models',
+    'Distribution': '.vintrace_models',
+    'FieldValuePair': '.vintrace_models',
+    'FinalProduct': '.vintrace_models',
+    'FromVessel': '.vintrace_models',
+    'FullBlockAssessment': '.vintrace_models',
+    'FullBlockAssessmentRequest': '.vintrace_models',
+    'Grading': '.vintrace_models',
+    'Grower': '.vintrace_models',
+    'IntakeOperation': '.vintrace_models',
+    'IntakeOperationSearchResponse': '.vintrace_models',
+    'InventorySummary': '.vintrace_models',
+    'InventorySummaryResponse': '.vintrace_models',
+    'ItemSummary': '.vintrace_models',
+    'Job': '.vintrace_models',
+    'JobField': '.vintrace_models',
+    'JobFieldValue': '.vintrace_models',
+    'JobStep': '.vintrace_models',
+    'LocationDetails': '.vintrace_models',
+    'LossDetails': '.vintrace_models',
+    'MetricAnalysis': '.vintrace_models',
+    'Party': '.vintrace_models',
+    'PartyResponse': '.vintrace_models',
+    'PartyUpdateResponse': '.vintrace_models',
+    'PriceList': '.vintrace_models',
+    'Product': '.vintrace_models',
+    'ProductCompositonData': '.vintrace_models',
+    'ProductCompositonSummary': '.vintrace_models',
+    'ProductListResponse': '.vintrace_models',
+    'ProductLiveMetric': '.vintrace_models',
+    'ProductLiveMetricMeasurement': '.vintrace_models',
+    'ProductResponse': '.vintrace_models',
+    'ProductUpdateData': '.vintrace_models',
+    'ProductUpdateField': '.vintrace_models',
+    'ProductUpdateResponse': '.vintrace_models',
+    'ProductVesselDetails': '.vintrace_models',
+    'QuantityBreakdown': '.vintrace_models',
+    'RateAmount': '.vintrace_models',
+    'RateOfChangeResponse': '.vintrace_models',
+    'Refund': '.vintrace_models',
+    'RefundLineItem': '.vintrace_models',
+    'RefundResponse': '.vintrace_models',
+    'RefundUpdateResponse': '.vintrace_models',
+    'SalesOrder': '.vintrace_models',
+    'SalesOrderItem': '.vintrace_models',
+    'SalesOrderResponse': '.vintrace_models',
+    'SalesOrderUpdateResponse': '.vintrace_models',
+    'SampleOperation': '.vintrace_models',
+    'SampleOperationSearchResponse': '.vintrace_models',
+    'SearchDescriptive': '.vintrace_models',
+    'Searchable': '.vintrace_models',
+    'SimpleCoded': '.vintrace_models',
+    'SimpleMetric': '.vintrace_models',
+    'SimpleSearchResponse': '.vintrace_models',
+    'SimpleSearchResult': '.vintrace_models',
+    'StockBulkInfoDetail': '.vintrace_models',
+    'StockDistributionDetail': '.vintrace_models',
+    'StockDistributionItem': '.vintrace_models',
+    'StockFieldsDetail': '.vintrace_models',
+    'StockForm': '.vintrace_models',
+    'StockHistoryItem': '.vintrace_models',
+    'StockHistoryItemsDetail': '.vintrace_models',
+    'StockItem': '.vintrace_models',
+    'StockItemBasics': '.vintrace_models',
+    'StockItemDetails': '.vintrace_models',
+    'StockNote': '.vintrace_models',
+    'StockNotesDetail': '.vintrace_models',
+    'StockRawComponentItem': '.vintrace_models',
+    'StockRawComponentsDetail': '.vintrace_models',
+    'StockType': '.vintrace_models',
+    'SubmitJobRequest': '.vintrace_models',
+    'SubmitJobRequestField': '.vintrace_models',
+    'SubmitJobRequestFieldValue': '.vintrace_models',
+    'SubmitWorkOrderStepsResponse': '.vintrace_models',
+    'Tag': '.vintrace_models',
+    'TaxAmount': '.vintrace_models',
+    'TaxState': '.vintrace_models',
+    'ToVessel': '.vintrace_models',
+    'TransOperation': '.vintrace_models',
+    'TransactionSummaryResponse': '.vintrace_models',
+    'Unit': '.vintrace_models',
+    'VesselDetails': '.vintrace_models',
+    'VolumeMeasurement': '.vintrace_models',
+    'Weight': '.vintrace_models',
+    'WorkOrder': '.vintrace_models',
+    'WorkOrderSearchResponse': '.vintrace_models',
+}
+
+__all__ = ['VintraceAPIClient', 'AsyncVintraceAPIClient', 'RateLimiter', 'ResponseCache', 'TransactionDayCache',
+           'IncrementalSync', 'MetricsRecorder', 'JSONLinesExporter', 'RequestCoalescer',
+           'AdaptivePager', 'PageSizeStore', 'CircuitBreaker', 'CircuitOpenError',
+           'VintraceDataFetcher', 'create_client_from_env']
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -0,0 +1,83 @@
+"""
+Benchmark: response decoding
+
+Decodes a synthetic work order listing with each ResponseDecoder mode and
+reports median time and peak memory per decode. Large listings (vessels,
+stock, work orders with jobs) spend a noticeable share of a fetch in
+json.loads and in building dicts that are only read once.
+
+Usage (from the repository root):
+    python API/benchmarks/bench_decode.py --work-orders 5000 --runs 7
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from API.vintrace_decode import DECODE_MODES, ResponseDecoder  # noqa: E402
+
+
+def make_payload(count: int) -> bytes:
+    """A WorkOrderSearchResponse body with `count` work orders of three jobs each"""
+    work_orders = []
+    for i in range(count):
+        work_orders.append({
+            "id": i, "code": f"WO-{i:06d}", "jobCount": 3, "jobCountText": "3 jobs",
+            "status": "Ready", "assignedTo": "Cellar", "assignedBy": "Winemaker",
+            "assignedDate": 1731000000000 + i, "scheduledDate": 1731100000000 + i,
+            "assignedDateAsText": "2025-11-07", "scheduledDateAsText": "2025-11-08",
+            "canAssign": True, "summary": "Rack and return",
+            "winery": "Canoe Ridge",
+            "jobs": [{"id": i * 10 + j, "code": f"J{j}", "jobNumber": j, "status": "Ready",
+                      "summaryText": "Rack", "jobColour": "#ffffff", "workOrderId": i} for j in range(3)],
+        })
+    body = {"totalResultCount": count, "firstResult": 0, "maxResult": count, "workOrders": work_orders}
+    return json.dumps(body).encode("utf-8")
+
+
+def bench(decoder, payload: bytes, runs: int):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        decoder(payload)
+        timings.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    result = decoder(payload)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return statistics.median(timings), peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare response decoding modes")
+    parser.add_argument("--work-orders", type=int, default=5000, help="Work orders in the payload (default: 5000)")
+    parser.add_argument("--runs", type=int, default=7, help="Timed decodes per mode (default: 7)")
+    args = parser.parse_args()
+
+    payload = make_payload(args.work_orders)
+    print(f"Payload: {len(payload) / (1024 * 1024):.1f} MB, {args.work_orders} work orders\n")
+    print(f"{'Mode':10} {'median ms':>10} {'peak MB':>10}")
+    print("-" * 32)
+    for mode in DECODE_MODES:
+        if mode == "json":
+            decoder = json.loads
+        else:
+            try:
+                decoder = ResponseDecoder(mode)
+            except ImportError as e:
+                print(f"{mode:10} skipped ({e})")
+                continue
+            decoder = (lambda d: lambda body: d.decode(body, "WorkOrderSearchResponse"))(decoder)
+        median_ms, peak_mb = bench(decoder, payload, args.runs)
+        print(f"{mode:10} {median_ms:10.1f} {peak_mb:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: package import time
+
+Every script Main.py launches is a fresh interpreter, so the cost of
+``import API`` is paid on every loop. This measures it in clean subprocesses
+and compares it with the cost of touching a model (which triggers the lazy
+import of vintrace_models) and of importing the models eagerly.
+
+Usage (from the repository root):
+    python API/benchmarks/bench_import_time.py --runs 15
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+SCENARIOS = {
+    "baseline (python -c pass)": "pass",
+    "import API": "import API",
+    "import API + first model access": "import API; API.WorkOrder",
+    "import API.vintrace_models (eager)": "import API.vintrace_models",
+}
+
+
+def time_snippet(code: str, runs: int) -> list:
+    """Wall time in milliseconds of running `code` in a fresh interpreter"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time of the API package")
+    parser.add_argument("--runs", type=int, default=10, help="Subprocess runs per scenario (default: 10)")
+    args = parser.parse_args()
+
+    # Warm the OS file cache and bytecode cache before measuring
+    time_snippet("import API; API.WorkOrder; API.AsyncVintraceAPIClient", 1)
+
+    print(f"{'Scenario':40} {'median ms':>10} {'min ms':>10}")
+    print("-" * 62)
+    results = {}
+    for name, code in SCENARIOS.items():
+        timings = time_snippet(code, args.runs)
+        results[name] = statistics.median(timings)
+        print(f"{name:40} {results[name]:10.1f} {min(timings):10.1f}")
+
+    baseline = results["baseline (python -c pass)"]
+    print("-" * 62)
+    print(f"import API costs {results['import API'] - baseline:.1f} ms over a bare interpreter")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+"""
+Streaming multi-entity export of Vintrace data
+
+Exports several list endpoints at once (one worker per entity type) and
+writes every page to disk as it arrives, so memory stays flat no matter how
+large an export gets. Each run directory holds one file per entity plus a
+``manifest.json`` with record counts, page counts, durations and the offset
+reached, which is what makes an interrupted export resumable:
+
+    python -m API.bulk_export --output-dir exports/nightly
+    python -m API.bulk_export --output-dir exports/nightly --resume
+    python -m API.bulk_export --output-dir exports/nightly --format parquet --entities products parties
+
+NDJSON exports resume from the last completed page. Parquet files cannot be
+appended to, so an unfinished Parquet entity is exported again from the
+start (finished entities are always skipped). Parquet output needs pyarrow:
+pip install pyarrow. Its schema grows with the data: a later page with a
+wider type (int -> float, anything -> string) or a new field rewrites the
+row groups written so far under the merged schema.
+"""
+
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from .vintrace_api_client import VintraceAPIClient
+from .vintrace_decode import to_builtins
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# Entity name -> paginated client method
+EXPORT_ENTITIES: Dict[str, str] = {
+    "work_orders": "list_available_work_orders",
+    "products": "list_available_products",
+    "sales_orders": "list_available_sales_orders",
+    "parties": "list_parties",
+    "refunds": "list_available_refunds",
+    "inventory": "list_available_stock",
+}
+
+EXPORT_FORMATS = ("ndjson", "parquet")
+
+MANIFEST_FILE = "manifest.json"
+
+
+class ExportManifest:
+    """Thread-safe per-entity progress record, persisted after every page"""
+
+    def __init__(self, path: str, data: Optional[Dict[str, Any]] = None):
+        self.path = path
+        self.data = data or {"created": datetime.now().isoformat(), "entities": {}}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> "ExportManifest":
+        """Read an existing manifest, or start an empty one"""
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(path, json.load(f))
+        return cls(path)
+
+    def entity(self, name: str) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.data["entities"].get(name, {}))
+
+    def update(self, name: str, **fields) -> None:
+        """Merge fields into the entity's entry and write the manifest atomically"""
+        with self._lock:
+            self.data["entities"].setdefault(name, {}).update(fields)
+            self.data["updated"] = datetime.now().isoformat()
+            self._save()
+
+    def _save(self) -> None:
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+class NDJSONWriter:
+    """Appends records to a .ndjson file one line each"""
+
+    extension = "ndjson"
+
+    def __init__(self, path: str, resume_bytes: int = 0):
+        """
+        Args:
+            path: File to write
+            resume_bytes: Keep this many bytes of an existing file and append after them
+        """
+        self.path = path
+        if resume_bytes and os.path.exists(path):
+            self._file = open(path, "r+b")
+            self._file.truncate(resume_bytes)
+            self._file.seek(resume_bytes)
+        else:
+            self._file = open(path, "wb")
+
+    def write_page(self, records: List[Any]) -> None:
+        lines = [json.dumps(to_builtins(r), ensure_ascii=False, default=str) for r in records]
+        if lines:
+            self._file.write(("\n".join(lines) + "\n").encode("utf-8"))
+        self._file.flush()
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _merge_types(current: "pa.DataType", new: "pa.DataType") -> "pa.DataType":
+    """Narrowest type holding both: null widens to anything, ints to float, the rest to string"""
+    if current == new or pa.types.is_null(new):
+        return current
+    if pa.types.is_null(current):
+        return new
+    numeric = (pa.types.is_integer, pa.types.is_floating)
+    if any(check(current) for check in numeric) and any(check(new) for check in numeric):
+        return pa.float64()
+    return pa.string()
+
+
+def _column(values: List[Any]) -> "pa.Array":
+    """Arrow array of one page's column; values that do not share a type become strings"""
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, OverflowError):
+        return pa.array([value if value is None or isinstance(value, str) else json.dumps(value, default=str)
+                         for value in values], pa.string())
+
+
+def _conform(table: "pa.Table", schema: "pa.Schema") -> "pa.Table":
+    """Cast a table to schema, adding missing columns as nulls"""
+    columns = [table.column(field.name).cast(field.type) if field.name in table.column_names
+               else pa.nulls(table.num_rows, field.type) for field in schema]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+class ParquetWriter:
+    """
+    Writes each page as a Parquet row group
+
+    Top-level fields become columns; nested objects and arrays are stored as
+    JSON strings. The schema is merged with every page: fields that first
+    appear later are added (null in earlier rows) and conflicting types are
+    promoted (see _merge_types). Parquet files cannot be altered in place, so
+    a schema change copies the row groups written so far, one at a time,
+    into a new file under the merged schema.
+    """
+
+    extension = "parquet"
+
+    def __init__(self, path: str, resume_bytes: int = 0):
+        if pa is None:
+            raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
+        self.path = path
+        self._writer = None
+        self._schema = None
+        self._current = path  # file being written; a schema change moves to a new one
+        self._rewrites = 0
+
+    @staticmethod
+    def _table(records: List[Any]) -> "pa.Table":
+        rows = [to_builtins(r) for r in records]
+        names: Dict[str, None] = {}  # insertion-ordered set
+        for row in rows:
+            names.update(dict.fromkeys(row))
+        columns = {}
+        for name in names:
+            values = [row.get(name) for row in rows]
+            columns[name] = _column([json.dumps(value, ensure_ascii=False, default=str)
+                                     if isinstance(value, (dict, list)) else value for value in values])
+        return pa.table(columns)
+
+    def _merged_schema(self, schema: "pa.Schema") -> "pa.Schema":
+        if self._schema is None:
+            return schema
+        fields = {field.name: field.type for field in self._schema}
+        for field in schema:
+            fields[field.name] = _merge_types(fields[field.name], field.type) if field.name in fields else field.type
+        return pa.schema(list(fields.items()))
+
+    def _rewrite(self, schema: "pa.Schema") -> None:
+        """Copy the row groups written so far into a new file with a wider schema"""
+        self._writer.close()
+        self._rewrites += 1
+        target = f"{self.path}.{self._rewrites}"
+        writer = pq.ParquetWriter(target, schema)
+        with open(self._current, "rb") as f:
+            source = pq.ParquetFile(f)
+            for i in range(source.num_row_groups):
+                writer.write_table(_conform(source.read_row_group(i), schema))
+        if self._current != self.path:
+            os.remove(self._current)
+        self._current = target
+        self._writer = writer
+        logger.info(f"{os.path.basename(self.path)}: schema widened, rewrote {source.num_row_groups} row groups")
+
+    def write_page(self, records: List[Any]) -> None:
+        if not records:
+            return
+        table = self._table(records)
+        schema = self._merged_schema(table.schema)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._current, schema)
+        elif not schema.equals(self._schema):
+            self._rewrite(schema)
+        self._schema = schema
+        self._writer.write_table(_conform(table, schema))
+
+    def tell(self) -> int:
+        return 0
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            if self._current != self.path:
+                os.replace(self._current, self.path)
+        elif self._schema is None:
+            # No records: still leave a (column-less) file behind
+            pq.write_table(pa.table({}), self.path)
+
+
+WRITERS = {"ndjson": NDJSONWriter, "parquet": ParquetWriter}
+
+
+class BulkExporter:
+    """Exports several entity types concurrently, streaming pages to disk"""
+
+    def __init__(self, client: VintraceAPIClient, output_dir: str, fmt: str = "ndjson",
+                 page_size: int = 100, max_workers: int = 4, prefetch: bool = True):
+        """
+        Args:
+            client: Configured Vintrace API client
+            output_dir: Directory for the entity files and manifest.json
+            fmt: "ndjson" or "parquet" (default: "ndjson")
+            page_size: Records requested per page (default: 100)
+            max_workers: Entity types exported at the same time (default: 4)
+            prefetch: Request each entity's next page while the current one is written (default: True)
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format {fmt!r}; expected one of {EXPORT_FORMATS}")
+        if fmt == "parquet" and pa is None:
+            raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
+        self.client = client
+        self.output_dir = output_dir
+        self.fmt = fmt
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.prefetch = prefetch
+        os.makedirs(output_dir, exist_ok=True)
+        self.manifest = ExportManifest.load(os.path.join(output_dir, MANIFEST_FILE))
+
+    def _file_path(self, entity: str) -> str:
+        return os.path.join(self.output_dir, f"{entity}.{WRITERS[self.fmt].extension}")
+
+    def export_entity(self, entity: str, resume: bool = False) -> Dict[str, Any]:
+        """
+        Stream one entity type to its file
+
+        Args:
+            entity: Key of EXPORT_ENTITIES
+            resume: Continue from the manifest's last completed page (default: False)
+
+        Returns:
+            The entity's manifest entry
+        """
+        path = self._file_path(entity)
+        part_path = path + ".part"
+        state = self.manifest.entity(entity) if resume else {}
+        if state.get("status") == "complete" and state.get("format") == self.fmt and os.path.exists(path):
+            logger.info(f"{entity}: already complete ({state['records']} records), skipping")
+            return state
+
+        offset, records, pages, nbytes = 0, 0, 0, 0
+        if (self.fmt == "ndjson" and state.get("format") == "ndjson" and os.path.exists(part_path)
+                and os.path.getsize(part_path) >= state.get("bytes", 0)):
+            offset, records, pages, nbytes = (state.get("next_offset", 0), state.get("records", 0),
+                                              state.get("pages", 0), state.get("bytes", 0))
+            if offset:
+                logger.info(f"{entity}: resuming at offset {offset}")
+        elapsed_before = state.get("duration_s", 0.0) if offset else 0.0
+
+        self.manifest.update(entity, status="running", format=self.fmt, file=os.path.basename(path),
+                             records=records, pages=pages, next_offset=offset, bytes=nbytes,
+                             duration_s=elapsed_before, error=None)
+        method_func = getattr(self.client, EXPORT_ENTITIES[entity])
+        writer = WRITERS[self.fmt](part_path, resume_bytes=nbytes)
+        start = time.perf_counter()
+        try:
+            for page in self.client.iter_pages(method_func, prefetch=self.prefetch,
+                                               first=offset, max=self.page_size):
+                writer.write_page(page)
+                offset += self.page_size
+                records += len(page)
+                pages += 1
+                self.manifest.update(entity, records=records, pages=pages, next_offset=offset,
+                                     bytes=writer.tell(),
+                                     duration_s=round(elapsed_before + time.perf_counter() - start, 3))
+        except Exception as e:
+            writer.close()
+            self.manifest.update(entity, status="failed", error=f"{type(e).__name__}: {e}",
+                                 duration_s=round(elapsed_before + time.perf_counter() - start, 3))
+            logger.error(f"{entity}: export failed after {records} records: {e}")
+            raise
+        writer.close()
+        os.replace(part_path, path)
+        self.manifest.update(entity, status="complete", finished=datetime.now().isoformat(),
+                             duration_s=round(elapsed_before + time.perf_counter() - start, 3))
+        logger.info(f"{entity}: {records} records in {pages} pages")
+        return self.manifest.entity(entity)
+
+    def run(self, entities: Optional[Sequence[str]] = None, resume: bool = False) -> Dict[str, Any]:
+        """
+        Export entity types concurrently; one failing entity does not stop the others
+
+        Args:
+            entities: Keys of EXPORT_ENTITIES (default: all)
+            resume: Skip complete entities and continue unfinished ones (default: False)
+
+        Returns:
+            The manifest contents
+        """
+        entities = list(entities or EXPORT_ENTITIES)
+        unknown = [e for e in entities if e not in EXPORT_ENTITIES]
+        if unknown:
+            raise ValueError(f"Unknown entities {unknown}; expected some of {list(EXPORT_ENTITIES)}")
+
+        def export(entity: str) -> None:
+            try:
+                self.export_entity(entity, resume=resume)
+            except Exception:
+                pass  # recorded in the manifest
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(export, entities))
+        return self.manifest.data
+
+
+def format_manifest(manifest: Dict[str, Any]) -> str:
+    """Summary table of a manifest's entities"""
+    lines = [f"{'Entity':16} {'status':>9} {'records':>9} {'pages':>6} {'seconds':>8}"]
+    lines.append("-" * len(lines[0]))
+    for name, entry in manifest.get("entities", {}).items():
+        lines.append(f"{name:16} {entry.get('status', '?'):>9} {entry.get('records', 0):9} "
+                     f"{entry.get('pages', 0):6} {entry.get('duration_s', 0.0):8.2f}")
+    return "\n".join(lines)
+
+
+def main():
+    from .vintrace_api_utils import create_client_from_env
+
+    parser = argparse.ArgumentParser(description="Stream Vintrace entities to NDJSON or Parquet files")
+    parser.add_argument("--output-dir", default=f"vintrace_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                        help="Directory for the export (default: vintrace_export_<timestamp>)")
+    parser.add_argument("--entities", nargs="+", choices=list(EXPORT_ENTITIES),
+                        help="Entity types to export (default: all)")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson", help="Output format (default: ndjson)")
+    parser.add_argument("--page-size", type=int, default=100, help="Records per request (default: 100)")
+    parser.add_argument("--workers", type=int, default=4, help="Entities exported at once (default: 4)")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted export in --output-dir")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    exporter = BulkExporter(create_client_from_env(), args.output_dir, fmt=args.format,
+                            page_size=args.page_size, max_workers=args.workers)
+    manifest = exporter.run(args.entities, resume=args.resume)
+    print(format_manifest(manifest))
+    failed = [name for name, entry in manifest["entities"].items() if entry.get("status") != "complete"]
+    if failed:
+        raise SystemExit(f"Export incomplete: {', '.join(failed)} (rerun with --resume)")
+
+
+if __name__ == "__main__":
+    main()
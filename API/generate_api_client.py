@@ -3,8 +3,9 @@ Generate Pydantic models and API client from OpenAPI specification
 
 This script parses the vintrace-v6-apis.yaml file and generates:
 1. Pydantic models for all schemas
-2. API client with methods for all endpoints
-3. Helper utilities for data fetching
+2. msgspec Structs for fast typed decoding
+3. API client with methods for all endpoints
+4. Helper utilities for data fetching
 """
 
 import yaml
@@ -131,6 +132,70 @@ def generate_models_file(spec: Dict[str, Any]) -> str:
     return '\n'.join(lines)
 
 
+def get_struct_type(schema: Dict[str, Any], schemas: Dict[str, Any]) -> str:
+    """Python type hint for a msgspec Struct field (dates stay ISO strings)"""
+    python_type = get_python_type(schema, schemas)
+    return re.sub(r'\b(date|datetime)\b', 'str', python_type)
+
+
+def generate_struct_class(name: str, schema: Dict[str, Any], schemas: Dict[str, Any]) -> str:
+    """Generate a msgspec Struct from schema (every field optional, unknown fields ignored)"""
+    properties = schema.get('properties', {})
+    description = schema.get('description', '')
+    
+    lines = []
+    lines.append(f"class {name}(msgspec.Struct, kw_only=True, omit_defaults=True):")
+    
+    if description:
+        lines.append(f'    """{description}"""')
+    
+    if not properties:
+        lines.append("    pass")
+        return '\n'.join(lines)
+    
+    for prop_name, prop_schema in properties.items():
+        prop_type = get_struct_type(prop_schema, schemas)
+        lines.append(f"    {prop_name}: Optional[{prop_type}] = None")
+    
+    lines.append("")
+    return '\n'.join(lines)
+
+
+def generate_structs_file(spec: Dict[str, Any]) -> str:
+    """Generate vintrace_structs.py (msgspec Structs used by decode="structs")"""
+    schemas = spec.get('components', {}).get('schemas', {})
+    
+    lines = []
+    lines.append('"""')
+    lines.append('msgspec Structs for Vintrace V6 API responses')
+    lines.append('')
+    lines.append('Auto-generated from vintrace-v6-apis.yaml')
+    lines.append('')
+    lines.append('Used by the clients when created with decode="structs": response bodies are')
+    lines.append('decoded straight into these compact typed objects, skipping the intermediate')
+    lines.append('dicts. Every field is optional because the API omits empty values.')
+    lines.append('"""')
+    lines.append('')
+    lines.append('from __future__ import annotations')
+    lines.append('from typing import Optional, List, Dict, Any')
+    lines.append('import msgspec')
+    lines.append('')
+    lines.append('')
+    
+    for schema_name in sorted(schemas.keys()):
+        lines.append(generate_struct_class(schema_name, schemas[schema_name], schemas))
+        lines.append('')
+    
+    return '\n'.join(lines)
+
+
+def get_response_type(operation: Dict[str, Any]) -> str:
+    """Schema name of an operation's 200 JSON response, or '' if it is not a $ref"""
+    schema = (operation.get('responses', {}).get('200', {}).get('content', {})
+              .get('application/json', {}).get('schema', {}))
+    return schema['$ref'].split('/')[-1] if '$ref' in schema else ''
+
+
 def get_endpoint_params(parameters: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Extract and format endpoint parameters"""
     params = []
@@ -145,8 +210,34 @@ def get_endpoint_params(parameters: List[Dict[str, Any]]) -> List[Dict[str, Any]
     return params
 
 
-def generate_api_method(path: str, method: str, operation: Dict[str, Any]) -> str:
-    """Generate a method for an API endpoint"""
+def resolve_parameters(path: str, parameters: List[Dict[str, Any]],
+                       spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Resolve $ref parameters and add path parameters the spec forgot to declare
+    
+    Some operations (e.g. /products/{id}, /mrp/stock/{id}/notes) use {id} in the
+    path without a matching parameter, which would otherwise leave the builtin
+    ``id`` in the generated URL.
+    """
+    components = spec.get('components', {}).get('parameters', {})
+    resolved = []
+    for param in parameters or []:
+        if '$ref' in param:
+            param = components.get(param['$ref'].split('/')[-1], {})
+        if param.get('name'):
+            resolved.append(param)
+    
+    declared = {p['name'] for p in resolved if p.get('in') == 'path'}
+    for name in re.findall(r'\{(\w+)\}', path):
+        if name not in declared:
+            resolved.insert(0, {'name': name, 'in': 'path', 'required': True,
+                                'schema': {'type': 'string'}})
+    return resolved
+
+
+def generate_api_method(path: str, method: str, operation: Dict[str, Any],
+                        is_async: bool = False) -> str:
+    """Generate a method for an API endpoint (a coroutine when is_async is True)"""
     operation_id = operation.get('operationId', '')
     summary = operation.get('summary', '')
     description = operation.get('description', '')
@@ -190,12 +281,13 @@ def generate_api_method(path: str, method: str, operation: Dict[str, Any]) -> st
         params_list.append(f"data: Optional[Dict[str, Any]] = None")
     
     # Format method signature (with line wrapping if needed)
-    method_signature = f"    def {method_name}("
+    def_keyword = "async def" if is_async else "def"
+    method_signature = f"    {def_keyword} {method_name}("
     if len(params_list) <= 3 or len(', '.join(params_list)) < 80:
         method_signature += ', '.join(params_list) + ") -> Dict[str, Any]:"
         lines.append(method_signature)
     else:
-        lines.append(f"    def {method_name}(")
+        lines.append(f"    {def_keyword} {method_name}(")
         for i, param in enumerate(params_list):
             if i < len(params_list) - 1:
                 lines.append(f"        {param},")
@@ -244,159 +336,824 @@ def generate_api_method(path: str, method: str, operation: Dict[str, Any]) -> st
         lines.append("        params = None")
     
     # Make request
+    call = "await self._request" if is_async else "self._request"
+    response_type = get_response_type(operation)
+    type_arg = f", response_type='{response_type}'" if response_type else ""
     if method in ['post', 'put', 'patch']:
-        lines.append(f"        return self._request('{method.upper()}', url, params=params, json=data)")
+        lines.append(f"        return {call}('{method.upper()}', url, params=params, json=data{type_arg})")
     else:
-        lines.append(f"        return self._request('{method.upper()}', url, params=params)")
+        lines.append(f"        return {call}('{method.upper()}', url, params=params{type_arg})")
     
     lines.append("")
     return '\n'.join(lines)
 
 
+def generate_client_header() -> str:
+    """Generate the static part of vintrace_api_client.py (imports, __init__, helpers)"""
+    return '''"""
+Vintrace V6 API Client
+
+Auto-generated from vintrace-v6-apis.yaml
+"""
+
+import requests
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime
+import time
+
+from .vintrace_decode import ResponseDecoder
+from .vintrace_rate_limit import RateLimiter, parse_retry_after
+
+if TYPE_CHECKING:  # optional collaborators, imported by whoever builds them
+    from .vintrace_cache import ResponseCache
+    from .vintrace_circuit_breaker import CircuitBreaker
+    from .vintrace_coalesce import RequestCoalescer
+    from .vintrace_metrics import MetricsRecorder
+    from .vintrace_pager import AdaptivePager
+
+
+class VintraceAPIClient:
+    """Client for Vintrace V6 API
+    
+    This client provides methods for all Vintrace API endpoints.
+    
+    Example:
+        client = VintraceAPIClient(
+            base_url="https://your-instance.vintrace.net/vinx2/api/v6",
+            api_key="your-api-key"
+        )
+        work_orders = client.list_available_work_orders()
+    """
+
+    def __init__(self, base_url: str, api_key: Optional[str] = None,
+                 username: Optional[str] = None, password: Optional[str] = None,
+                 timeout: int = 30, max_retries: int = 3,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional['ResponseCache'] = None,
+                 decode: str = "json",
+                 metrics: Optional['MetricsRecorder'] = None,
+                 coalescer: Optional['RequestCoalescer'] = None,
+                 circuit_breaker: Optional['CircuitBreaker'] = None):
+        """
+        Initialize the Vintrace API client
+        
+        Args:
+            base_url: Base URL for the Vintrace API (e.g., "https://your-instance.vintrace.net/vinx2/api/v6")
+            api_key: API key for authentication (optional)
+            username: Username for basic auth (optional)
+            password: Password for basic auth (optional)
+            timeout: Request timeout in seconds (default: 30)
+            max_retries: Maximum number of retries for failed requests (default: 3)
+            rate_limiter: Shared RateLimiter to throttle requests (optional)
+            cache: On-disk ResponseCache for GET requests (optional)
+            decode: Response decoding: "json" (stdlib), "orjson" (faster dicts) or
+                "structs" (msgspec Structs for endpoints with a response schema)
+            metrics: MetricsRecorder that receives every request attempt (optional)
+            coalescer: RequestCoalescer sharing identical in-flight GETs and memoizing
+                their results for the run (optional)
+            circuit_breaker: CircuitBreaker that fails fast on endpoints that keep
+                failing (optional)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.decoder = ResponseDecoder(decode) if decode != "json" else None
+        self.metrics = metrics
+        self.coalescer = coalescer
+        self.circuit_breaker = circuit_breaker
+        if circuit_breaker is not None and metrics is not None:
+            metrics.add_circuit_breaker(circuit_breaker)
+        self.session = requests.Session()
+        
+        # Set up authentication headers
+        if api_key:
+            self.session.headers.update({"Authorization": f"Bearer {api_key}"})
+        elif username and password:
+            self.session.auth = (username, password)
+        
+        self.session.headers.update({"Accept": "application/json"})
+
+    def _request(self, method: str, path: str, response_type: Optional[str] = None,
+                 **kwargs) -> Dict[str, Any]:
+        """Make an HTTP request; GETs are coalesced and cached when configured"""
+        if method != "GET":
+            result = self._request_with_retry(method, path, response_type, **kwargs)
+            if self.coalescer is not None:
+                self.coalescer.clear()  # a write may change anything memoized
+            return result
+        if self.coalescer is not None:
+            return self.coalescer.fetch(method, path, kwargs.get("params"),
+                                        lambda: self._get(path, response_type, **kwargs), self.base_url)
+        return self._get(path, response_type, **kwargs)
+
+    def _get(self, path: str, response_type: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """GET a resource, serving it from the response cache when configured"""
+        if self.cache is not None:
+            # The cache stores plain JSON; typed decoding happens on the way out
+            value = self.cache.fetch("GET", path, kwargs.get("params"),
+                                     lambda: self._request_with_retry("GET", path, **kwargs), self.base_url)
+            return self.decoder.convert(value, response_type) if self.decoder else value
+        return self._request_with_retry("GET", path, response_type, **kwargs)
+
+    def _send(self, method: str, path: str, attempt: int = 0, **kwargs) -> requests.Response:
+        """Send one request once a rate limit slot is free, reporting it to the metrics recorder"""
+        circuit = self.circuit_breaker.key(self.base_url, method, path) if self.circuit_breaker else None
+        if circuit is not None:
+            self.circuit_breaker.before_request(circuit)
+        queued = sent = time.perf_counter()
+        response = None
+        error = None
+        try:
+            with self.rate_limiter.slot() if self.rate_limiter else nullcontext():
+                sent = time.perf_counter()
+                response = self.session.request(method, f"{self.base_url}{path}", **kwargs)
+            if self.rate_limiter:
+                self.rate_limiter.observe(response.status_code, response.headers)
+            return response
+        except requests.exceptions.RequestException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            if circuit is not None:
+                self.circuit_breaker.record(circuit, response is not None and response.status_code < 500)
+            if self.metrics is not None:
+                self.metrics.record(method, path, response.status_code if response is not None else None,
+                                    time.perf_counter() - sent,
+                                    len(response.content) if response is not None else 0,
+                                    attempt, sent - queued, error)
+
+    def _request_with_retry(self, method: str, path: str, response_type: Optional[str] = None,
+                            **kwargs) -> Dict[str, Any]:
+        """Make an HTTP request with retry logic"""
+        url = f"{self.base_url}{path}"
+        kwargs.setdefault("timeout", self.timeout)
+        
+        for attempt in range(self.max_retries):
+            try:
+                response = self._send(method, path, attempt, **kwargs)
+                response.raise_for_status()
+                
+                # Handle empty responses
+                if not response.content:
+                    return {}
+                
+                if self.decoder:
+                    return self.decoder.decode(response.content, response_type)
+                return response.json()
+            except requests.exceptions.HTTPError as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                # Retry on 429 (honouring Retry-After) and 5xx errors
+                status = e.response.status_code
+                if status == 429 or status >= 500:
+                    self._raise_if_circuit_open(method, path)
+                    time.sleep(self._retry_delay(e.response, attempt))
+                    continue
+                raise
+            except requests.exceptions.RequestException as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                self._raise_if_circuit_open(method, path)
+                time.sleep(2 ** attempt)
+        
+        raise Exception(f"Failed to {method} {url} after {self.max_retries} attempts")
+
+    def _raise_if_circuit_open(self, method: str, path: str) -> None:
+        """Skip the retry sleep when the failures so far have opened the circuit"""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.raise_if_open(self.circuit_breaker.key(self.base_url, method, path))
+
+    @staticmethod
+    def _retry_delay(response: Any, attempt: int) -> float:
+        """Seconds to wait before a retry: Retry-After if the server sent one, else 2 ** attempt"""
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return retry_after if retry_after is not None else 2 ** attempt
+
+    @staticmethod
+    def _extract_page(response: Any, results_key: str = "results") -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Split a list response into (results, totalResultCount); the total is None if not reported"""
+        if hasattr(response, "__struct_fields__"):
+            # Response decoded with decode="structs"
+            response = {field: getattr(response, field) for field in response.__struct_fields__}
+        if isinstance(response, dict):
+            results = response.get(results_key)
+            if results is None:
+                # Most list endpoints name the array after the entity (parties, products, ...)
+                results = next((v for v in response.values() if isinstance(v, list)), [])
+            total = response.get("totalResultCount")
+        else:
+            results = response if isinstance(response, list) else []
+            total = len(results)
+        return results, total
+
+    def get_all_pages(self, method_func, parallel: bool = False, max_workers: int = 4,
+                      pager: Optional['AdaptivePager'] = None, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Fetch all pages from a paginated endpoint
+        
+        In parallel mode the first page is fetched on its own to learn
+        totalResultCount, then every remaining offset is requested through a
+        thread pool and the pages are reassembled in offset order. Endpoints
+        that report no total (products, parties, sales orders, ...) are
+        fetched in windows of max_workers pages until a page comes back
+        short or empty.
+        
+        Args:
+            method_func: The API method to call (e.g., self.list_available_work_orders)
+            parallel: Fetch the remaining pages concurrently (default: False)
+            max_workers: Number of worker threads in parallel mode (default: 4)
+            pager: Tune the page size adaptively; pages are then fetched serially (default: None)
+            **kwargs: Arguments to pass to the method
+        
+        Returns:
+            List of all results from all pages
+        """
+        if pager is not None:
+            return list(self.iter_results(method_func, pager=pager, **kwargs))
+        
+        all_results = []
+        first_result = 0
+        max_result = int(kwargs.get("max", 100))
+        
+        while True:
+            kwargs["first"] = str(first_result)
+            kwargs["max"] = str(max_result)
+            
+            response = method_func(**kwargs)
+            results, total = self._extract_page(response)
+            
+            all_results.extend(results)
+            
+            # Check if there are more pages (without a total, a short page is the last one)
+            if total is None:
+                if len(results) < max_result:
+                    break
+            elif len(all_results) >= total:
+                break
+            
+            first_result += max_result
+            
+            if parallel:
+                def fetch_page(offset: int) -> List[Dict[str, Any]]:
+                    page_kwargs = dict(kwargs, first=str(offset))
+                    return self._extract_page(method_func(**page_kwargs))[0]
+                
+                # executor.map yields pages in offset order
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    if total is not None:
+                        for page in executor.map(fetch_page, range(first_result, total, max_result)):
+                            all_results.extend(page)
+                    else:
+                        last_page = False
+                        while not last_page:
+                            window = range(first_result, first_result + max_workers * max_result, max_result)
+                            for page in executor.map(fetch_page, window):
+                                all_results.extend(page)
+                                if len(page) < max_result:
+                                    last_page = True
+                                    break
+                            first_result += max_workers * max_result
+                break
+        
+        return all_results
+
+    def iter_pages(self, method_func, prefetch: bool = False,
+                   pager: Optional['AdaptivePager'] = None,
+                   **kwargs) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield each page of results from a paginated endpoint as it arrives
+        
+        Only the current page is held in memory. With prefetch enabled the
+        next page is requested in a background thread while the caller is
+        still processing the current one. Passing ``first`` starts at that
+        offset, e.g. to resume an interrupted export.
+        
+        With a pager the size of each page is chosen from the throughput of
+        the previous ones, so prefetch is not used.
+        
+        Args:
+            method_func: The API method to call (e.g., self.list_available_work_orders)
+            prefetch: Request the next page while the current one is consumed (default: False)
+            pager: Tune the page size adaptively (default: None, fixed ``max``)
+            **kwargs: Arguments to pass to the method
+        
+        Yields:
+            List of results for each page, in offset order
+        """
+        max_result = int(kwargs.get("max", 100))
+        start = int(kwargs.pop("first", 0))
+        
+        if pager is not None:
+            from .vintrace_pager import Page
+            
+            def fetch_sized(offset: int, size: int) -> Page:
+                return Page(*self._extract_page(method_func(**dict(kwargs, first=str(offset), max=str(size)))))
+            
+            yield from pager.iter_pages(fetch_sized, start=start)
+            return
+        
+        def fetch_page(offset: int) -> Any:
+            return method_func(**dict(kwargs, first=str(offset), max=str(max_result)))
+        
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            first_result = start
+            fetched = start
+            pending = None
+            while True:
+                response = pending.result() if pending else fetch_page(first_result)
+                pending = None
+                results, total = self._extract_page(response)
+                fetched += len(results)
+                first_result += max_result
+                
+                has_more = bool(results) and (fetched < total if total is not None
+                                              else len(results) >= max_result)
+                if has_more and executor:
+                    pending = executor.submit(fetch_page, first_result)
+                
+                yield results
+                
+                if not has_more:
+                    break
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    def iter_results(self, method_func, prefetch: bool = False,
+                     pager: Optional['AdaptivePager'] = None,
+                     **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Yield individual records from a paginated endpoint as pages arrive
+        
+        Args:
+            method_func: The API method to call (e.g., self.list_available_work_orders)
+            prefetch: Request the next page while the current one is consumed (default: False)
+            pager: Tune the page size adaptively (default: None)
+            **kwargs: Arguments to pass to the method
+        
+        Yields:
+            Each result record, in order
+        """
+        for page in self.iter_pages(method_func, prefetch=prefetch, pager=pager, **kwargs):
+            yield from page
+
+    # =================================================================
+    # API ENDPOINTS
+    # =================================================================
+'''
+
+
 def generate_api_client_file(spec: Dict[str, Any]) -> str:
     """Generate the complete api_client.py file"""
     paths = spec.get('paths', {})
     
     lines = []
-    lines.append('"""')
-    lines.append('Vintrace V6 API Client')
-    lines.append('')
-    lines.append('Auto-generated from vintrace-v6-apis.yaml')
-    lines.append('"""')
-    lines.append('')
-    lines.append('import requests')
-    lines.append('from typing import Optional, Dict, Any, List')
-    lines.append('from datetime import datetime')
-    lines.append('import time')
-    lines.append('')
-    lines.append('')
-    lines.append('class VintraceAPIClient:')
-    lines.append('    """Client for Vintrace V6 API')
-    lines.append('    ')
-    lines.append('    This client provides methods for all Vintrace API endpoints.')
-    lines.append('    ')
-    lines.append('    Example:')
-    lines.append('        client = VintraceAPIClient(')
-    lines.append('            base_url="https://your-instance.vintrace.net/vinx2/api/v6",')
-    lines.append('            api_key="your-api-key"')
-    lines.append('        )')
-    lines.append('        work_orders = client.list_available_work_orders()')
-    lines.append('    """')
-    lines.append('')
-    lines.append('    def __init__(self, base_url: str, api_key: Optional[str] = None,')
-    lines.append('                 username: Optional[str] = None, password: Optional[str] = None,')
-    lines.append('                 timeout: int = 30, max_retries: int = 3):')
-    lines.append('        """')
-    lines.append('        Initialize the Vintrace API client')
-    lines.append('        ')
-    lines.append('        Args:')
-    lines.append('            base_url: Base URL for the Vintrace API (e.g., "https://your-instance.vintrace.net/vinx2/api/v6")')
-    lines.append('            api_key: API key for authentication (optional)')
-    lines.append('            username: Username for basic auth (optional)')
-    lines.append('            password: Password for basic auth (optional)')
-    lines.append('            timeout: Request timeout in seconds (default: 30)')
-    lines.append('            max_retries: Maximum number of retries for failed requests (default: 3)')
-    lines.append('        """')
-    lines.append('        self.base_url = base_url.rstrip("/")')
-    lines.append('        self.api_key = api_key')
-    lines.append('        self.username = username')
-    lines.append('        self.password = password')
-    lines.append('        self.timeout = timeout')
-    lines.append('        self.max_retries = max_retries')
-    lines.append('        self.session = requests.Session()')
-    lines.append('        ')
-    lines.append('        # Set up authentication headers')
-    lines.append('        if api_key:')
-    lines.append('            self.session.headers.update({"Authorization": f"Bearer {api_key}"})')
-    lines.append('        elif username and password:')
-    lines.append('            self.session.auth = (username, password)')
-    lines.append('        ')
-    lines.append('        self.session.headers.update({"Accept": "application/json"})')
-    lines.append('')
-    lines.append('    def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:')
-    lines.append('        """Make an HTTP request with retry logic"""')
-    lines.append('        url = f"{self.base_url}{path}"')
-    lines.append('        kwargs.setdefault("timeout", self.timeout)')
-    lines.append('        ')
-    lines.append('        for attempt in range(self.max_retries):')
-    lines.append('            try:')
-    lines.append('                response = self.session.request(method, url, **kwargs)')
-    lines.append('                response.raise_for_status()')
-    lines.append('                ')
-    lines.append('                # Handle empty responses')
-    lines.append('                if not response.content:')
-    lines.append('                    return {}')
-    lines.append('                ')
-    lines.append('                return response.json()')
-    lines.append('            except requests.exceptions.HTTPError as e:')
-    lines.append('                if attempt == self.max_retries - 1:')
-    lines.append('                    raise')
-    lines.append('                # Retry on 5xx errors')
-    lines.append('                if e.response.status_code >= 500:')
-    lines.append('                    time.sleep(2 ** attempt)')
-    lines.append('                    continue')
-    lines.append('                raise')
-    lines.append('            except requests.exceptions.RequestException as e:')
-    lines.append('                if attempt == self.max_retries - 1:')
-    lines.append('                    raise')
-    lines.append('                time.sleep(2 ** attempt)')
-    lines.append('        ')
-    lines.append('        raise Exception(f"Failed to {method} {url} after {self.max_retries} attempts")')
-    lines.append('')
-    lines.append('    def get_all_pages(self, method_func, **kwargs) -> List[Dict[str, Any]]:')
-    lines.append('        """')
-    lines.append('        Fetch all pages from a paginated endpoint')
-    lines.append('        ')
-    lines.append('        Args:')
-    lines.append('            method_func: The API method to call (e.g., self.list_available_work_orders)')
-    lines.append('            **kwargs: Arguments to pass to the method')
-    lines.append('        ')
-    lines.append('        Returns:')
-    lines.append('            List of all results from all pages')
-    lines.append('        """')
-    lines.append('        all_results = []')
-    lines.append('        first_result = 0')
-    lines.append('        max_result = kwargs.get("max", 100)')
-    lines.append('        ')
-    lines.append('        while True:')
-    lines.append('            kwargs["first"] = str(first_result)')
-    lines.append('            kwargs["max"] = str(max_result)')
-    lines.append('            ')
-    lines.append('            response = method_func(**kwargs)')
-    lines.append('            ')
-    lines.append('            # Handle different response formats')
-    lines.append('            if isinstance(response, dict):')
-    lines.append('                results = response.get("results", [])')
-    lines.append('                total = response.get("totalResultCount", 0)')
-    lines.append('            else:')
-    lines.append('                results = response if isinstance(response, list) else []')
-    lines.append('                total = len(results)')
-    lines.append('            ')
-    lines.append('            all_results.extend(results)')
-    lines.append('            ')
-    lines.append('            # Check if there are more pages')
-    lines.append('            if len(all_results) >= total:')
-    lines.append('                break')
-    lines.append('            ')
-    lines.append('            first_result += max_result')
-    lines.append('        ')
-    lines.append('        return all_results')
-    lines.append('')
-    lines.append('    # =================================================================')
-    lines.append('    # API ENDPOINTS')
-    lines.append('    # =================================================================')
-    lines.append('')
+    lines.append(generate_client_header())
     
     # Generate methods for each endpoint
     for path, methods in sorted(paths.items()):
         for method, operation in methods.items():
             if method.lower() in ['get', 'post', 'put', 'delete', 'patch']:
+                operation = dict(operation, parameters=resolve_parameters(
+                    path, operation.get('parameters', []), spec))
                 method_code = generate_api_method(path, method.lower(), operation)
                 lines.append(method_code)
     
     return '\n'.join(lines)
 
 
+def generate_async_client_header() -> str:
+    """Generate the static part of vintrace_async_client.py (imports, __init__, helpers)"""
+    return '''"""
+Vintrace V6 Async API Client
+
+Auto-generated from vintrace-v6-apis.yaml
+"""
+
+import asyncio
+import time
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator
+
+from .vintrace_cache import ResponseCache
+from .vintrace_circuit_breaker import CircuitBreaker
+from .vintrace_coalesce import RequestCoalescer
+from .vintrace_decode import ResponseDecoder
+from .vintrace_metrics import MetricsRecorder
+from .vintrace_pager import AdaptivePager, Page
+from .vintrace_rate_limit import RateLimiter, parse_retry_after
+
+try:
+    import httpx
+except ImportError:  # httpx is only needed for the async client
+    httpx = None
+
+
+class AsyncVintraceAPIClient:
+    """Asynchronous client for Vintrace V6 API
+    
+    Exposes the same endpoint methods as VintraceAPIClient, but as coroutines.
+    All requests share one pooled httpx.AsyncClient and at most
+    ``max_concurrency`` of them are in flight at any time, so callers can
+    fan out with ``asyncio.gather`` without overwhelming the server.
+    
+    Example:
+        async with AsyncVintraceAPIClient(
+            base_url="https://your-instance.vintrace.net/vinx2/api/v6",
+            api_key="your-api-key",
+            max_concurrency=8
+        ) as client:
+            parties, products = await asyncio.gather(
+                client.list_parties(),
+                client.list_available_products()
+            )
+    """
+
+    def __init__(self, base_url: str, api_key: Optional[str] = None,
+                 username: Optional[str] = None, password: Optional[str] = None,
+                 timeout: int = 30, max_retries: int = 3,
+                 max_concurrency: int = 8, max_connections: Optional[int] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[ResponseCache] = None,
+                 decode: str = "json",
+                 metrics: Optional[MetricsRecorder] = None,
+                 coalescer: Optional[RequestCoalescer] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None):
+        """
+        Initialize the async Vintrace API client
+        
+        Args:
+            base_url: Base URL for the Vintrace API (e.g., "https://your-instance.vintrace.net/vinx2/api/v6")
+            api_key: API key for authentication (optional)
+            username: Username for basic auth (optional)
+            password: Password for basic auth (optional)
+            timeout: Request timeout in seconds (default: 30)
+            max_retries: Maximum number of retries for failed requests (default: 3)
+            max_concurrency: Maximum number of requests in flight at once (default: 8)
+            max_connections: Size of the shared connection pool (default: max_concurrency)
+            rate_limiter: Shared RateLimiter to throttle requests (optional)
+            cache: On-disk ResponseCache for GET requests (optional)
+            decode: Response decoding: "json" (stdlib), "orjson" (faster dicts) or
+                "structs" (msgspec Structs for endpoints with a response schema)
+            metrics: MetricsRecorder that receives every request attempt (optional)
+            coalescer: RequestCoalescer sharing identical in-flight GETs and memoizing
+                their results for the run (optional)
+            circuit_breaker: CircuitBreaker that fails fast on endpoints that keep
+                failing (optional)
+        """
+        if httpx is None:
+            raise ImportError("AsyncVintraceAPIClient requires httpx (pip install httpx)")
+        
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.decoder = ResponseDecoder(decode) if decode != "json" else None
+        self.metrics = metrics
+        self.coalescer = coalescer
+        self.circuit_breaker = circuit_breaker
+        if circuit_breaker is not None and metrics is not None:
+            metrics.add_circuit_breaker(circuit_breaker)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        
+        pool_size = max_connections or max_concurrency
+        headers = {"Accept": "application/json"}
+        auth = None
+        
+        # Set up authentication headers
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        elif username and password:
+            auth = (username, password)
+        
+        self.session = httpx.AsyncClient(
+            headers=headers,
+            auth=auth,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=pool_size,
+                                max_keepalive_connections=pool_size)
+        )
+
+    async def __aenter__(self) -> "AsyncVintraceAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the shared connection pool"""
+        await self.session.aclose()
+
+    async def _send(self, method: str, path: str, attempt: int = 0, **kwargs) -> "httpx.Response":
+        """Send one request once a concurrency slot (and rate limit token) is free"""
+        url = f"{self.base_url}{path}"
+        circuit = self.circuit_breaker.key(self.base_url, method, path) if self.circuit_breaker else None
+        if circuit is not None:
+            self.circuit_breaker.before_request(circuit)
+        queued = sent = time.perf_counter()
+        response = None
+        error = None
+        try:
+            if self.rate_limiter:
+                async with self.rate_limiter.slot_async():
+                    async with self._semaphore:
+                        sent = time.perf_counter()
+                        response = await self.session.request(method, url, **kwargs)
+                self.rate_limiter.observe(response.status_code, response.headers)
+                return response
+            async with self._semaphore:
+                sent = time.perf_counter()
+                response = await self.session.request(method, url, **kwargs)
+                return response
+        except httpx.RequestError as e:
+            error = type(e).__name__
+            raise
+        finally:
+            if circuit is not None:
+                self.circuit_breaker.record(circuit, response is not None and response.status_code < 500)
+            if self.metrics is not None:
+                self.metrics.record(method, path, response.status_code if response is not None else None,
+                                    time.perf_counter() - sent,
+                                    len(response.content) if response is not None else 0,
+                                    attempt, sent - queued, error)
+
+    async def _request(self, method: str, path: str, response_type: Optional[str] = None,
+                       **kwargs) -> Dict[str, Any]:
+        """Make an HTTP request; GETs are coalesced and cached when configured"""
+        if method != "GET":
+            result = await self._request_with_retry(method, path, response_type, **kwargs)
+            if self.coalescer is not None:
+                self.coalescer.clear()  # a write may change anything memoized
+            return result
+        if self.coalescer is not None:
+            return await self.coalescer.fetch_async(method, path, kwargs.get("params"),
+                                                    lambda: self._get(path, response_type, **kwargs),
+                                                    self.base_url)
+        return await self._get(path, response_type, **kwargs)
+
+    async def _get(self, path: str, response_type: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """GET a resource, serving it from the response cache when configured"""
+        if self.cache is not None:
+            # The cache stores plain JSON; typed decoding happens on the way out
+            value = await self.cache.fetch_async("GET", path, kwargs.get("params"),
+                                                 lambda: self._request_with_retry("GET", path, **kwargs),
+                                                 self.base_url)
+            return self.decoder.convert(value, response_type) if self.decoder else value
+        return await self._request_with_retry("GET", path, response_type, **kwargs)
+
+    async def _request_with_retry(self, method: str, path: str, response_type: Optional[str] = None,
+                                  **kwargs) -> Dict[str, Any]:
+        """Make an HTTP request with retry logic, bounded by max_concurrency"""
+        url = f"{self.base_url}{path}"
+        kwargs.setdefault("timeout", self.timeout)
+        
+        for attempt in range(self.max_retries):
+            try:
+                response = await self._send(method, path, attempt, **kwargs)
+                response.raise_for_status()
+                
+                # Handle empty responses
+                if not response.content:
+                    return {}
+                
+                if self.decoder:
+                    return self.decoder.decode(response.content, response_type)
+                return response.json()
+            except httpx.HTTPStatusError as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                # Retry on 429 (honouring Retry-After) and 5xx errors
+                status = e.response.status_code
+                if status == 429 or status >= 500:
+                    self._raise_if_circuit_open(method, path)
+                    await asyncio.sleep(self._retry_delay(e.response, attempt))
+                    continue
+                raise
+            except httpx.RequestError as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                self._raise_if_circuit_open(method, path)
+                await asyncio.sleep(2 ** attempt)
+        
+        raise Exception(f"Failed to {method} {url} after {self.max_retries} attempts")
+
+    def _raise_if_circuit_open(self, method: str, path: str) -> None:
+        """Skip the retry sleep when the failures so far have opened the circuit"""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.raise_if_open(self.circuit_breaker.key(self.base_url, method, path))
+
+    @staticmethod
+    def _retry_delay(response: Any, attempt: int) -> float:
+        """Seconds to wait before a retry: Retry-After if the server sent one, else 2 ** attempt"""
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return retry_after if retry_after is not None else 2 ** attempt
+
+    @staticmethod
+    def _extract_page(response: Any, results_key: str = "results") -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Split a list response into (results, totalResultCount); the total is None if not reported"""
+        if hasattr(response, "__struct_fields__"):
+            # Response decoded with decode="structs"
+            response = {field: getattr(response, field) for field in response.__struct_fields__}
+        if isinstance(response, dict):
+            results = response.get(results_key)
+            if results is None:
+                # Most list endpoints name the array after the entity (parties, products, ...)
+                results = next((v for v in response.values() if isinstance(v, list)), [])
+            total = response.get("totalResultCount")
+        else:
+            results = response if isinstance(response, list) else []
+            total = len(results)
+        return results, total
+
+    async def get_all_pages(self, method_func, parallel: bool = False,
+                            pager: Optional[AdaptivePager] = None, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Fetch all pages from a paginated endpoint
+        
+        In parallel mode the first page is fetched on its own to learn
+        totalResultCount, then every remaining offset is requested at once
+        (bounded by max_concurrency) and the pages are reassembled in order.
+        Endpoints that report no total are fetched in windows of
+        max_concurrency pages until a page comes back short or empty.
+        
+        Args:
+            method_func: The API coroutine to call (e.g., self.list_available_work_orders)
+            parallel: Fetch the remaining pages concurrently (default: False)
+            pager: Tune the page size adaptively; pages are then fetched serially (default: None)
+            **kwargs: Arguments to pass to the method
+        
+        Returns:
+            List of all results from all pages
+        """
+        if pager is not None:
+            return [result async for result in self.iter_results(method_func, pager=pager, **kwargs)]
+        
+        all_results = []
+        first_result = 0
+        max_result = int(kwargs.get("max", 100))
+        
+        while True:
+            kwargs["first"] = str(first_result)
+            kwargs["max"] = str(max_result)
+            
+            response = await method_func(**kwargs)
+            results, total = self._extract_page(response)
+            
+            all_results.extend(results)
+            
+            # Check if there are more pages (without a total, a short page is the last one)
+            if total is None:
+                if len(results) < max_result:
+                    break
+            elif len(all_results) >= total:
+                break
+            
+            first_result += max_result
+            
+            if parallel:
+                if total is not None:
+                    offsets = range(first_result, total, max_result)
+                    responses = await asyncio.gather(
+                        *(method_func(**dict(kwargs, first=str(offset))) for offset in offsets)
+                    )
+                    for page_response in responses:
+                        all_results.extend(self._extract_page(page_response)[0])
+                else:
+                    window_size = self.max_concurrency
+                    last_page = False
+                    while not last_page:
+                        offsets = range(first_result, first_result + window_size * max_result, max_result)
+                        responses = await asyncio.gather(
+                            *(method_func(**dict(kwargs, first=str(offset))) for offset in offsets)
+                        )
+                        for page_response in responses:
+                            page = self._extract_page(page_response)[0]
+                            all_results.extend(page)
+                            if len(page) < max_result:
+                                last_page = True
+                                break
+                        first_result += window_size * max_result
+                break
+        
+        return all_results
+
+    async def iter_pages(self, method_func, prefetch: bool = False,
+                         pager: Optional[AdaptivePager] = None,
+                         **kwargs) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield each page of results from a paginated endpoint as it arrives
+        
+        Only the current page is held in memory. With prefetch enabled the
+        next page is requested as a background task while the caller is
+        still processing the current one. Passing ``first`` starts at that
+        offset, e.g. to resume an interrupted export.
+        
+        With a pager the size of each page is chosen from the throughput of
+        the previous ones, so prefetch is not used.
+        
+        Args:
+            method_func: The API coroutine to call (e.g., self.list_available_work_orders)
+            prefetch: Request the next page while the current one is consumed (default: False)
+            pager: Tune the page size adaptively (default: None, fixed ``max``)
+            **kwargs: Arguments to pass to the method
+        
+        Yields:
+            List of results for each page, in offset order
+        """
+        max_result = int(kwargs.get("max", 100))
+        start = int(kwargs.pop("first", 0))
+        
+        if pager is not None:
+            async def fetch_sized(offset: int, size: int) -> Page:
+                return Page(*self._extract_page(await method_func(**dict(kwargs, first=str(offset), max=str(size)))))
+            
+            async for page in pager.aiter_pages(fetch_sized, start=start):
+                yield page
+            return
+        
+        def fetch_page(offset: int):
+            return method_func(**dict(kwargs, first=str(offset), max=str(max_result)))
+        
+        first_result = start
+        fetched = start
+        pending = None
+        try:
+            while True:
+                response = await (pending if pending else fetch_page(first_result))
+                pending = None
+                results, total = self._extract_page(response)
+                fetched += len(results)
+                first_result += max_result
+                
+                has_more = bool(results) and (fetched < total if total is not None
+                                              else len(results) >= max_result)
+                if has_more and prefetch:
+                    pending = asyncio.ensure_future(fetch_page(first_result))
+                
+                yield results
+                
+                if not has_more:
+                    break
+        finally:
+            if pending:
+                pending.cancel()
+
+    async def iter_results(self, method_func, prefetch: bool = False,
+                           pager: Optional[AdaptivePager] = None,
+                           **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield individual records from a paginated endpoint as pages arrive
+        
+        Args:
+            method_func: The API coroutine to call (e.g., self.list_available_work_orders)
+            prefetch: Request the next page while the current one is consumed (default: False)
+            pager: Tune the page size adaptively (default: None)
+            **kwargs: Arguments to pass to the method
+        
+        Yields:
+            Each result record, in order
+        """
+        async for page in self.iter_pages(method_func, prefetch=prefetch, pager=pager, **kwargs):
+            for result in page:
+                yield result
+
+    # =================================================================
+    # API ENDPOINTS
+    # =================================================================
+'''
+
+
+def generate_async_client_file(spec: Dict[str, Any]) -> str:
+    """Generate the complete async_client.py file"""
+    paths = spec.get('paths', {})
+    
+    lines = []
+    lines.append(generate_async_client_header())
+    
+    # Generate coroutines for each endpoint
+    for path, methods in sorted(paths.items()):
+        for method, operation in methods.items():
+            if method.lower() in ['get', 'post', 'put', 'delete', 'patch']:
+                operation = dict(operation, parameters=resolve_parameters(
+                    path, operation.get('parameters', []), spec))
+                method_code = generate_api_method(path, method.lower(), operation, is_async=True)
+                lines.append(method_code)
+    
+    return '\n'.join(lines)
+
+
 def generate_utilities_file() -> str:
     """Generate utilities.py with helper functions"""
     return '''"""
@@ -405,13 +1162,41 @@ Utility functions for working with Vintrace API
 Provides helper functions for common data fetching and processing tasks.
 """
 
-from typing import List, Dict, Any, Optional
+import logging
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Iterator, Iterable, Tuple, Callable
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import copy
 from datetime import datetime, timedelta
+from itertools import islice
 from .vintrace_api_client import VintraceAPIClient
+from .vintrace_rate_limit import RateLimiter
+from .vintrace_decode import to_builtins
+
+if TYPE_CHECKING:
+    from .vintrace_sync import SyncResult
+
+logger = logging.getLogger(__name__)
+
+# Related resources fetched by get_stock_details: key -> (method, value on failure).
+# Methods are looked up on VintraceDataFetcher first (paged helpers), then on the client.
+STOCK_DETAIL_PARTS = {
+    'fields': ('view_list_of_details_fields', []),
+    'distributions': ('view_distribtutions', []),
+    'history': ('get_stock_history', []),
+    'components': ('view_raw_components', []),
+    'notes': ('view_all_notes', []),
+    'bulk_info': ('view_bulk_product_details', {}),
+}
 
 
 class VintraceDataFetcher:
-    """Helper class for fetching and processing Vintrace data"""
+    """
+    Helper class for fetching and processing Vintrace data
+    
+    Helpers return plain dicts and lists in every decode mode; responses of a
+    decode="structs" client are converted with msgspec.to_builtins.
+    """
     
     def __init__(self, client: VintraceAPIClient):
         """
@@ -421,66 +1206,138 @@ class VintraceDataFetcher:
             client: Configured VintraceAPIClient instance
         """
         self.client = client
+        # Results of the bulk lookups, per lookup kind: key -> record (None if not found)
+        self._lookup_cache: Dict[str, Dict[str, Any]] = {}
     
-    def get_all_work_orders(self, **filters) -> List[Dict[str, Any]]:
+    def get_all_work_orders(self, parallel: bool = False, **filters) -> List[Dict[str, Any]]:
         """
         Fetch all work orders across all pages
         
         Args:
+            parallel: Fetch the pages concurrently (see VintraceAPIClient.get_all_pages)
             **filters: Optional filters (assignedTo, workOrderState, fromDate, toDate, etc.)
         
         Returns:
             List of all work orders
         """
-        return self.client.get_all_pages(self.client.list_available_work_orders, **filters)
+        return to_builtins(self.client.get_all_pages(self.client.list_available_work_orders, parallel=parallel, **filters))
     
-    def get_all_products(self, **filters) -> List[Dict[str, Any]]:
+    def get_all_products(self, parallel: bool = False, **filters) -> List[Dict[str, Any]]:
         """
         Fetch all products across all pages
         
         Args:
+            parallel: Fetch the pages concurrently (see VintraceAPIClient.get_all_pages)
             **filters: Optional filters for products
         
         Returns:
             List of all products
         """
-        return self.client.get_all_pages(self.client.list_available_products, **filters)
+        return to_builtins(self.client.get_all_pages(self.client.list_available_products, parallel=parallel, **filters))
     
-    def get_all_sales_orders(self, **filters) -> List[Dict[str, Any]]:
+    def get_all_sales_orders(self, parallel: bool = False, **filters) -> List[Dict[str, Any]]:
         """
         Fetch all sales orders across all pages
         
         Args:
+            parallel: Fetch the pages concurrently (see VintraceAPIClient.get_all_pages)
             **filters: Optional filters for sales orders
         
         Returns:
             List of all sales orders
         """
-        return self.client.get_all_pages(self.client.list_available_sales_orders, **filters)
+        return to_builtins(self.client.get_all_pages(self.client.list_available_sales_orders, parallel=parallel, **filters))
     
-    def get_all_parties(self, **filters) -> List[Dict[str, Any]]:
+    def get_all_parties(self, parallel: bool = False, **filters) -> List[Dict[str, Any]]:
         """
         Fetch all parties across all pages
         
         Args:
+            parallel: Fetch the pages concurrently (see VintraceAPIClient.get_all_pages)
             **filters: Optional filters for parties
         
         Returns:
             List of all parties
         """
-        return self.client.get_all_pages(self.client.list_parties, **filters)
+        return to_builtins(self.client.get_all_pages(self.client.list_parties, parallel=parallel, **filters))
     
-    def get_all_refunds(self, **filters) -> List[Dict[str, Any]]:
+    def get_all_refunds(self, parallel: bool = False, **filters) -> List[Dict[str, Any]]:
         """
         Fetch all refunds across all pages
         
         Args:
+            parallel: Fetch the pages concurrently (see VintraceAPIClient.get_all_pages)
             **filters: Optional filters for refunds
         
         Returns:
             List of all refunds
         """
-        return self.client.get_all_pages(self.client.list_available_refunds, **filters)
+        return to_builtins(self.client.get_all_pages(self.client.list_available_refunds, parallel=parallel, **filters))
+    
+    def iter_work_orders(self, prefetch: bool = True, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Stream work orders page by page instead of building one list
+        
+        Args:
+            prefetch: Request the next page while the current one is consumed (default: True)
+            **filters: Optional filters (assignedTo, workOrderState, fromDate, toDate, etc.)
+        
+        Yields:
+            Each work order
+        """
+        return map(to_builtins, self.client.iter_results(self.client.list_available_work_orders, prefetch=prefetch, **filters))
+    
+    def iter_products(self, prefetch: bool = True, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Stream products page by page instead of building one list
+        
+        Args:
+            prefetch: Request the next page while the current one is consumed (default: True)
+            **filters: Optional filters for products
+        
+        Yields:
+            Each product
+        """
+        return map(to_builtins, self.client.iter_results(self.client.list_available_products, prefetch=prefetch, **filters))
+    
+    def iter_sales_orders(self, prefetch: bool = True, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Stream sales orders page by page instead of building one list
+        
+        Args:
+            prefetch: Request the next page while the current one is consumed (default: True)
+            **filters: Optional filters for sales orders
+        
+        Yields:
+            Each sales order
+        """
+        return map(to_builtins, self.client.iter_results(self.client.list_available_sales_orders, prefetch=prefetch, **filters))
+    
+    def iter_parties(self, prefetch: bool = True, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Stream parties page by page instead of building one list
+        
+        Args:
+            prefetch: Request the next page while the current one is consumed (default: True)
+            **filters: Optional filters for parties
+        
+        Yields:
+            Each party
+        """
+        return map(to_builtins, self.client.iter_results(self.client.list_parties, prefetch=prefetch, **filters))
+    
+    def iter_refunds(self, prefetch: bool = True, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Stream refunds page by page instead of building one list
+        
+        Args:
+            prefetch: Request the next page while the current one is consumed (default: True)
+            **filters: Optional filters for refunds
+        
+        Yields:
+            Each refund
+        """
+        return map(to_builtins, self.client.iter_results(self.client.list_available_refunds, prefetch=prefetch, **filters))
     
     def get_recent_work_orders(self, days: int = 7) -> List[Dict[str, Any]]:
         """
@@ -507,52 +1364,221 @@ class VintraceDataFetcher:
         Returns:
             List of matching transactions
         """
-        return self.client.get_all_pages(self.client.transaction_search, **criteria)
+        return to_builtins(self.client.get_all_pages(self.client.transaction_search, **criteria))
+    
+    def search_transactions_sharded(self, date_from: str, date_to: str, chunk_days: int = 7,
+                                    max_workers: int = 4, **filters) -> List[Dict[str, Any]]:
+        """
+        Search transactions over a long period as concurrent date shards
+        
+        transaction_search has no pagination, so the range is split into
+        chunks of chunk_days that are fetched (and retried) independently, then
+        merged with de-duplication on Op Id / Tx Id.
+        
+        Args:
+            date_from: First day in YYYY-MM-DD format
+            date_to: Last day in YYYY-MM-DD format
+            chunk_days: Days per shard (default: 7)
+            max_workers: Shards fetched at once (default: 4)
+            **filters: Optional filters (ownerName, batchName, wineryName)
+        
+        Returns:
+            List of matching transactions in date order
+        """
+        from .vintrace_transaction_cache import fetch_transactions_sharded
+        
+        return fetch_transactions_sharded(self.client, date_from, date_to, chunk_days=chunk_days,
+                                          max_workers=max_workers, **filters)
+    
+    def _submit_stock_details(self, executor: ThreadPoolExecutor, stock_id: str) -> Dict[str, Future]:
+        """Schedule the stock item request and all related-data requests for one ID"""
+        futures = {'stock': executor.submit(self.client.view_a_single_stock_item, id=stock_id)}
+        for key, (method_name, _) in STOCK_DETAIL_PARTS.items():
+            method_func = getattr(self, method_name, None) or getattr(self.client, method_name)
+            futures[key] = executor.submit(method_func, id=stock_id)
+        return futures
+    
+    @staticmethod
+    def _collect_stock_details(futures: Dict[str, Future]) -> Dict[str, Any]:
+        """Assemble the results of _submit_stock_details (related data is best effort)"""
+        # A new dict: the stock item itself may be shared (coalesced/cached) with other callers
+        details = dict(to_builtins(futures['stock'].result()))
+        for key, (_, default) in STOCK_DETAIL_PARTS.items():
+            try:
+                details[key] = to_builtins(futures[key].result())
+            except Exception as e:
+                logger.warning(f"Stock item {details.get('id')}: could not fetch {key} ({e}); using {default!r}")
+                details[key] = copy(default)
+        return details
+    
+    def get_stock_history(self, id: str, page_size: int = 100) -> Dict[str, Any]:
+        """
+        Get every history item of a stock item
+        
+        view_history_items is paginated; this pages through it and returns
+        the first page's response with all historyItems.
+        
+        Args:
+            id: The stock item ID
+            page_size: maxResult per request (default: 100)
+        
+        Returns:
+            StockHistoryItemsDetail dictionary with the complete historyItems list
+        """
+        response = to_builtins(self.client.view_history_items(id=id, firstResult=0, maxResult=page_size))
+        items, total = self.client._extract_page(response, 'historyItems')
+        items = list(items or [])
+        page = items
+        while len(page) >= page_size and (total is None or len(items) < total):
+            page_response = self.client.view_history_items(id=id, firstResult=len(items), maxResult=page_size)
+            page = to_builtins(self.client._extract_page(page_response, 'historyItems')[0] or [])
+            items.extend(page)
+        return dict(response, historyItems=items)
     
     def get_stock_details(self, stock_id: str) -> Dict[str, Any]:
         """
         Get complete stock details including all related information
         
+        The stock item and its six related resources are requested concurrently.
+        
         Args:
             stock_id: The stock item ID
         
         Returns:
             Dictionary with complete stock information
         """
-        stock = self.client.view_a_single_stock_item(id=stock_id)
+        with ThreadPoolExecutor(max_workers=len(STOCK_DETAIL_PARTS) + 1) as executor:
+            return self._collect_stock_details(self._submit_stock_details(executor, stock_id))
+    
+    def get_stock_details_many(self, stock_ids: Iterable[str],
+                               max_workers: int = 8) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream complete stock details for many stock items
         
-        # Fetch related data
-        try:
-            stock['fields'] = self.client.view_list_of_details_fields(id=stock_id)
-        except:
-            stock['fields'] = []
+        IDs are de-duplicated and fed through one bounded thread pool; only
+        max_workers stock items are in flight at a time, so memory stays flat
+        for thousands of IDs. Results are yielded in input order as soon as
+        each item is complete.
         
-        try:
-            stock['distributions'] = self.client.view_distribtutions(id=stock_id)
-        except:
-            stock['distributions'] = []
+        Args:
+            stock_ids: Stock item IDs (duplicates are skipped)
+            max_workers: Worker threads shared by all sub-requests (default: 8)
         
-        try:
-            stock['history'] = self.client.view_history_items(id=stock_id)
-        except:
-            stock['history'] = []
+        Yields:
+            (stock_id, details) tuples; details is {'id': ..., 'error': ...} if the
+            stock item itself could not be fetched
+        """
+        remaining = iter(dict.fromkeys(str(stock_id) for stock_id in stock_ids))
         
-        try:
-            stock['components'] = self.client.view_raw_components(id=stock_id)
-        except:
-            stock['components'] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque(
+                (stock_id, self._submit_stock_details(executor, stock_id))
+                for stock_id in islice(remaining, max_workers)
+            )
+            while pending:
+                stock_id, futures = pending.popleft()
+                try:
+                    details = self._collect_stock_details(futures)
+                except Exception as e:
+                    details = {'id': stock_id, 'error': str(e)}
+                
+                next_id = next(remaining, None)
+                if next_id is not None:
+                    pending.append((next_id, self._submit_stock_details(executor, next_id)))
+                
+                yield stock_id, details
+    
+    def _lookup_many(self, kind: str, keys: Iterable[Any], fetch_one: Callable[[str], Any],
+                     max_workers: int) -> Dict[str, Any]:
+        """
+        Resolve many lookup keys through the fetcher's cache and one thread pool
         
-        try:
-            stock['notes'] = self.client.view_all_notes(id=stock_id)
-        except:
-            stock['notes'] = []
+        Keys are de-duplicated; keys this fetcher has already resolved are served
+        from memory and only the misses are requested, concurrently.
         
-        try:
-            stock['bulk_info'] = self.client.view_bulk_product_details(id=stock_id)
-        except:
-            stock['bulk_info'] = {}
+        Returns:
+            key -> record, None if the API answered 404, or {'key': ..., 'error': ...}
+            if the lookup failed (failures are not cached)
+        """
+        unique = list(dict.fromkeys(str(key) for key in keys if key is not None))
+        cache = self._lookup_cache.setdefault(kind, {})
+        misses = [key for key in unique if key not in cache]
+        
+        def fetch(key: str) -> Tuple[Any, bool]:
+            try:
+                return to_builtins(fetch_one(key)), True
+            except Exception as e:
+                if getattr(getattr(e, 'response', None), 'status_code', None) == 404:
+                    return None, True
+                return {'key': key, 'error': str(e)}, False
+        
+        results = {}
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(misses))) as executor:
+                for key, (value, cacheable) in zip(misses, executor.map(fetch, misses)):
+                    results[key] = value
+                    if cacheable:
+                        cache[key] = value
+        return {key: results[key] if key in results else cache[key] for key in unique}
+    
+    def get_stock_items_many(self, keys: Iterable[Any], by: str = 'code',
+                             max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Look up many stock items by code or id
+        
+        Args:
+            keys: Stock item codes or IDs (duplicates and None are skipped)
+            by: 'code' or 'id' (default: 'code')
+            max_workers: Concurrent requests (default: 8)
+        
+        Returns:
+            Mapping of key -> stock item details (see _lookup_many)
+        """
+        if by not in ('code', 'id'):
+            raise ValueError("by must be 'code' or 'id'")
+        return self._lookup_many(f'stock:{by}', keys,
+                                 lambda key: self.client.get_stock_item_by_code_or_id(**{by: key}),
+                                 max_workers)
+    
+    def get_parties_many(self, names: Iterable[Any], max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Look up many parties by name
         
-        return stock
+        Args:
+            names: Party prime names (duplicates and None are skipped)
+            max_workers: Concurrent requests (default: 8)
+        
+        Returns:
+            Mapping of name -> party (see _lookup_many)
+        """
+        return self._lookup_many('party:name', names,
+                                 lambda name: self.client.get_party_details_by_name(name=name),
+                                 max_workers)
+    
+    def get_products_many(self, keys: Iterable[Any], by: str = 'id',
+                          max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Look up many products by id or barcode
+        
+        Args:
+            keys: Product IDs or barcodes (vessel code or asset ID)
+            by: 'id' (product_search) or 'barcode' (products list filtered by barcode)
+            max_workers: Concurrent requests (default: 8)
+        
+        Returns:
+            Mapping of key -> product (see _lookup_many)
+        """
+        if by not in ('id', 'barcode'):
+            raise ValueError("by must be 'id' or 'barcode'")
+        
+        def fetch_one(key: str) -> Optional[Dict[str, Any]]:
+            if by == 'id':
+                return self.client.product_search(id=key)
+            response = self.client.list_available_products(barcode=key)
+            products = self.client._extract_page(response, 'products')[0] or []
+            return products[0] if products else None
+        
+        return self._lookup_many(f'product:{by}', keys, fetch_one, max_workers)
     
     def get_inventory_summary(self, **filters) -> Dict[str, Any]:
         """
@@ -564,7 +1590,7 @@ class VintraceDataFetcher:
         Returns:
             Inventory summary data
         """
-        return self.client.list_available_stock(**filters)
+        return to_builtins(self.client.list_available_stock(**filters))
     
     def search_intake_operations(self, **criteria) -> List[Dict[str, Any]]:
         """
@@ -576,7 +1602,9 @@ class VintraceDataFetcher:
         Returns:
             List of matching intake operations
         """
-        return self.client.get_all_pages(self.client.fruit_intake_operation_search, **criteria)
+        from .vintrace_sync import iter_search_results
+        
+        return list(iter_search_results(self.client.fruit_intake_operation_search, "intakes", **criteria))
     
     def search_sample_operations(self, **criteria) -> List[Dict[str, Any]]:
         """
@@ -588,7 +1616,43 @@ class VintraceDataFetcher:
         Returns:
             List of matching sample operations
         """
-        return self.client.get_all_pages(self.client.maturity_samples_search, **criteria)
+        from .vintrace_sync import iter_search_results
+        
+        return list(iter_search_results(self.client.maturity_samples_search, "samples", **criteria))
+    
+    def sync_intake_operations(self, data_dir: str = ".vintrace_cache/sync", **criteria) -> 'SyncResult':
+        """
+        Incrementally sync fruit intake operations into a local dataset
+        
+        Only intakes modified since the last run's high-water mark are fetched.
+        
+        Args:
+            data_dir: Directory holding the dataset and checkpoints
+            **criteria: Search criteria (vintage, wineryId, ...)
+        
+        Returns:
+            SyncResult with counts and high-water marks
+        """
+        from .vintrace_sync import IncrementalSync
+        
+        return IncrementalSync(self.client, data_dir).sync("intake_operations", **criteria)
+    
+    def sync_sample_operations(self, data_dir: str = ".vintrace_cache/sync", **criteria) -> 'SyncResult':
+        """
+        Incrementally sync maturity samples into a local dataset
+        
+        Only samples modified since the last run's high-water mark are fetched.
+        
+        Args:
+            data_dir: Directory holding the dataset and checkpoints
+            **criteria: Search criteria (vintage, blockId, ...)
+        
+        Returns:
+            SyncResult with counts and high-water marks
+        """
+        from .vintrace_sync import IncrementalSync
+        
+        return IncrementalSync(self.client, data_dir).sync("sample_operations", **criteria)
 
 
 def create_client_from_env() -> VintraceAPIClient:
@@ -600,6 +1664,16 @@ def create_client_from_env() -> VintraceAPIClient:
         VINTRACE_API_KEY: API key (optional)
         VINTRACE_USERNAME: Username for basic auth (optional)
         VINTRACE_PASSWORD: Password for basic auth (optional)
+        VINTRACE_RATE_LIMIT: Requests per second for a shared RateLimiter (optional)
+        VINTRACE_CACHE_DIR: Directory for the on-disk ResponseCache (optional)
+        VINTRACE_DECODE: Response decoding, "json", "orjson" or "structs" (optional)
+        VINTRACE_METRICS_LOG: JSON-lines file receiving one event per request (optional)
+        VINTRACE_MEMO_TTL: Enables a RequestCoalescer memoizing identical GETs for this
+            many seconds; 0 only coalesces in-flight duplicates (optional, default: off)
+        VINTRACE_CIRCUIT_THRESHOLD: Enables a CircuitBreaker opening an endpoint's circuit
+            after this many consecutive failures (optional, default: 0, off)
+        VINTRACE_CIRCUIT_RECOVERY: Seconds an open circuit fails fast before probing
+            (optional, default: 30)
     
     Returns:
         Configured VintraceAPIClient instance
@@ -616,16 +1690,119 @@ def create_client_from_env() -> VintraceAPIClient:
     api_key = os.getenv('VINTRACE_API_KEY')
     username = os.getenv('VINTRACE_USERNAME')
     password = os.getenv('VINTRACE_PASSWORD')
+    rate_limit = os.getenv('VINTRACE_RATE_LIMIT')
+    cache_dir = os.getenv('VINTRACE_CACHE_DIR')
+    decode = os.getenv('VINTRACE_DECODE', 'json')
+    metrics_log = os.getenv('VINTRACE_METRICS_LOG')
+    memo_ttl = os.getenv('VINTRACE_MEMO_TTL')
+    circuit_threshold = int(os.getenv('VINTRACE_CIRCUIT_THRESHOLD', '0'))
+    circuit_recovery = float(os.getenv('VINTRACE_CIRCUIT_RECOVERY', '30'))
+    
+    # Optional collaborators are only imported when their variable is set
+    metrics = None
+    if metrics_log:
+        from .vintrace_metrics import MetricsRecorder, JSONLinesExporter
+        metrics = MetricsRecorder()
+        metrics.add_listener(JSONLinesExporter(metrics_log))
+    
+    cache = None
+    if cache_dir:
+        from .vintrace_cache import ResponseCache
+        cache = ResponseCache(cache_dir)
+    
+    coalescer = None
+    if memo_ttl:
+        from .vintrace_coalesce import RequestCoalescer
+        coalescer = RequestCoalescer(memo_ttl=float(memo_ttl))
+    
+    circuit_breaker = None
+    if circuit_threshold > 0:
+        from .vintrace_circuit_breaker import CircuitBreaker
+        circuit_breaker = CircuitBreaker(failure_threshold=circuit_threshold,
+                                         recovery_timeout=circuit_recovery)
     
     return VintraceAPIClient(
         base_url=base_url,
         api_key=api_key,
         username=username,
-        password=password
+        password=password,
+        rate_limiter=RateLimiter(rate=float(rate_limit)) if rate_limit else None,
+        cache=cache,
+        decode=decode,
+        metrics=metrics,
+        coalescer=coalescer,
+        circuit_breaker=circuit_breaker
     )
 '''
 
 
+def generate_init_file(spec: Dict[str, Any]) -> str:
+    """
+    Generate __init__.py with a lazy registry of models
+    
+    Importing the ~100 pydantic models costs more than the rest of the package
+    together, and most scripts only use raw dict responses. Models (and the
+    httpx-based async client) are therefore resolved on first attribute
+    access through a module-level __getattr__ (PEP 562).
+    """
+    schema_names = sorted(spec.get('components', {}).get('schemas', {}).keys())
+    
+    lines = []
+    lines.append('"""')
+    lines.append('Vintrace V6 API Client Package')
+    lines.append('')
+    lines.append('Provides Python client for Vintrace V6 REST API.')
+    lines.append('')
+    lines.append('Pydantic models, AsyncVintraceAPIClient and the optional helpers (cache,')
+    lines.append('coalescer, metrics, pager, sync, ...) are imported lazily on first access')
+    lines.append('(e.g. ``from API import WorkOrder``), so scripts that only use raw dict')
+    lines.append('responses do not pay their import cost.')
+    lines.append('"""')
+    lines.append('')
+    lines.append('import importlib')
+    lines.append('')
+    lines.append('from .vintrace_api_client import VintraceAPIClient')
+    lines.append('from .vintrace_rate_limit import RateLimiter')
+    lines.append('from .vintrace_api_utils import VintraceDataFetcher, create_client_from_env')
+    lines.append('')
+    lines.append('# Attribute name -> submodule that defines it (imported on first access)')
+    lines.append('_LAZY_ATTRS = {')
+    lines.append("    'AsyncVintraceAPIClient': '.vintrace_async_client',")
+    lines.append("    'ResponseCache': '.vintrace_cache',")
+    lines.append("    'RequestCoalescer': '.vintrace_coalesce',")
+    lines.append("    'CircuitBreaker': '.vintrace_circuit_breaker',")
+    lines.append("    'CircuitOpenError': '.vintrace_circuit_breaker',")
+    lines.append("    'MetricsRecorder': '.vintrace_metrics',")
+    lines.append("    'JSONLinesExporter': '.vintrace_metrics',")
+    lines.append("    'AdaptivePager': '.vintrace_pager',")
+    lines.append("    'PageSizeStore': '.vintrace_pager',")
+    lines.append("    'TransactionDayCache': '.vintrace_transaction_cache',")
+    lines.append("    'IncrementalSync': '.vintrace_sync',")
+    for name in schema_names:
+        lines.append(f"    '{name}': '.vintrace_models',")
+    lines.append('}')
+    lines.append('')
+    lines.append("__all__ = ['VintraceAPIClient', 'AsyncVintraceAPIClient', 'RateLimiter', 'ResponseCache', 'TransactionDayCache',")
+    lines.append("           'IncrementalSync', 'MetricsRecorder', 'JSONLinesExporter', 'RequestCoalescer',")
+    lines.append("           'AdaptivePager', 'PageSizeStore', 'CircuitBreaker', 'CircuitOpenError',")
+    lines.append("           'VintraceDataFetcher', 'create_client_from_env']")
+    lines.append('')
+    lines.append('')
+    lines.append('def __getattr__(name):')
+    lines.append('    module_name = _LAZY_ATTRS.get(name)')
+    lines.append('    if module_name is None:')
+    lines.append('        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")')
+    lines.append('    value = getattr(importlib.import_module(module_name, __name__), name)')
+    lines.append('    globals()[name] = value  # cache so __getattr__ is not hit again')
+    lines.append('    return value')
+    lines.append('')
+    lines.append('')
+    lines.append('def __dir__():')
+    lines.append('    return sorted(set(globals()) | set(_LAZY_ATTRS))')
+    lines.append('')
+    return '\n'.join(lines)
+
+
 def main():
     """Main function to generate all files"""
     # Load the OpenAPI spec
@@ -641,6 +1818,13 @@ def main():
         f.write(models_code)
     print(f"✓ Generated {models_path}")
     
+    print("\nGenerating msgspec structs...")
+    structs_code = generate_structs_file(spec)
+    structs_path = Path(__file__).parent / 'vintrace_structs.py'
+    with open(structs_path, 'w') as f:
+        f.write(structs_code)
+    print(f"✓ Generated {structs_path}")
+    
     print("\nGenerating API client...")
     client_code = generate_api_client_file(spec)
     client_path = Path(__file__).parent / 'vintrace_api_client.py'
@@ -648,6 +1832,13 @@ def main():
         f.write(client_code)
     print(f"✓ Generated {client_path}")
     
+    print("\nGenerating async API client...")
+    async_client_code = generate_async_client_file(spec)
+    async_client_path = Path(__file__).parent / 'vintrace_async_client.py'
+    with open(async_client_path, 'w') as f:
+        f.write(async_client_code)
+    print(f"✓ Generated {async_client_path}")
+    
     print("\nGenerating utilities...")
     utils_code = generate_utilities_file()
     utils_path = Path(__file__).parent / 'vintrace_api_utils.py'
@@ -656,18 +1847,7 @@ def main():
     print(f"✓ Generated {utils_path}")
     
     # Create __init__.py for easy imports
-    init_code = '''"""
-Vintrace V6 API Client Package
-
-Provides Python client for Vintrace V6 REST API.
-"""
-
-from .vintrace_api_client import VintraceAPIClient
-from .vintrace_api_utils import VintraceDataFetcher, create_client_from_env
-from .vintrace_models import *
-
-__all__ = ['VintraceAPIClient', 'VintraceDataFetcher', 'create_client_from_env']
-'''
+    init_code = generate_init_file(spec)
     init_path = Path(__file__).parent / '__init__.py'
     with open(init_path, 'w') as f:
         f.write(init_code)
@@ -680,7 +1860,9 @@ __all__ = ['VintraceAPIClient', 'VintraceDataFetcher', 'create_client_from_env']
     print(f"Generated {len(spec.get('paths', {}))} API endpoint methods")
     print("\nFiles created:")
     print(f"  - {models_path}")
+    print(f"  - {structs_path}")
     print(f"  - {client_path}")
+    print(f"  - {async_client_path}")
     print(f"  - {utils_path}")
     print(f"  - {init_path}")
 
@@ -0,0 +1,639 @@
+"""
+Local stand-in for the Vintrace API
+
+Serves every endpoint in vintrace-v6-apis.yaml plus the v7 routes used by
+fetch_Vessels.py and fetch_workorders_v7.py, so pagination, retry and
+concurrency changes can be benchmarked and regression-tested without touching
+production. Responses are synthetic records built from the spec schemas with a
+seeded generator (the same seed always produces the same data) or recorded
+fixtures. Latency, page size limits and 429/5xx injection are configurable.
+
+    python -m API.mock_server --port 8800 --total 5000 --latency 0.05 --error-rate 0.02
+
+    client = VintraceAPIClient("http://127.0.0.1:8800/vinx2/api/v6")
+    BASE_VINTRACE_URL=http://127.0.0.1:8800 VINTRACE_API_TOKEN=x python fetch_Vessels.py
+
+In-process, e.g. from a benchmark:
+
+    with MockVintraceServer(MockConfig(total=2000, throttle_rate=0.05)) as server:
+        client = VintraceAPIClient(server.v6_url)
+        client.get_all_pages(client.list_available_work_orders)
+        print(server.stats())
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import yaml
+
+SPEC_PATH = Path(__file__).parent / "vintrace-v6-apis.yaml"
+V6_PREFIX = "/vinx2/api/v6"
+STATS_PATH = "/__mock__/stats"
+
+# Synthetic timestamps count up from here (2023-11-14T22:13:20Z)
+BASE_EPOCH_MS = 1_700_000_000_000
+MAX_DEPTH = 2
+
+# Paging parameter spellings used across v6 and v7
+OFFSET_PARAMS = ("first", "firstResult", "offset")
+LIMIT_PARAMS = ("max", "maxResult", "maxResults", "limit")
+ID_FIELDS = ("id", "operationId")
+
+VESSEL_TYPES = ("TANK", "BARREL_GROUP", "BARREL", "BIN")
+VARIETIES = (("CS", "Cabernet Sauvignon"), ("ME", "Merlot"), ("CH", "Chardonnay"),
+             ("SY", "Syrah"), ("RI", "Riesling"))
+REGIONS = (("CV", "Columbia Valley"), ("HH", "Horse Heaven Hills"), ("WW", "Walla Walla"))
+
+
+class MockConfig:
+    """Behaviour of the stand-in server"""
+
+    def __init__(self, seed: int = 42, total: int = 1000, latency: float = 0.0,
+                 latency_per_item: float = 0.0, jitter: float = 0.0,
+                 max_page_size: int = 1000, default_page_size: int = 20,
+                 throttle_rate: float = 0.0, error_rate: float = 0.0, retry_after: float = 1.0,
+                 transactions_per_day: int = 5, revision: int = 0,
+                 fixtures: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            seed: Seed for the synthetic data and the error injection (default: 42)
+            total: Records in every list endpoint (default: 1000)
+            latency: Base seconds added to every response (default: 0)
+            latency_per_item: Extra seconds per record returned, to model payload cost (default: 0)
+            jitter: Up to this many random extra seconds per response (default: 0)
+            max_page_size: Largest page the server returns whatever was asked (default: 1000)
+            default_page_size: Page size when the request sets none (default: 20)
+            throttle_rate: Fraction of requests answered with 429 + Retry-After (default: 0)
+            error_rate: Fraction of requests answered with a 5xx (default: 0)
+            retry_after: Retry-After seconds sent with 429s (default: 1)
+            transactions_per_day: transaction_search rows per day (default: 5)
+            revision: Bump to change ~10% of vessels per step, for snapshot diffs (default: 0)
+            fixtures: Route path -> recorded JSON; a list is served paged, anything else verbatim
+        """
+        self.seed = seed
+        self.total = total
+        self.latency = latency
+        self.latency_per_item = latency_per_item
+        self.jitter = jitter
+        self.max_page_size = max_page_size
+        self.default_page_size = default_page_size
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.transactions_per_day = transactions_per_day
+        self.revision = revision
+        self.fixtures = dict(fixtures or {})
+
+
+class SyntheticData:
+    """Deterministic records shaped like the spec schemas and the v7 payloads"""
+
+    def __init__(self, schemas: Dict[str, Any], seed: int = 42, revision: int = 0):
+        self.schemas = schemas
+        self.seed = seed
+        self.revision = revision
+
+    def _rng(self, *key: Any) -> random.Random:
+        return random.Random(":".join(str(k) for k in (self.seed,) + key))
+
+    def resolve(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Follow $ref until a concrete schema is reached"""
+        while "$ref" in schema:
+            schema = self.schemas.get(schema["$ref"].split("/")[-1], {})
+        return schema
+
+    def properties(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Properties of a schema, including allOf parts and the first oneOf option"""
+        schema = self.resolve(schema)
+        props = dict(schema.get("properties", {}))
+        for part in schema.get("allOf", []) + schema.get("oneOf", [])[:1]:
+            props.update(self.properties(part))
+        return props
+
+    # -----------------------------------------------------------------
+    # v6: records built from the OpenAPI schemas
+    # -----------------------------------------------------------------
+
+    def build(self, schema_name: str, index: int, depth: int = 0) -> Dict[str, Any]:
+        """Build record number `index` of a schema"""
+        rng = self._rng(schema_name, index)
+        schema = self.schemas.get(schema_name, {})
+        return {prop: self._value(prop, prop_schema, index, rng, depth)
+                for prop, prop_schema in self.properties(schema).items()}
+
+    def _value(self, prop: str, schema: Dict[str, Any], index: int, rng: random.Random, depth: int) -> Any:
+        if "$ref" in schema:
+            if depth >= MAX_DEPTH:
+                return None
+            return self.build(schema["$ref"].split("/")[-1], rng.randrange(1000), depth + 1)
+
+        kind = schema.get("type")
+        lowered = prop.lower()
+        if kind == "integer":
+            if prop in ID_FIELDS and depth == 0:
+                return index + 1
+            if lowered == "modified" or "date" in lowered or prop.endswith(("Start", "End")):
+                return BASE_EPOCH_MS + index * 60_000
+            if lowered == "vintage":
+                return 2020 + rng.randrange(6)
+            return rng.randrange(1, 100_000)
+        if kind == "number":
+            return round(rng.uniform(0, 1000), 2)
+        if kind == "boolean":
+            return rng.random() < 0.5
+        if kind == "string":
+            if schema.get("format") in ("date", "date-time") or "date" in lowered:
+                day = datetime.fromtimestamp(BASE_EPOCH_MS / 1000, timezone.utc).date() + timedelta(days=index % 3650)
+                return day.isoformat()
+            if "example" in schema and rng.random() < 0.5:
+                # Some specs give numeric examples for string properties (e.g. bay, externalCode)
+                example = schema["example"]
+                if isinstance(example, str):
+                    return example
+                if isinstance(example, (int, float)) and not isinstance(example, bool):
+                    return str(example)
+            return f"{prop}-{index}"
+        if kind == "array":
+            if depth >= MAX_DEPTH:
+                return []
+            items = schema.get("items", {})
+            return [self._value(prop, items, rng.randrange(1000), rng, depth + 1) for _ in range(rng.randint(0, 2))]
+        if kind == "object":
+            return {}
+        return schema.get("example")
+
+    def transactions(self, day: date, count: int) -> List[Dict[str, Any]]:
+        """transaction_search rows for one day"""
+        day_ms = int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp() * 1000)
+        rows = []
+        for k in range(count):
+            row = self.build("TransOperation", day.toordinal() * 1000 + k)
+            row.update({"date": day_ms, "formattedDate": day.isoformat(),
+                        "operationId": day.toordinal() * 1000 + k})
+            rows.append(row)
+        return rows
+
+    # -----------------------------------------------------------------
+    # v7: vessel details report, barrel groups, work orders
+    # -----------------------------------------------------------------
+
+    def vessel(self, index: int, extra_fields: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        """One vessel-details-report row; extra_fields as in the extraFields parameter"""
+        rng = self._rng("vessel", index)
+        vessel_id = index + 1
+        changed = [r for r in range(1, self.revision + 1) if (index + r) % 10 == 0]
+        if changed:
+            rng = self._rng("vessel", index, "revision", changed[-1])
+        capacity = rng.choice((60, 265, 1320, 5280))
+        volume = round(capacity * rng.uniform(0.2, 1.0), 1)
+        variety_code, variety_name = rng.choice(VARIETIES)
+        region_code, region_name = rng.choice(REGIONS)
+        vintage = 2020 + rng.randrange(6)
+        vessel = {
+            "id": vessel_id,
+            "productId": 100_000 + vessel_id,
+            "name": f"V{vessel_id:05d}",
+            "description": f"{variety_name} {vintage}",
+            "vesselType": VESSEL_TYPES[index % len(VESSEL_TYPES)],
+            "detailsAsAt": BASE_EPOCH_MS + index * 60_000 + (changed[-1] * 3_600_000 if changed else 0),
+            "winery": {"id": 1, "name": "Canoe Ridge", "businessUnit": "Estate"},
+            "wineBatch": {
+                "id": 50_000 + rng.randrange(5000), "name": f"{vintage}{variety_code}{rng.randrange(100):02d}",
+                "description": f"{vintage} {variety_name}", "vintage": vintage, "program": "Reserve",
+                "designatedSubRegion": None, "productCategory": "Wine", "designatedProduct": None,
+                "grading": {"scaleName": "Quality", "valueName": rng.choice("ABC")},
+                "designatedVariety": {"id": VARIETIES.index((variety_code, variety_name)) + 1,
+                                      "code": variety_code, "name": variety_name},
+                "designatedRegion": {"id": REGIONS.index((region_code, region_name)) + 1,
+                                     "code": region_code, "name": region_name},
+            },
+            "productState": {"id": 3, "name": "Wine", "expectedLossesPercentage": 2.0},
+            "volume": {"value": volume, "unit": "gal"},
+            "capacity": {"value": capacity, "unit": "gal"},
+            "ullage": {"value": round(capacity - volume, 1), "unit": "gal"},
+            "unallocatedVolume": {"value": volume, "unit": "gal"},
+            "unallocatedPercentageOfVessel": 100.0,
+            "ttbDetails": {
+                "bond": {"id": 1, "name": "BW-WA-1"}, "taxState": "BONDED",
+                "taxClass": {"id": 2, "name": "Table", "federalName": "Not over 16%",
+                             "stateName": "Table wine"} if rng.random() < 0.8 else None,
+                "alcoholPercentage": round(rng.uniform(11.5, 15.5), 1),
+            },
+            "cost": {key: round(rng.uniform(0, 5000), 2) for key in
+                     ("total", "fruit", "overhead", "storage", "additive", "bulk",
+                      "packaging", "operation", "freight", "other")},
+            "beverageType": {"id": 1, "name": "Wine"},
+            "owner": {"id": 1, "name": "Canoe Ridge Vineyards", "extId": "CRV"},
+            "sparklingInfo": {"state": "STILL"},
+        }
+        if "composition" in extra_fields:
+            parts = rng.randint(1, 3)
+            vessel["composition"] = [{
+                "weighting": round(1 / parts, 4), "percentage": round(100 / parts, 2),
+                "componentVolume": {"value": round(volume / parts, 1), "unit": "gal"},
+                "vintage": vintage,
+                "block": {"id": rng.randrange(1, 400), "name": f"Block {rng.randrange(1, 400)}", "extId": None},
+                "region": {"id": 1, "name": region_name, "code": region_code},
+                "variety": {"id": 1, "name": variety_name, "code": variety_code},
+                "subRegion": {"id": None, "name": None, "code": None},
+            } for _ in range(parts)]
+        if "livemetrics" in extra_fields:
+            vessel["liveMetrics"] = [
+                {"name": "Alcohol", "value": vessel["ttbDetails"]["alcoholPercentage"],
+                 "nonNumericValue": None, "interfaceMappedName": "ALC"},
+                {"name": "pH", "value": round(rng.uniform(3.2, 3.9), 2),
+                 "nonNumericValue": None, "interfaceMappedName": "PH"},
+            ]
+        if "allocations" in extra_fields:
+            vessel["allocations"] = [{
+                "id": 900_000 + vessel_id, "salesOrder": {"id": rng.randrange(1, 5000), "name": "SO"},
+                "volume": {"value": round(volume / 2, 1), "unit": "gal"},
+            }] if rng.random() < 0.2 else []
+        return vessel
+
+    def barrel_group(self, barrel_group_id: int) -> Dict[str, Any]:
+        """Details of one barrel group"""
+        rng = self._rng("barrel-group", barrel_group_id)
+        count = rng.randint(2, 24)
+        return {
+            "id": barrel_group_id,
+            "name": f"V{barrel_group_id:05d}",
+            "barrelCount": count,
+            "barrels": [{"id": barrel_group_id * 100 + n, "name": f"V{barrel_group_id:05d}-{n:02d}",
+                         "volume": {"value": round(rng.uniform(40, 60), 1), "unit": "gal"}}
+                        for n in range(count)],
+        }
+
+    def work_order(self, index: int) -> Dict[str, Any]:
+        """One v7 work order"""
+        rng = self._rng("work-order", index)
+        wo_id = index + 1
+        return {
+            "id": wo_id,
+            "code": f"WO-{wo_id:06d}",
+            "status": rng.choice(("READY", "IN_PROGRESS", "SUBMITTED", "COMPLETED")),
+            "scheduledDate": BASE_EPOCH_MS + index * 3_600_000,
+            "jobs": [{"id": wo_id * 10 + n, "jobNumber": n + 1, "status": "READY"}
+                     for n in range(rng.randint(1, 4))],
+        }
+
+
+class Route(NamedTuple):
+    method: str
+    pattern: Pattern
+    template: str
+    handler: Callable[..., Tuple[int, Any]]
+    operation: Dict[str, Any]
+
+
+def _compile(template: str) -> Pattern:
+    """Turn /mrp/stock/{id}/notes into a regex with named groups (trailing slash optional)"""
+    parts = re.split(r"(\{\w+\})", template.rstrip("/"))
+    regex = "".join(f"(?P<{p[1:-1]}>[^/]+)" if p.startswith("{") else re.escape(p) for p in parts)
+    return re.compile(f"^{regex}/?$")
+
+
+class MockVintraceServer:
+    """Threaded HTTP server answering v6 and v7 requests with synthetic data"""
+
+    def __init__(self, config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0,
+                 spec_path: Path = SPEC_PATH, log_requests: bool = False):
+        """
+        Args:
+            config: Server behaviour (default: MockConfig())
+            host: Interface to bind (default: 127.0.0.1)
+            port: Port to bind, 0 for any free port (default: 0)
+            spec_path: OpenAPI spec the v6 routes are built from
+            log_requests: Log every request to stderr (default: False)
+        """
+        self.config = config or MockConfig()
+        self.log_requests = log_requests
+        with open(spec_path, "r", encoding="utf-8") as f:
+            self.spec = yaml.safe_load(f)
+        self.data = SyntheticData(self.spec.get("components", {}).get("schemas", {}),
+                                  self.config.seed, self.config.revision)
+        self.routes = self._build_routes()
+        self._collections: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._fault_rng = random.Random(self.config.seed)
+        self._stats = Counter()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Root URL; v7 paths (/smwe/api/v7/...) hang directly off it"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def v6_url(self) -> str:
+        """base_url for VintraceAPIClient"""
+        return self.base_url + V6_PREFIX
+
+    def start(self) -> "MockVintraceServer":
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockVintraceServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """Request counters: total, per status code and per route"""
+        with self._lock:
+            return dict(self._stats)
+
+    # -----------------------------------------------------------------
+    # Routing
+    # -----------------------------------------------------------------
+
+    def _build_routes(self) -> List[Route]:
+        routes = [
+            Route("GET", _compile("/smwe/api/v7/report/vessel-details-report"),
+                  "/smwe/api/v7/report/vessel-details-report", self._v7_vessels, {}),
+            Route("GET", _compile("/smwe/api/v7/vessel/barrel-groups/{id}"),
+                  "/smwe/api/v7/vessel/barrel-groups/{id}", self._v7_barrel_group, {}),
+            Route("GET", _compile("/smwe/api/v7/operation/work-orders"),
+                  "/smwe/api/v7/operation/work-orders", self._v7_work_orders, {}),
+        ]
+        v6_routes = []
+        for template, operations in self.spec.get("paths", {}).items():
+            for method, operation in operations.items():
+                handler = self._v6_transactions if template == "/transaction/search/" else self._v6
+                v6_routes.append(Route(method.upper(), _compile(V6_PREFIX + template),
+                                       template, handler, operation))
+        # Literal paths win over templated ones (/sales-order/ before /sales-order/{id})
+        v6_routes.sort(key=lambda route: route.template.count("{"))
+        return routes + v6_routes
+
+    def _match(self, method: str, path: str) -> Tuple[Optional[Route], Dict[str, str]]:
+        for route in self.routes:
+            if route.method == method:
+                match = route.pattern.match(path)
+                if match:
+                    return route, match.groupdict()
+        return None, {}
+
+    def handle(self, method: str, path: str, query: Dict[str, str]) -> Tuple[int, Dict[str, str], Any, int]:
+        """
+        Answer one request
+
+        Returns:
+            (status, extra headers, JSON body, records returned)
+        """
+        if path == STATS_PATH:
+            return 200, {}, self.stats(), 0
+
+        route, path_params = self._match(method, path)
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats[f"route {method} {route.template if route else '<unknown>'}"] += 1
+            roll = self._fault_rng.random()
+
+        if route is None:
+            return 404, {}, {"status": "Error", "message": f"No route for {method} {path}"}, 0
+        if roll < self.config.throttle_rate:
+            return 429, {"Retry-After": str(self.config.retry_after)}, {"status": "Error", "message": "Too many requests"}, 0
+        if roll < self.config.throttle_rate + self.config.error_rate:
+            status = self._fault_rng.choice((500, 502, 503, 504))
+            return status, {}, {"status": "Error", "message": "Injected failure"}, 0
+
+        fixture = self.config.fixtures.get(route.template, self.config.fixtures.get(path))
+        if fixture is not None and not isinstance(fixture, list):
+            return 200, {}, fixture, 1
+        try:
+            status, body, count = route.handler(route, path_params, query, fixture)
+        except (KeyError, ValueError) as e:
+            return 400, {}, {"status": "Error", "message": str(e)}, 0
+        return status, {}, body, count
+
+    def _page_bounds(self, query: Dict[str, str]) -> Tuple[int, int]:
+        offset = next((int(query[p]) for p in OFFSET_PARAMS if p in query), 0)
+        limit = next((int(query[p]) for p in LIMIT_PARAMS if p in query), self.config.default_page_size)
+        return max(offset, 0), max(min(limit, self.config.max_page_size), 0)
+
+    def _collection(self, key: str, factory: Callable[[int], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        with self._lock:
+            items = self._collections.get(key)
+        if items is None:
+            items = [factory(i) for i in range(self.config.total)]
+            with self._lock:
+                self._collections.setdefault(key, items)
+        return items
+
+    # -----------------------------------------------------------------
+    # v6 handlers
+    # -----------------------------------------------------------------
+
+    def _response_schema(self, operation: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        schema = (operation.get("responses", {}).get("200", {}).get("content", {})
+                  .get("application/json", {}).get("schema", {}))
+        name = schema["$ref"].split("/")[-1] if "$ref" in schema else ""
+        return name, self.data.resolve(schema)
+
+    def _v6(self, route: Route, path_params: Dict[str, str], query: Dict[str, str],
+            fixture: Optional[List[Any]]) -> Tuple[int, Any, int]:
+        name, schema = self._response_schema(route.operation)
+        props = self.data.properties(schema)
+        array_field = next((p for p, s in props.items()
+                            if s.get("type") == "array" and "$ref" in s.get("items", {})), None)
+        param_names = {p.get("name") for p in route.operation.get("parameters", [])}
+        is_list = (route.method == "GET" and array_field is not None
+                   and bool(param_names & set(OFFSET_PARAMS + LIMIT_PARAMS + ("modifiedSince",))))
+
+        if not is_list:
+            if not name:
+                return 200, {"status": "Success"}, 1
+            index = int(path_params["id"]) - 1 if path_params.get("id", "").isdigit() else 0
+            body = self.data.build(name, index)
+            if "status" in props:
+                body["status"] = "Success"
+            return 200, body, 1
+
+        item_name = props[array_field]["items"]["$ref"].split("/")[-1]
+        items = fixture if fixture is not None else self._collection(
+            route.template, lambda i: self.data.build(item_name, i))
+        if "modifiedSince" in query:
+            since = int(query["modifiedSince"])
+            items = [item for item in items if (item.get("modified") or 0) >= since]
+
+        offset, limit = self._page_bounds(query)
+        page = items[offset:offset + limit]
+        more = offset + len(page) < len(items)
+        body = {}
+        for key, value in (("status", "Success"), ("firstResult", offset), ("maxResult", limit),
+                           ("totalResultCount", len(items)), ("resultCount", len(page)),
+                           ("resultLimit", limit)):
+            if key in props:
+                body[key] = value
+        if "nextResult" in props and more:
+            body["nextResult"] = offset + len(page)
+        if "nextURLPath" in props and more:
+            body["nextURLPath"] = f"{route.template}?firstResult={offset + len(page)}&maxResult={limit}"
+        body[array_field] = page
+        return 200, body, len(page)
+
+    def _v6_transactions(self, route: Route, path_params: Dict[str, str], query: Dict[str, str],
+                         fixture: Optional[List[Any]]) -> Tuple[int, Any, int]:
+        if fixture is not None:
+            return 200, {"status": "Success", "transactionSummaries": fixture}, len(fixture)
+        day = datetime.strptime(query["dateFrom"], "%Y-%m-%d").date()
+        last = datetime.strptime(query.get("dateTo", query["dateFrom"]), "%Y-%m-%d").date()
+        rows = []
+        while day <= last:
+            rows.extend(self.data.transactions(day, self.config.transactions_per_day))
+            day += timedelta(days=1)
+        return 200, {"status": "Success", "message": None, "transactionSummaries": rows}, len(rows)
+
+    # -----------------------------------------------------------------
+    # v7 handlers
+    # -----------------------------------------------------------------
+
+    def _v7_page(self, items: List[Dict[str, Any]], query: Dict[str, str]) -> Tuple[int, Any, int]:
+        offset, limit = self._page_bounds(query)
+        page = items[offset:offset + limit]
+        return 200, {"totalResults": len(items), "offset": offset, "limit": limit, "results": page}, len(page)
+
+    def _v7_vessels(self, route: Route, path_params: Dict[str, str], query: Dict[str, str],
+                    fixture: Optional[List[Any]]) -> Tuple[int, Any, int]:
+        extra_fields = tuple(sorted(f.strip().lower() for f in query.get("extraFields", "").split(",") if f.strip()))
+        items = fixture if fixture is not None else self._collection(
+            f"vessels:{','.join(extra_fields)}", lambda i: self.data.vessel(i, extra_fields))
+        return self._v7_page(items, query)
+
+    def _v7_barrel_group(self, route: Route, path_params: Dict[str, str], query: Dict[str, str],
+                         fixture: Optional[List[Any]]) -> Tuple[int, Any, int]:
+        return 200, self.data.barrel_group(int(path_params["id"])), 1
+
+    def _v7_work_orders(self, route: Route, path_params: Dict[str, str], query: Dict[str, str],
+                        fixture: Optional[List[Any]]) -> Tuple[int, Any, int]:
+        items = fixture if fixture is not None else self._collection(route.template, self.data.work_order)
+        if "scheduledSince" in query:
+            since = int(query["scheduledSince"])
+            items = [item for item in items if (item.get("scheduledDate") or 0) >= since]
+        return self._v7_page(items, query)
+
+    # -----------------------------------------------------------------
+    # HTTP plumbing
+    # -----------------------------------------------------------------
+
+    def _delay(self, count: int) -> None:
+        config = self.config
+        delay = config.latency + config.latency_per_item * count
+        if config.jitter:
+            with self._lock:
+                delay += self._fault_rng.uniform(0, config.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+
+            def _serve(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                url = urlparse(self.path)
+                query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                try:
+                    status, headers, body, count = server.handle(method, url.path, query)
+                except Exception as e:  # a bug in the stand-in should look like a server error
+                    status, headers, body, count = 500, {}, {"status": "Error", "message": repr(e)}, 0
+                server._delay(count)
+                payload = json.dumps(body).encode("utf-8")
+                with server._lock:
+                    server._stats[f"status {status}"] += 1
+                    server._stats["bytes"] += len(payload)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                self._serve("GET")
+
+            def do_POST(self):
+                self._serve("POST")
+
+            def log_message(self, format, *args):
+                if server.log_requests:
+                    super().log_message(format, *args)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local stand-in for the Vintrace API")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8800, help="Port to listen on (default: 8800)")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for synthetic data and faults (default: 42)")
+    parser.add_argument("--total", type=int, default=1000, help="Records per list endpoint (default: 1000)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Base seconds per response (default: 0)")
+    parser.add_argument("--latency-per-item", type=float, default=0.0,
+                        help="Extra seconds per record returned (default: 0)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra seconds, up to this (default: 0)")
+    parser.add_argument("--max-page-size", type=int, default=1000, help="Largest page served (default: 1000)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of 429 responses (default: 0)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 5xx responses (default: 0)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds on 429 (default: 1)")
+    parser.add_argument("--revision", type=int, default=0, help="Vessel data revision, for snapshot diffs (default: 0)")
+    parser.add_argument("--fixture", action="append", default=[], metavar="PATH=FILE",
+                        help="Serve recorded JSON for a route, e.g. /smwe/api/v7/report/vessel-details-report=vessels.json")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    fixtures = {}
+    for item in args.fixture:
+        route, _, file_path = item.partition("=")
+        with open(file_path, "r", encoding="utf-8") as f:
+            fixtures[route] = json.load(f)
+
+    config = MockConfig(seed=args.seed, total=args.total, latency=args.latency,
+                        latency_per_item=args.latency_per_item, jitter=args.jitter,
+                        max_page_size=args.max_page_size, throttle_rate=args.throttle_rate,
+                        error_rate=args.error_rate, retry_after=args.retry_after,
+                        revision=args.revision, fixtures=fixtures)
+    server = MockVintraceServer(config, host=args.host, port=args.port, log_requests=args.verbose)
+    print(f"Mock Vintrace API on {server.base_url}")
+    print(f"  v6 base URL: {server.v6_url}")
+    print(f"  v7 base URL: {server.base_url}  (BASE_VINTRACE_URL)")
+    print(f"  counters:    {server.base_url}{STATS_PATH}")
+    server.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(json.dumps(server.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
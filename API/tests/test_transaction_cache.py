@@ -0,0 +1,90 @@
+"""
+TransactionDayCache: filing multi-day shards under the winery's local day
+
+Run from the repository root:
+    python -m unittest discover -s API/tests -t .
+"""
+
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from API.vintrace_transaction_cache import TransactionDayCache, transaction_day
+
+WINERY_TZ = ZoneInfo("America/Los_Angeles")
+
+
+def local_ms(year, month, day, hour, minute=0):
+    """Epoch milliseconds of a wall-clock time at the winery"""
+    return int(datetime(year, month, day, hour, minute, tzinfo=WINERY_TZ).timestamp() * 1000)
+
+
+# One evening operation per day: 20:30 in Los Angeles is 04:30 UTC the next day
+OPERATIONS = [
+    {"operationId": 1, "date": local_ms(2024, 1, 2, 20, 30)},
+    {"operationId": 2, "date": local_ms(2024, 1, 2, 9)},
+    {"operationId": 3, "date": local_ms(2024, 1, 3, 21, 15)},
+]
+
+
+class StubClient:
+    """transaction_search filtered by the winery's local day, like vintrace"""
+
+    def __init__(self):
+        self.calls = []
+
+    def transaction_search(self, dateFrom, dateTo, **filters):
+        self.calls.append((dateFrom, dateTo))
+        first, last = date.fromisoformat(dateFrom), date.fromisoformat(dateTo)
+        rows = [dict(op) for op in OPERATIONS if first <= transaction_day(op, WINERY_TZ) <= last]
+        return {"status": "Success", "transactionSummaries": rows}
+
+
+def op_ids(rows):
+    return sorted(row["operationId"] for row in rows)
+
+
+class TransactionDayCacheTimezoneTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.day_cache = TransactionDayCache(self.cache_dir.name, open_days=3, tz="America/Los_Angeles")
+
+    def test_transaction_day_uses_winery_timezone(self):
+        self.assertEqual(transaction_day(OPERATIONS[0], WINERY_TZ), date(2024, 1, 2))
+        self.assertEqual(transaction_day(OPERATIONS[0], "UTC"), date(2024, 1, 3))
+        self.assertEqual(transaction_day({"date": "2024-01-02"}, WINERY_TZ), date(2024, 1, 2))
+        self.assertIsNone(transaction_day({"date": None}, WINERY_TZ))
+
+    def test_shard_split_matches_single_day_requests(self):
+        client = StubClient()
+        rows = self.day_cache.fetch_range(client, "2024-01-01", "2024-01-03", chunk_days=7)
+        self.assertEqual(op_ids(rows), [1, 2, 3])
+        self.assertEqual(client.calls, [("2024-01-01", "2024-01-03")])
+
+        for day, expected in [(date(2024, 1, 1), []), (date(2024, 1, 2), [1, 2]), (date(2024, 1, 3), [3])]:
+            self.assertEqual(op_ids(self.day_cache.load(day, {})), expected)
+
+        # Every day was placed, so a second run is served entirely from disk
+        client.calls.clear()
+        cached = self.day_cache.fetch_range(client, date(2024, 1, 2), date(2024, 1, 3))
+        self.assertEqual(op_ids(cached), [1, 2, 3])
+        self.assertEqual(client.calls, [])
+
+    def test_shard_with_rows_outside_its_days_is_not_cached(self):
+        utc_cache = TransactionDayCache(self.cache_dir.name, open_days=3, tz="UTC")
+        rows = utc_cache.fetch_range(StubClient(), "2024-01-02", "2024-01-03")
+        self.assertEqual(op_ids(rows), [1, 2, 3])
+        for day in (date(2024, 1, 2), date(2024, 1, 3)):
+            self.assertIsNone(utc_cache.load(day, {}))
+
+    def test_open_days_are_not_saved(self):
+        today = datetime.now(WINERY_TZ).date()
+        self.day_cache.fetch_range(StubClient(), today - timedelta(days=1), today)
+        self.assertIsNone(self.day_cache.load(today, {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,10 +5,22 @@ Auto-generated from vintrace-v6-apis.yaml
 """
 
 import requests
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 import time
 
+from .vintrace_decode import ResponseDecoder
+from .vintrace_rate_limit import RateLimiter, parse_retry_after
+
+if TYPE_CHECKING:  # optional collaborators, imported by whoever builds them
+    from .vintrace_cache import ResponseCache
+    from .vintrace_circuit_breaker import CircuitBreaker
+    from .vintrace_coalesce import RequestCoalescer
+    from .vintrace_metrics import MetricsRecorder
+    from .vintrace_pager import AdaptivePager
+
 
 class VintraceAPIClient:
     """Client for Vintrace V6 API
@@ -25,7 +37,13 @@ class VintraceAPIClient:
 
     def __init__(self, base_url: str, api_key: Optional[str] = None,
                  username: Optional[str] = None, password: Optional[str] = None,
-                 timeout: int = 30, max_retries: int = 3):
+                 timeout: int = 30, max_retries: int = 3,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional['ResponseCache'] = None,
+                 decode: str = "json",
+                 metrics: Optional['MetricsRecorder'] = None,
+                 coalescer: Optional['RequestCoalescer'] = None,
+                 circuit_breaker: Optional['CircuitBreaker'] = None):
         """
         Initialize the Vintrace API client
         
@@ -36,6 +54,15 @@ class VintraceAPIClient:
             password: Password for basic auth (optional)
             timeout: Request timeout in seconds (default: 30)
             max_retries: Maximum number of retries for failed requests (default: 3)
+            rate_limiter: Shared RateLimiter to throttle requests (optional)
+            cache: On-disk ResponseCache for GET requests (optional)
+            decode: Response decoding: "json" (stdlib), "orjson" (faster dicts) or
+                "structs" (msgspec Structs for endpoints with a response schema)
+            metrics: MetricsRecorder that receives every request attempt (optional)
+            coalescer: RequestCoalescer sharing identical in-flight GETs and memoizing
+                their results for the run (optional)
+            circuit_breaker: CircuitBreaker that fails fast on endpoints that keep
+                failing (optional)
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
@@ -43,6 +70,14 @@ class VintraceAPIClient:
         self.password = password
         self.timeout = timeout
         self.max_retries = max_retries
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.decoder = ResponseDecoder(decode) if decode != "json" else None
+        self.metrics = metrics
+        self.coalescer = coalescer
+        self.circuit_breaker = circuit_breaker
+        if circuit_breaker is not None and metrics is not None:
+            metrics.add_circuit_breaker(circuit_breaker)
         self.session = requests.Session()
         
         # Set up authentication headers
@@ -53,75 +88,271 @@ class VintraceAPIClient:
         
         self.session.headers.update({"Accept": "application/json"})
 
-    def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+    def _request(self, method: str, path: str, response_type: Optional[str] = None,
+                 **kwargs) -> Dict[str, Any]:
+        """Make an HTTP request; GETs are coalesced and cached when configured"""
+        if method != "GET":
+            result = self._request_with_retry(method, path, response_type, **kwargs)
+            if self.coalescer is not None:
+                self.coalescer.clear()  # a write may change anything memoized
+            return result
+        if self.coalescer is not None:
+            return self.coalescer.fetch(method, path, kwargs.get("params"),
+                                        lambda: self._get(path, response_type, **kwargs), self.base_url)
+        return self._get(path, response_type, **kwargs)
+
+    def _get(self, path: str, response_type: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """GET a resource, serving it from the response cache when configured"""
+        if self.cache is not None:
+            # The cache stores plain JSON; typed decoding happens on the way out
+            value = self.cache.fetch("GET", path, kwargs.get("params"),
+                                     lambda: self._request_with_retry("GET", path, **kwargs), self.base_url)
+            return self.decoder.convert(value, response_type) if self.decoder else value
+        return self._request_with_retry("GET", path, response_type, **kwargs)
+
+    def _send(self, method: str, path: str, attempt: int = 0, **kwargs) -> requests.Response:
+        """Send one request once a rate limit slot is free, reporting it to the metrics recorder"""
+        circuit = self.circuit_breaker.key(self.base_url, method, path) if self.circuit_breaker else None
+        if circuit is not None:
+            self.circuit_breaker.before_request(circuit)
+        queued = sent = time.perf_counter()
+        response = None
+        error = None
+        try:
+            with self.rate_limiter.slot() if self.rate_limiter else nullcontext():
+                sent = time.perf_counter()
+                response = self.session.request(method, f"{self.base_url}{path}", **kwargs)
+            if self.rate_limiter:
+                self.rate_limiter.observe(response.status_code, response.headers)
+            return response
+        except requests.exceptions.RequestException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            if circuit is not None:
+                self.circuit_breaker.record(circuit, response is not None and response.status_code < 500)
+            if self.metrics is not None:
+                self.metrics.record(method, path, response.status_code if response is not None else None,
+                                    time.perf_counter() - sent,
+                                    len(response.content) if response is not None else 0,
+                                    attempt, sent - queued, error)
+
+    def _request_with_retry(self, method: str, path: str, response_type: Optional[str] = None,
+                            **kwargs) -> Dict[str, Any]:
         """Make an HTTP request with retry logic"""
         url = f"{self.base_url}{path}"
         kwargs.setdefault("timeout", self.timeout)
         
         for attempt in range(self.max_retries):
             try:
-                response = self.session.request(method, url, **kwargs)
+                response = self._send(method, path, attempt, **kwargs)
                 response.raise_for_status()
                 
                 # Handle empty responses
                 if not response.content:
                     return {}
                 
+                if self.decoder:
+                    return self.decoder.decode(response.content, response_type)
                 return response.json()
             except requests.exceptions.HTTPError as e:
                 if attempt == self.max_retries - 1:
                     raise
-                # Retry on 5xx errors
-                if e.response.status_code >= 500:
-                    time.sleep(2 ** attempt)
+                # Retry on 429 (honouring Retry-After) and 5xx errors
+                status = e.response.status_code
+                if status == 429 or status >= 500:
+                    self._raise_if_circuit_open(method, path)
+                    time.sleep(self._retry_delay(e.response, attempt))
                     continue
                 raise
             except requests.exceptions.RequestException as e:
                 if attempt == self.max_retries - 1:
                     raise
+                self._raise_if_circuit_open(method, path)
                 time.sleep(2 ** attempt)
         
         raise Exception(f"Failed to {method} {url} after {self.max_retries} attempts")
 
-    def get_all_pages(self, method_func, **kwargs) -> List[Dict[str, Any]]:
+    def _raise_if_circuit_open(self, method: str, path: str) -> None:
+        """Skip the retry sleep when the failures so far have opened the circuit"""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.raise_if_open(self.circuit_breaker.key(self.base_url, method, path))
+
+    @staticmethod
+    def _retry_delay(response: Any, attempt: int) -> float:
+        """Seconds to wait before a retry: Retry-After if the server sent one, else 2 ** attempt"""
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return retry_after if retry_after is not None else 2 ** attempt
+
+    @staticmethod
+    def _extract_page(response: Any, results_key: str = "results") -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Split a list response into (results, totalResultCount); the total is None if not reported"""
+        if hasattr(response, "__struct_fields__"):
+            # Response decoded with decode="structs"
+            response = {field: getattr(response, field) for field in response.__struct_fields__}
+        if isinstance(response, dict):
+            results = response.get(results_key)
+            if results is None:
+                # Most list endpoints name the array after the entity (parties, products, ...)
+                results = next((v for v in response.values() if isinstance(v, list)), [])
+            total = response.get("totalResultCount")
+        else:
+            results = response if isinstance(response, list) else []
+            total = len(results)
+        return results, total
+
+    def get_all_pages(self, method_func, parallel: bool = False, max_workers: int = 4,
+                      pager: Optional['AdaptivePager'] = None, **kwargs) -> List[Dict[str, Any]]:
         """
         Fetch all pages from a paginated endpoint
         
+        In parallel mode the first page is fetched on its own to learn
+        totalResultCount, then every remaining offset is requested through a
+        thread pool and the pages are reassembled in offset order. Endpoints
+        that report no total (products, parties, sales orders, ...) are
+        fetched in windows of max_workers pages until a page comes back
+        short or empty.
+        
         Args:
             method_func: The API method to call (e.g., self.list_available_work_orders)
+            parallel: Fetch the remaining pages concurrently (default: False)
+            max_workers: Number of worker threads in parallel mode (default: 4)
+            pager: Tune the page size adaptively; pages are then fetched serially (default: None)
             **kwargs: Arguments to pass to the method
         
         Returns:
             List of all results from all pages
         """
+        if pager is not None:
+            return list(self.iter_results(method_func, pager=pager, **kwargs))
+        
         all_results = []
         first_result = 0
-        max_result = kwargs.get("max", 100)
+        max_result = int(kwargs.get("max", 100))
         
         while True:
             kwargs["first"] = str(first_result)
             kwargs["max"] = str(max_result)
             
             response = method_func(**kwargs)
-            
-            # Handle different response formats
-            if isinstance(response, dict):
-                results = response.get("results", [])
-                total = response.get("totalResultCount", 0)
-            else:
-                results = response if isinstance(response, list) else []
-                total = len(results)
+            results, total = self._extract_page(response)
             
             all_results.extend(results)
             
-            # Check if there are more pages
-            if len(all_results) >= total:
+            # Check if there are more pages (without a total, a short page is the last one)
+            if total is None:
+                if len(results) < max_result:
+                    break
+            elif len(all_results) >= total:
                 break
             
             first_result += max_result
+            
+            if parallel:
+                def fetch_page(offset: int) -> List[Dict[str, Any]]:
+                    page_kwargs = dict(kwargs, first=str(offset))
+                    return self._extract_page(method_func(**page_kwargs))[0]
+                
+                # executor.map yields pages in offset order
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    if total is not None:
+                        for page in executor.map(fetch_page, range(first_result, total, max_result)):
+                            all_results.extend(page)
+                    else:
+                        last_page = False
+                        while not last_page:
+                            window = range(first_result, first_result + max_workers * max_result, max_result)
+                            for page in executor.map(fetch_page, window):
+                                all_results.extend(page)
+                                if len(page) < max_result:
+                                    last_page = True
+                                    break
+                            first_result += max_workers * max_result
+                break
         
         return all_results
 
+    def iter_pages(self, method_func, prefetch: bool = False,
+                   pager: Optional['AdaptivePager'] = None,
+                   **kwargs) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield each page of results from a paginated endpoint as it arrives
+        
+        Only the current page is held in memory. With prefetch enabled the
+        next page is requested in a background thread while the caller is
+        still processing the current one. Passing ``first`` starts at that
+        offset, e.g. to resume an interrupted export.
+        
+        With a pager the size of each page is chosen from the throughput of
+        the previous ones, so prefetch is not used.
+        
+        Args:
+            method_func: The API method to call (e.g., self.list_available_work_orders)
+            prefetch: Request the next page while the current one is consumed (default: False)
+            pager: Tune the page size adaptively (default: None, fixed ``max``)
+            **kwargs: Arguments to pass to the method
+        
+        Yields:
+            List of results for each page, in offset order
+        """
+        max_result = int(kwargs.get("max", 100))
+        start = int(kwargs.pop("first", 0))
+        
+        if pager is not None:
+            from .vintrace_pager import Page
+            
+            def fetch_sized(offset: int, size: int) -> Page:
+                return Page(*self._extract_page(method_func(**dict(kwargs, first=str(offset), max=str(size)))))
+            
+            yield from pager.iter_pages(fetch_sized, start=start)
+            return
+        
+        def fetch_page(offset: int) -> Any:
+            return method_func(**dict(kwargs, first=str(offset), max=str(max_result)))
+        
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            first_result = start
+            fetched = start
+            pending = None
+            while True:
+                response = pending.result() if pending else fetch_page(first_result)
+                pending = None
+                results, total = self._extract_page(response)
+                fetched += len(results)
+                first_result += max_result
+                
+                has_more = bool(results) and (fetched < total if total is not None
+                                              else len(results) >= max_result)
+                if has_more and executor:
+                    pending = executor.submit(fetch_page, first_result)
+                
+                yield results
+                
+                if not has_more:
+                    break
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    def iter_results(self, method_func, prefetch: bool = False,
+                     pager: Optional['AdaptivePager'] = None,
+                     **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Yield individual records from a paginated endpoint as pages arrive
+        
+        Args:
+            method_func: The API method to call (e.g., self.list_available_work_orders)
+            prefetch: Request the next page while the current one is consumed (default: False)
+            pager: Tune the page size adaptively (default: None)
+            **kwargs: Arguments to pass to the method
+        
+        Yields:
+            Each result record, in order
+        """
+        for page in self.iter_pages(method_func, prefetch=prefetch, pager=pager, **kwargs):
+            yield from page
+
     # =================================================================
     # API ENDPOINTS
     # =================================================================
@@ -245,7 +476,7 @@ class VintraceAPIClient:
             params['maxResults'] = maxResults
         if firstResult is not None:
             params['firstResult'] = firstResult
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='IntakeOperationSearchResponse')
 
     def list_available_stock(
         self,
@@ -289,7 +520,7 @@ class VintraceAPIClient:
             params['breakoutCosting'] = breakoutCosting
         if disableCommitHeaders is not None:
             params['disableCommitHeaders'] = disableCommitHeaders
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='InventorySummaryResponse')
 
     def view_a_single_stock_item(self, id: str, expand: Optional[str] = None) -> Dict[str, Any]:
         """View a single stock item
@@ -302,7 +533,7 @@ class VintraceAPIClient:
         params = {}
         if expand is not None:
             params['expand'] = expand
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='StockItem')
 
     def view_bulk_product_details(self, id: str) -> Dict[str, Any]:
         """View bulk product details
@@ -314,7 +545,7 @@ class VintraceAPIClient:
         """
         url = f"/mrp/stock/{id}/bulk-info"
         params = None
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='StockBulkInfoDetail')
 
     def view_distribtutions(self, id: str) -> Dict[str, Any]:
         """View distribtutions
@@ -326,7 +557,7 @@ class VintraceAPIClient:
         """
         url = f"/mrp/stock/{id}/distributions/"
         params = None
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='StockDistributionDetail')
 
     def view_list_of_details_fields(self, id: str) -> Dict[str, Any]:
         """View list of details fields
@@ -338,7 +569,7 @@ class VintraceAPIClient:
         """
         url = f"/mrp/stock/{id}/fields/"
         params = None
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='StockFieldsDetail')
 
     def view_history_items(self, id: str, firstResult: float, maxResult: float) -> Dict[str, Any]:
         """View History items
@@ -356,15 +587,19 @@ class VintraceAPIClient:
             params['firstResult'] = firstResult
         if maxResult is not None:
             params['maxResult'] = maxResult
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='StockHistoryItemsDetail')
 
-    def view_all_notes(self, firstResult: Optional[float] = None, maxResult: Optional[float] = None) -> Dict[str, Any]:
+    def view_all_notes(
+        self,
+        id: str,
+        firstResult: Optional[float] = None,
+        maxResult: Optional[float] = None) -> Dict[str, Any]:
         """View all notes
         
         A paginated list of notes for a stock item.
         
         Args:
-            None: 
+            id: 
             firstResult: 
             maxResult: 
         """
@@ -374,15 +609,15 @@ class VintraceAPIClient:
             params['firstResult'] = firstResult
         if maxResult is not None:
             params['maxResult'] = maxResult
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='StockNotesDetail')
 
-    def add_a_note(self, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def add_a_note(self, id: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Add a Note
         
         Add a note to a stock item.
         
         Args:
-            None: 
+            id: 
         """
         url = f"/mrp/stock/{id}/notes"
         params = None
@@ -399,7 +634,7 @@ class VintraceAPIClient:
         """
         url = f"/mrp/stock/{id}/notes/{noteId}"
         params = None
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='StockNote')
 
     def update_a_note(self, id: str, noteId: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Update a Note
@@ -424,7 +659,7 @@ class VintraceAPIClient:
         """
         url = f"/mrp/stock/{id}/raw-components"
         params = None
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='StockRawComponentsDetail')
 
     def create_or_update_a_party(self, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Create or update a party
@@ -433,7 +668,7 @@ class VintraceAPIClient:
         """
         url = f"/party"
         params = None
-        return self._request('POST', url, params=params, json=data)
+        return self._request('POST', url, params=params, json=data, response_type='PartyUpdateResponse')
 
     def get_party_details_by_name(self, name: Optional[str] = None) -> Dict[str, Any]:
         """Get party details by name
@@ -447,7 +682,7 @@ class VintraceAPIClient:
         params = {}
         if name is not None:
             params['name'] = name
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='Party')
 
     def list_parties(
         self,
@@ -475,7 +710,7 @@ class VintraceAPIClient:
             params['startsWith'] = startsWith
         if category is not None:
             params['category'] = category
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='PartyResponse')
 
     def get_party_details_by_id(self, id: str) -> Dict[str, Any]:
         """Get party details by id
@@ -487,7 +722,7 @@ class VintraceAPIClient:
         """
         url = f"/party/{id}"
         params = None
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='Party')
 
     def update_a_product(self, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Update a product
@@ -496,7 +731,7 @@ class VintraceAPIClient:
         """
         url = f"/product-update"
         params = None
-        return self._request('POST', url, params=params, json=data)
+        return self._request('POST', url, params=params, json=data, response_type='ProductUpdateResponse')
 
     def list_available_products(
         self,
@@ -524,21 +759,22 @@ class VintraceAPIClient:
             params['first'] = first
         if skipMetrics is not None:
             params['skipMetrics'] = skipMetrics
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='ProductListResponse')
 
-    def product_search(self, barcode: Optional[str] = None) -> Dict[str, Any]:
+    def product_search(self, id: str, barcode: Optional[str] = None) -> Dict[str, Any]:
         """Search for a product by id
         
         Searches for a product using an id and returns the product details and vessel information.
         
         Args:
+            id: 
             barcode: The barcode to search for.
         """
         url = f"/products/{id}"
         params = {}
         if barcode is not None:
             params['barcode'] = barcode
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='ProductResponse')
 
     def create_or_update_a_refund(self, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Create or update a refund
@@ -547,7 +783,7 @@ class VintraceAPIClient:
         """
         url = f"/refund"
         params = None
-        return self._request('POST', url, params=params, json=data)
+        return self._request('POST', url, params=params, json=data, response_type='RefundUpdateResponse')
 
     def get_refund_details_by_code(self, code: Optional[str] = None) -> Dict[str, Any]:
         """Get refund details by code
@@ -561,7 +797,7 @@ class VintraceAPIClient:
         params = {}
         if code is not None:
             params['code'] = code
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='Refund')
 
     def list_available_refunds(
         self,
@@ -605,7 +841,7 @@ class VintraceAPIClient:
             params['endDate'] = endDate
         if salesOrderName is not None:
             params['salesOrderName'] = salesOrderName
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='RefundResponse')
 
     def get_refund_details_by_id(self, id: str) -> Dict[str, Any]:
         """Get refund details by id
@@ -617,7 +853,7 @@ class VintraceAPIClient:
         """
         url = f"/refund/{id}"
         params = None
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='Refund')
 
     def create_or_update_a_sales_order(self, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Create or update a sales order
@@ -626,7 +862,7 @@ class VintraceAPIClient:
         """
         url = f"/sales-order"
         params = None
-        return self._request('POST', url, params=params, json=data)
+        return self._request('POST', url, params=params, json=data, response_type='SalesOrderUpdateResponse')
 
     def get_sales_order_details_by_code(self, code: Optional[str] = None) -> Dict[str, Any]:
         """Get sales order details by code
@@ -640,7 +876,7 @@ class VintraceAPIClient:
         params = {}
         if code is not None:
             params['code'] = code
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='SalesOrder')
 
     def list_available_sales_orders(
         self,
@@ -692,7 +928,7 @@ class VintraceAPIClient:
             params['invEndDate'] = invEndDate
         if externalTransactionId is not None:
             params['externalTransactionId'] = externalTransactionId
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='SalesOrderResponse')
 
     def get_sales_order_details_by_id(self, id: str) -> Dict[str, Any]:
         """Get sales order details by id
@@ -704,7 +940,7 @@ class VintraceAPIClient:
         """
         url = f"/sales-order/{id}"
         params = None
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='SalesOrder')
 
     def maturity_samples_search(
         self,
@@ -792,7 +1028,7 @@ class VintraceAPIClient:
             params['maxResults'] = maxResults
         if firstResult is not None:
             params['firstResult'] = firstResult
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='SampleOperationSearchResponse')
 
     def list_results_for_item_type(
         self,
@@ -818,7 +1054,7 @@ class VintraceAPIClient:
             params['startsWith'] = startsWith
         if exactMatch is not None:
             params['exactMatch'] = exactMatch
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='SimpleSearchResponse')
 
     def get_stock_item_by_code_or_id(self, code: Optional[str] = None, id: Optional[str] = None) -> Dict[str, Any]:
         """Get stock item by code or id
@@ -835,7 +1071,7 @@ class VintraceAPIClient:
             params['code'] = code
         if id is not None:
             params['id'] = id
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='StockItemDetails')
 
     def transaction_search(
         self,
@@ -867,7 +1103,7 @@ class VintraceAPIClient:
             params['batchName'] = batchName
         if wineryName is not None:
             params['wineryName'] = wineryName
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='TransactionSummaryResponse')
 
     def assign_a_work_order(self, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Assign a work order
@@ -876,14 +1112,14 @@ class VintraceAPIClient:
         """
         url = f"/workorders/assign"
         params = None
-        return self._request('POST', url, params=params, json=data)
+        return self._request('POST', url, params=params, json=data, response_type='AssignWorkResponse')
 
     def submit_job_details(self, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Submit job details
         """
         url = f"/workorders/jobs/submit"
         params = None
-        return self._request('POST', url, params=params, json=data)
+        return self._request('POST', url, params=params, json=data, response_type='SubmitWorkOrderStepsResponse')
 
     def get_job_details_by_id(self, jobId: str) -> Dict[str, Any]:
         """Get job details by id
@@ -895,7 +1131,7 @@ class VintraceAPIClient:
         """
         url = f"/workorders/jobs/{jobId}"
         params = None
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='Job')
 
     def list_available_work_orders(
         self,
@@ -943,7 +1179,7 @@ class VintraceAPIClient:
             params['countOnly'] = countOnly
         if wineryId is not None:
             params['wineryId'] = wineryId
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='WorkOrderSearchResponse')
 
     def get_work_order_details_by_id_or_code(self, id: str, code: Optional[str] = None) -> Dict[str, Any]:
         """Get work order details by id or code
@@ -958,4 +1194,4 @@ class VintraceAPIClient:
         params = {}
         if code is not None:
             params['code'] = code
-        return self._request('GET', url, params=params)
+        return self._request('GET', url, params=params, response_type='WorkOrder')
@@ -4,13 +4,41 @@ Utility functions for working with Vintrace API
 Provides helper functions for common data fetching and processing tasks.
 """
 
-from typing import List, Dict, Any, Optional
+import logging
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Iterator, Iterable, Tuple, Callable
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import copy
 from datetime import datetime, timedelta
+from itertools import islice
 from .vintrace_api_client import VintraceAPIClient
+from .vintrace_rate_limit import RateLimiter
+from .vintrace_decode import to_builtins
+
+if TYPE_CHECKING:
+    from .vintrace_sync import SyncResult
+
+logger = logging.getLogger(__name__)
+
+# Related resources fetched by get_stock_details: key -> (method, value on failure).
+# Methods are looked up on VintraceDataFetcher first (paged helpers), then on the client.
+STOCK_DETAIL_PARTS = {
+    'fields': ('view_list_of_details_fields', []),
+    'distributions': ('view_distribtutions', []),
+    'history': ('get_stock_history', []),
+    'components': ('view_raw_components', []),
+    'notes': ('view_all_notes', []),
+    'bulk_info': ('view_bulk_product_details', {}),
+}
 
 
 class VintraceDataFetcher:
-    """Helper class for fetching and processing Vintrace data"""
+    """
+    Helper class for fetching and processing Vintrace data
+    
+    Helpers return plain dicts and lists in every decode mode; responses of a
+    decode="structs" client are converted with msgspec.to_builtins.
+    """
     
     def __init__(self, client: VintraceAPIClient):
         """
@@ -20,66 +48,138 @@ class VintraceDataFetcher:
             client: Configured VintraceAPIClient instance
         """
         self.client = client
+        # Results of the bulk lookups, per lookup kind: key -> record (None if not found)
+        self._lookup_cache: Dict[str, Dict[str, Any]] = {}
     
-    def get_all_work_orders(self, **filters) -> List[Dict[str, Any]]:
+    def get_all_work_orders(self, parallel: bool = False, **filters) -> List[Dict[str, Any]]:
         """
         Fetch all work orders across all pages
         
         Args:
+            parallel: Fetch the pages concurrently (see VintraceAPIClient.get_all_pages)
             **filters: Optional filters (assignedTo, workOrderState, fromDate, toDate, etc.)
         
         Returns:
             List of all work orders
         """
-        return self.client.get_all_pages(self.client.list_available_work_orders, **filters)
+        return to_builtins(self.client.get_all_pages(self.client.list_available_work_orders, parallel=parallel, **filters))
     
-    def get_all_products(self, **filters) -> List[Dict[str, Any]]:
+    def get_all_products(self, parallel: bool = False, **filters) -> List[Dict[str, Any]]:
         """
         Fetch all products across all pages
         
         Args:
+            parallel: Fetch the pages concurrently (see VintraceAPIClient.get_all_pages)
             **filters: Optional filters for products
         
         Returns:
             List of all products
         """
-        return self.client.get_all_pages(self.client.list_available_products, **filters)
+        return to_builtins(self.client.get_all_pages(self.client.list_available_products, parallel=parallel, **filters))
     
-    def get_all_sales_orders(self, **filters) -> List[Dict[str, Any]]:
+    def get_all_sales_orders(self, parallel: bool = False, **filters) -> List[Dict[str, Any]]:
         """
         Fetch all sales orders across all pages
         
         Args:
+            parallel: Fetch the pages concurrently (see VintraceAPIClient.get_all_pages)
             **filters: Optional filters for sales orders
         
         Returns:
             List of all sales orders
         """
-        return self.client.get_all_pages(self.client.list_available_sales_orders, **filters)
+        return to_builtins(self.client.get_all_pages(self.client.list_available_sales_orders, parallel=parallel, **filters))
     
-    def get_all_parties(self, **filters) -> List[Dict[str, Any]]:
+    def get_all_parties(self, parallel: bool = False, **filters) -> List[Dict[str, Any]]:
         """
         Fetch all parties across all pages
         
         Args:
+            parallel: Fetch the pages concurrently (see VintraceAPIClient.get_all_pages)
             **filters: Optional filters for parties
         
         Returns:
             List of all parties
         """
-        return self.client.get_all_pages(self.client.list_parties, **filters)
+        return to_builtins(self.client.get_all_pages(self.client.list_parties, parallel=parallel, **filters))
     
-    def get_all_refunds(self, **filters) -> List[Dict[str, Any]]:
+    def get_all_refunds(self, parallel: bool = False, **filters) -> List[Dict[str, Any]]:
         """
         Fetch all refunds across all pages
         
         Args:
+            parallel: Fetch the pages concurrently (see VintraceAPIClient.get_all_pages)
             **filters: Optional filters for refunds
         
         Returns:
             List of all refunds
         """
-        return self.client.get_all_pages(self.client.list_available_refunds, **filters)
+        return to_builtins(self.client.get_all_pages(self.client.list_available_refunds, parallel=parallel, **filters))
+    
+    def iter_work_orders(self, prefetch: bool = True, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Stream work orders page by page instead of building one list
+        
+        Args:
+            prefetch: Request the next page while the current one is consumed (default: True)
+            **filters: Optional filters (assignedTo, workOrderState, fromDate, toDate, etc.)
+        
+        Yields:
+            Each work order
+        """
+        return map(to_builtins, self.client.iter_results(self.client.list_available_work_orders, prefetch=prefetch, **filters))
+    
+    def iter_products(self, prefetch: bool = True, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Stream products page by page instead of building one list
+        
+        Args:
+            prefetch: Request the next page while the current one is consumed (default: True)
+            **filters: Optional filters for products
+        
+        Yields:
+            Each product
+        """
+        return map(to_builtins, self.client.iter_results(self.client.list_available_products, prefetch=prefetch, **filters))
+    
+    def iter_sales_orders(self, prefetch: bool = True, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Stream sales orders page by page instead of building one list
+        
+        Args:
+            prefetch: Request the next page while the current one is consumed (default: True)
+            **filters: Optional filters for sales orders
+        
+        Yields:
+            Each sales order
+        """
+        return map(to_builtins, self.client.iter_results(self.client.list_available_sales_orders, prefetch=prefetch, **filters))
+    
+    def iter_parties(self, prefetch: bool = True, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Stream parties page by page instead of building one list
+        
+        Args:
+            prefetch: Request the next page while the current one is consumed (default: True)
+            **filters: Optional filters for parties
+        
+        Yields:
+            Each party
+        """
+        return map(to_builtins, self.client.iter_results(self.client.list_parties, prefetch=prefetch, **filters))
+    
+    def iter_refunds(self, prefetch: bool = True, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Stream refunds page by page instead of building one list
+        
+        Args:
+            prefetch: Request the next page while the current one is consumed (default: True)
+            **filters: Optional filters for refunds
+        
+        Yields:
+            Each refund
+        """
+        return map(to_builtins, self.client.iter_results(self.client.list_available_refunds, prefetch=prefetch, **filters))
     
     def get_recent_work_orders(self, days: int = 7) -> List[Dict[str, Any]]:
         """
@@ -106,52 +206,221 @@ class VintraceDataFetcher:
         Returns:
             List of matching transactions
         """
-        return self.client.get_all_pages(self.client.transaction_search, **criteria)
+        return to_builtins(self.client.get_all_pages(self.client.transaction_search, **criteria))
+    
+    def search_transactions_sharded(self, date_from: str, date_to: str, chunk_days: int = 7,
+                                    max_workers: int = 4, **filters) -> List[Dict[str, Any]]:
+        """
+        Search transactions over a long period as concurrent date shards
+        
+        transaction_search has no pagination, so the range is split into
+        chunks of chunk_days that are fetched (and retried) independently, then
+        merged with de-duplication on Op Id / Tx Id.
+        
+        Args:
+            date_from: First day in YYYY-MM-DD format
+            date_to: Last day in YYYY-MM-DD format
+            chunk_days: Days per shard (default: 7)
+            max_workers: Shards fetched at once (default: 4)
+            **filters: Optional filters (ownerName, batchName, wineryName)
+        
+        Returns:
+            List of matching transactions in date order
+        """
+        from .vintrace_transaction_cache import fetch_transactions_sharded
+        
+        return fetch_transactions_sharded(self.client, date_from, date_to, chunk_days=chunk_days,
+                                          max_workers=max_workers, **filters)
+    
+    def _submit_stock_details(self, executor: ThreadPoolExecutor, stock_id: str) -> Dict[str, Future]:
+        """Schedule the stock item request and all related-data requests for one ID"""
+        futures = {'stock': executor.submit(self.client.view_a_single_stock_item, id=stock_id)}
+        for key, (method_name, _) in STOCK_DETAIL_PARTS.items():
+            method_func = getattr(self, method_name, None) or getattr(self.client, method_name)
+            futures[key] = executor.submit(method_func, id=stock_id)
+        return futures
+    
+    @staticmethod
+    def _collect_stock_details(futures: Dict[str, Future]) -> Dict[str, Any]:
+        """Assemble the results of _submit_stock_details (related data is best effort)"""
+        # A new dict: the stock item itself may be shared (coalesced/cached) with other callers
+        details = dict(to_builtins(futures['stock'].result()))
+        for key, (_, default) in STOCK_DETAIL_PARTS.items():
+            try:
+                details[key] = to_builtins(futures[key].result())
+            except Exception as e:
+                logger.warning(f"Stock item {details.get('id')}: could not fetch {key} ({e}); using {default!r}")
+                details[key] = copy(default)
+        return details
+    
+    def get_stock_history(self, id: str, page_size: int = 100) -> Dict[str, Any]:
+        """
+        Get every history item of a stock item
+        
+        view_history_items is paginated; this pages through it and returns
+        the first page's response with all historyItems.
+        
+        Args:
+            id: The stock item ID
+            page_size: maxResult per request (default: 100)
+        
+        Returns:
+            StockHistoryItemsDetail dictionary with the complete historyItems list
+        """
+        response = to_builtins(self.client.view_history_items(id=id, firstResult=0, maxResult=page_size))
+        items, total = self.client._extract_page(response, 'historyItems')
+        items = list(items or [])
+        page = items
+        while len(page) >= page_size and (total is None or len(items) < total):
+            page_response = self.client.view_history_items(id=id, firstResult=len(items), maxResult=page_size)
+            page = to_builtins(self.client._extract_page(page_response, 'historyItems')[0] or [])
+            items.extend(page)
+        return dict(response, historyItems=items)
     
     def get_stock_details(self, stock_id: str) -> Dict[str, Any]:
         """
         Get complete stock details including all related information
         
+        The stock item and its six related resources are requested concurrently.
+        
         Args:
             stock_id: The stock item ID
         
         Returns:
             Dictionary with complete stock information
         """
-        stock = self.client.view_a_single_stock_item(id=stock_id)
+        with ThreadPoolExecutor(max_workers=len(STOCK_DETAIL_PARTS) + 1) as executor:
+            return self._collect_stock_details(self._submit_stock_details(executor, stock_id))
+    
+    def get_stock_details_many(self, stock_ids: Iterable[str],
+                               max_workers: int = 8) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream complete stock details for many stock items
         
-        # Fetch related data
-        try:
-            stock['fields'] = self.client.view_list_of_details_fields(id=stock_id)
-        except:
-            stock['fields'] = []
+        IDs are de-duplicated and fed through one bounded thread pool; only
+        max_workers stock items are in flight at a time, so memory stays flat
+        for thousands of IDs. Results are yielded in input order as soon as
+        each item is complete.
+        
+        Args:
+            stock_ids: Stock item IDs (duplicates are skipped)
+            max_workers: Worker threads shared by all sub-requests (default: 8)
+        
+        Yields:
+            (stock_id, details) tuples; details is {'id': ..., 'error': ...} if the
+            stock item itself could not be fetched
+        """
+        remaining = iter(dict.fromkeys(str(stock_id) for stock_id in stock_ids))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque(
+                (stock_id, self._submit_stock_details(executor, stock_id))
+                for stock_id in islice(remaining, max_workers)
+            )
+            while pending:
+                stock_id, futures = pending.popleft()
+                try:
+                    details = self._collect_stock_details(futures)
+                except Exception as e:
+                    details = {'id': stock_id, 'error': str(e)}
+                
+                next_id = next(remaining, None)
+                if next_id is not None:
+                    pending.append((next_id, self._submit_stock_details(executor, next_id)))
+                
+                yield stock_id, details
+    
+    def _lookup_many(self, kind: str, keys: Iterable[Any], fetch_one: Callable[[str], Any],
+                     max_workers: int) -> Dict[str, Any]:
+        """
+        Resolve many lookup keys through the fetcher's cache and one thread pool
+        
+        Keys are de-duplicated; keys this fetcher has already resolved are served
+        from memory and only the misses are requested, concurrently.
+        
+        Returns:
+            key -> record, None if the API answered 404, or {'key': ..., 'error': ...}
+            if the lookup failed (failures are not cached)
+        """
+        unique = list(dict.fromkeys(str(key) for key in keys if key is not None))
+        cache = self._lookup_cache.setdefault(kind, {})
+        misses = [key for key in unique if key not in cache]
         
-        try:
-            stock['distributions'] = self.client.view_distribtutions(id=stock_id)
-        except:
-            stock['distributions'] = []
+        def fetch(key: str) -> Tuple[Any, bool]:
+            try:
+                return to_builtins(fetch_one(key)), True
+            except Exception as e:
+                if getattr(getattr(e, 'response', None), 'status_code', None) == 404:
+                    return None, True
+                return {'key': key, 'error': str(e)}, False
         
-        try:
-            stock['history'] = self.client.view_history_items(id=stock_id)
-        except:
-            stock['history'] = []
+        results = {}
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(misses))) as executor:
+                for key, (value, cacheable) in zip(misses, executor.map(fetch, misses)):
+                    results[key] = value
+                    if cacheable:
+                        cache[key] = value
+        return {key: results[key] if key in results else cache[key] for key in unique}
+    
+    def get_stock_items_many(self, keys: Iterable[Any], by: str = 'code',
+                             max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Look up many stock items by code or id
+        
+        Args:
+            keys: Stock item codes or IDs (duplicates and None are skipped)
+            by: 'code' or 'id' (default: 'code')
+            max_workers: Concurrent requests (default: 8)
+        
+        Returns:
+            Mapping of key -> stock item details (see _lookup_many)
+        """
+        if by not in ('code', 'id'):
+            raise ValueError("by must be 'code' or 'id'")
+        return self._lookup_many(f'stock:{by}', keys,
+                                 lambda key: self.client.get_stock_item_by_code_or_id(**{by: key}),
+                                 max_workers)
+    
+    def get_parties_many(self, names: Iterable[Any], max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Look up many parties by name
+        
+        Args:
+            names: Party prime names (duplicates and None are skipped)
+            max_workers: Concurrent requests (default: 8)
+        
+        Returns:
+            Mapping of name -> party (see _lookup_many)
+        """
+        return self._lookup_many('party:name', names,
+                                 lambda name: self.client.get_party_details_by_name(name=name),
+                                 max_workers)
+    
+    def get_products_many(self, keys: Iterable[Any], by: str = 'id',
+                          max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Look up many products by id or barcode
         
-        try:
-            stock['components'] = self.client.view_raw_components(id=stock_id)
-        except:
-            stock['components'] = []
+        Args:
+            keys: Product IDs or barcodes (vessel code or asset ID)
+            by: 'id' (product_search) or 'barcode' (products list filtered by barcode)
+            max_workers: Concurrent requests (default: 8)
         
-        try:
-            stock['notes'] = self.client.view_all_notes(id=stock_id)
-        except:
-            stock['notes'] = []
+        Returns:
+            Mapping of key -> product (see _lookup_many)
+        """
+        if by not in ('id', 'barcode'):
+            raise ValueError("by must be 'id' or 'barcode'")
         
-        try:
-            stock['bulk_info'] = self.client.view_bulk_product_details(id=stock_id)
-        except:
-            stock['bulk_info'] = {}
+        def fetch_one(key: str) -> Optional[Dict[str, Any]]:
+            if by == 'id':
+                return self.client.product_search(id=key)
+            response = self.client.list_available_products(barcode=key)
+            products = self.client._extract_page(response, 'products')[0] or []
+            return products[0] if products else None
         
-        return stock
+        return self._lookup_many(f'product:{by}', keys, fetch_one, max_workers)
     
     def get_inventory_summary(self, **filters) -> Dict[str, Any]:
         """
@@ -163,7 +432,7 @@ class VintraceDataFetcher:
         Returns:
             Inventory summary data
         """
-        return self.client.list_available_stock(**filters)
+        return to_builtins(self.client.list_available_stock(**filters))
     
     def search_intake_operations(self, **criteria) -> List[Dict[str, Any]]:
         """
@@ -175,7 +444,9 @@ class VintraceDataFetcher:
         Returns:
             List of matching intake operations
         """
-        return self.client.get_all_pages(self.client.fruit_intake_operation_search, **criteria)
+        from .vintrace_sync import iter_search_results
+        
+        return list(iter_search_results(self.client.fruit_intake_operation_search, "intakes", **criteria))
     
     def search_sample_operations(self, **criteria) -> List[Dict[str, Any]]:
         """
@@ -187,7 +458,43 @@ class VintraceDataFetcher:
         Returns:
             List of matching sample operations
         """
-        return self.client.get_all_pages(self.client.maturity_samples_search, **criteria)
+        from .vintrace_sync import iter_search_results
+        
+        return list(iter_search_results(self.client.maturity_samples_search, "samples", **criteria))
+    
+    def sync_intake_operations(self, data_dir: str = ".vintrace_cache/sync", **criteria) -> 'SyncResult':
+        """
+        Incrementally sync fruit intake operations into a local dataset
+        
+        Only intakes modified since the last run's high-water mark are fetched.
+        
+        Args:
+            data_dir: Directory holding the dataset and checkpoints
+            **criteria: Search criteria (vintage, wineryId, ...)
+        
+        Returns:
+            SyncResult with counts and high-water marks
+        """
+        from .vintrace_sync import IncrementalSync
+        
+        return IncrementalSync(self.client, data_dir).sync("intake_operations", **criteria)
+    
+    def sync_sample_operations(self, data_dir: str = ".vintrace_cache/sync", **criteria) -> 'SyncResult':
+        """
+        Incrementally sync maturity samples into a local dataset
+        
+        Only samples modified since the last run's high-water mark are fetched.
+        
+        Args:
+            data_dir: Directory holding the dataset and checkpoints
+            **criteria: Search criteria (vintage, blockId, ...)
+        
+        Returns:
+            SyncResult with counts and high-water marks
+        """
+        from .vintrace_sync import IncrementalSync
+        
+        return IncrementalSync(self.client, data_dir).sync("sample_operations", **criteria)
 
 
 def create_client_from_env() -> VintraceAPIClient:
@@ -199,6 +506,16 @@ def create_client_from_env() -> VintraceAPIClient:
         VINTRACE_API_KEY: API key (optional)
         VINTRACE_USERNAME: Username for basic auth (optional)
         VINTRACE_PASSWORD: Password for basic auth (optional)
+        VINTRACE_RATE_LIMIT: Requests per second for a shared RateLimiter (optional)
+        VINTRACE_CACHE_DIR: Directory for the on-disk ResponseCache (optional)
+        VINTRACE_DECODE: Response decoding, "json", "orjson" or "structs" (optional)
+        VINTRACE_METRICS_LOG: JSON-lines file receiving one event per request (optional)
+        VINTRACE_MEMO_TTL: Enables a RequestCoalescer memoizing identical GETs for this
+            many seconds; 0 only coalesces in-flight duplicates (optional, default: off)
+        VINTRACE_CIRCUIT_THRESHOLD: Enables a CircuitBreaker opening an endpoint's circuit
+            after this many consecutive failures (optional, default: 0, off)
+        VINTRACE_CIRCUIT_RECOVERY: Seconds an open circuit fails fast before probing
+            (optional, default: 30)
     
     Returns:
         Configured VintraceAPIClient instance
@@ -215,10 +532,46 @@ def create_client_from_env() -> VintraceAPIClient:
     api_key = os.getenv('VINTRACE_API_KEY')
     username = os.getenv('VINTRACE_USERNAME')
     password = os.getenv('VINTRACE_PASSWORD')
+    rate_limit = os.getenv('VINTRACE_RATE_LIMIT')
+    cache_dir = os.getenv('VINTRACE_CACHE_DIR')
+    decode = os.getenv('VINTRACE_DECODE', 'json')
+    metrics_log = os.getenv('VINTRACE_METRICS_LOG')
+    memo_ttl = os.getenv('VINTRACE_MEMO_TTL')
+    circuit_threshold = int(os.getenv('VINTRACE_CIRCUIT_THRESHOLD', '0'))
+    circuit_recovery = float(os.getenv('VINTRACE_CIRCUIT_RECOVERY', '30'))
+    
+    # Optional collaborators are only imported when their variable is set
+    metrics = None
+    if metrics_log:
+        from .vintrace_metrics import MetricsRecorder, JSONLinesExporter
+        metrics = MetricsRecorder()
+        metrics.add_listener(JSONLinesExporter(metrics_log))
+    
+    cache = None
+    if cache_dir:
+        from .vintrace_cache import ResponseCache
+        cache = ResponseCache(cache_dir)
+    
+    coalescer = None
+    if memo_ttl:
+        from .vintrace_coalesce import RequestCoalescer
+        coalescer = RequestCoalescer(memo_ttl=float(memo_ttl))
+    
+    circuit_breaker = None
+    if circuit_threshold > 0:
+        from .vintrace_circuit_breaker import CircuitBreaker
+        circuit_breaker = CircuitBreaker(failure_threshold=circuit_threshold,
+                                         recovery_timeout=circuit_recovery)
     
     return VintraceAPIClient(
         base_url=base_url,
         api_key=api_key,
         username=username,
-        password=password
+        password=password,
+        rate_limiter=RateLimiter(rate=float(rate_limit)) if rate_limit else None,
+        cache=cache,
+        decode=decode,
+        metrics=metrics,
+        coalescer=coalescer,
+        circuit_breaker=circuit_breaker
     )
@@ -0,0 +1,233 @@
+"""
+Persistent HTTP response cache for the Vintrace API
+
+Caches GET responses on disk (SQLite) keyed on the API base URL, method,
+path and query parameters, so clients for different Vintrace instances can
+share a cache directory. Each endpoint gets its own TTL, the cache is bounded in size with
+least-recently-used eviction, and entries that are slightly past their TTL can
+be served immediately while a fresh copy is fetched in the background
+(stale-while-revalidate).
+
+    cache = ResponseCache(".vintrace_cache")
+    client = VintraceAPIClient(base_url, api_key=key, cache=cache)
+    client.list_parties()   # network
+    client.list_parties()   # disk
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from fnmatch import fnmatchcase
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+# Reference data that rarely changes. Patterns are matched in order against the
+# request path (fnmatch syntax); endpoints that match nothing are not cached.
+DEFAULT_TTLS: Dict[str, float] = {
+    "/party/list/": 24 * 3600,
+    "/party/*": 24 * 3600,
+    "/products/list": 6 * 3600,
+    "/mrp/stock/*/fields/": 24 * 3600,
+    "/search/list/": 24 * 3600,
+}
+
+
+class ResponseCache:
+    """On-disk LRU cache of API responses with per-endpoint TTLs"""
+
+    def __init__(self, cache_dir: str = ".vintrace_cache",
+                 ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: Optional[float] = None,
+                 max_bytes: int = 256 * 1024 * 1024,
+                 stale_while_revalidate: float = 3600):
+        """
+        Args:
+            cache_dir: Directory holding the cache database (default: .vintrace_cache)
+            ttls: Path pattern -> TTL in seconds, checked before DEFAULT_TTLS (optional)
+            default_ttl: TTL for endpoints matching no pattern (default: None, not cached)
+            max_bytes: Total size of cached bodies before LRU eviction (default: 256 MB)
+            stale_while_revalidate: Seconds past the TTL during which a stale entry is
+                returned while it is refreshed in the background (default: 3600)
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, "responses.sqlite3")
+        self.ttls = dict(ttls or {})
+        self.ttls.update({k: v for k, v in DEFAULT_TTLS.items() if k not in self.ttls})
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.stale_while_revalidate = stale_while_revalidate
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, path TEXT, stored_at REAL,"
+            " accessed_at REAL, size INTEGER, body TEXT)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (accessed_at)")
+        self._db.commit()
+
+    # -----------------------------------------------------------------
+    # Keys and TTLs
+    # -----------------------------------------------------------------
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Return the TTL for a request path, or None if it should not be cached"""
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return self.default_ttl
+
+    @staticmethod
+    def make_key(method: str, path: str, params: Optional[Dict[str, Any]], base_url: str = "") -> str:
+        """Stable cache key for a request to the API at base_url"""
+        raw = json.dumps([base_url.rstrip("/"), method.upper(), path, sorted((params or {}).items())],
+                         default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    # -----------------------------------------------------------------
+    # Storage
+    # -----------------------------------------------------------------
+
+    def _lookup(self, key: str) -> Optional[Tuple[float, Any]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT stored_at, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+        return row[0], json.loads(row[1])
+
+    def _store(self, key: str, path: str, value: Any) -> None:
+        body = json.dumps(value)
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, path, now, now, len(body), body)
+            )
+            self._evict()
+            self._db.commit()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def clear(self) -> None:
+        """Remove every cached response"""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    # -----------------------------------------------------------------
+    # Read-through access
+    # -----------------------------------------------------------------
+
+    def _classify(self, path: str, key: str) -> Tuple[Optional[float], Optional[Tuple[float, Any]]]:
+        ttl = self.ttl_for(path)
+        return ttl, (self._lookup(key) if ttl is not None else None)
+
+    def _start_refresh(self, key: str) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _end_refresh(self, key: str) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def fetch(self, method: str, path: str, params: Optional[Dict[str, Any]],
+              loader: Callable[[], Any], base_url: str = "") -> Any:
+        """
+        Return a cached response, calling loader() on a miss
+
+        Args:
+            method: HTTP method (only GET requests should be routed here)
+            path: Request path relative to the API base URL
+            params: Query parameters
+            loader: Performs the real request and returns the decoded body
+            base_url: API base URL the request goes to (part of the key)
+
+        Returns:
+            The decoded response body
+        """
+        key = self.make_key(method, path, params, base_url)
+        ttl, entry = self._classify(path, key)
+        if ttl is None:
+            return loader()
+
+        if entry is not None:
+            stored_at, value = entry
+            age = time.time() - stored_at
+            if age < ttl:
+                self.hits += 1
+                return value
+            if age < ttl + self.stale_while_revalidate:
+                self.stale_hits += 1
+                if self._start_refresh(key):
+                    threading.Thread(target=self._refresh, args=(key, path, loader), daemon=True).start()
+                return value
+
+        self.misses += 1
+        value = loader()
+        self._store(key, path, value)
+        return value
+
+    def _refresh(self, key: str, path: str, loader: Callable[[], Any]) -> None:
+        try:
+            self._store(key, path, loader())
+        except Exception:
+            pass  # keep serving the stale copy; the next miss will surface the error
+        finally:
+            self._end_refresh(key)
+
+    async def fetch_async(self, method: str, path: str, params: Optional[Dict[str, Any]],
+                          loader: Callable[[], Awaitable[Any]], base_url: str = "") -> Any:
+        """Async counterpart of fetch(); loader is a coroutine function"""
+        key = self.make_key(method, path, params, base_url)
+        ttl, entry = self._classify(path, key)
+        if ttl is None:
+            return await loader()
+
+        if entry is not None:
+            stored_at, value = entry
+            age = time.time() - stored_at
+            if age < ttl:
+                self.hits += 1
+                return value
+            if age < ttl + self.stale_while_revalidate:
+                self.stale_hits += 1
+                if self._start_refresh(key):
+                    asyncio.ensure_future(self._refresh_async(key, path, loader))
+                return value
+
+        self.misses += 1
+        value = await loader()
+        self._store(key, path, value)
+        return value
+
+    async def _refresh_async(self, key: str, path: str, loader: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            self._store(key, path, await loader())
+        except Exception:
+            pass  # keep serving the stale copy; the next miss will surface the error
+        finally:
+            self._end_refresh(key)
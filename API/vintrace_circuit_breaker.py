@@ -0,0 +1,184 @@
+"""
+Circuit breaker for the Vintrace API clients
+
+When Vintrace is degraded every call would otherwise walk through all of its
+retries and back-off sleeps before failing. A CircuitBreaker counts
+consecutive failures (connection errors, timeouts, 5xx) per endpoint or per
+host; once ``failure_threshold`` is reached the circuit opens and requests to
+it fail immediately with CircuitOpenError. After ``recovery_timeout`` seconds
+the circuit goes half-open and lets a probe request through: success closes
+it, failure opens it again.
+
+    breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30)
+    client = VintraceAPIClient(base_url, api_key=key, circuit_breaker=breaker, metrics=metrics)
+
+With a MetricsRecorder on the same client, circuit states and rejection
+counts appear in ``metrics.to_dict()["circuits"]`` and the summary table.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from .vintrace_metrics import endpoint_key
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+CIRCUIT_SCOPES = ("endpoint", "host")
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """
+    Raised instead of sending a request while its circuit is open
+
+    A ConnectionError (and so a RequestException), so existing handlers for
+    failed requests also cover it.
+    """
+
+    def __init__(self, key: str, retry_in: float):
+        super().__init__(f"Circuit open for {key}; failing fast (next probe in {retry_in:.1f}s)")
+        self.key = key
+        self.retry_in = retry_in
+
+
+class _Circuit:
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """Per-endpoint (or per-host) closed/open/half-open failure tracking"""
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1, scope: str = "endpoint"):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open a circuit (default: 5)
+            recovery_timeout: Seconds an open circuit waits before a probe (default: 30)
+            half_open_max_calls: Probe requests allowed at once while half-open (default: 1)
+            scope: "endpoint" (one circuit per endpoint) or "host" (one for the whole API)
+        """
+        if scope not in CIRCUIT_SCOPES:
+            raise ValueError(f"Unknown circuit scope {scope!r}; expected one of {CIRCUIT_SCOPES}")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.scope = scope
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+        self._listeners: List[Callable[[str, str, str], None]] = []
+
+    def key(self, base_url: str, method: str, path: str) -> str:
+        """Circuit a request belongs to"""
+        host = urlparse(base_url).netloc or base_url
+        return host if self.scope == "host" else f"{host} {endpoint_key(method, path)}"
+
+    def add_listener(self, listener: Callable[[str, str, str], None]) -> None:
+        """Call listener(key, old_state, new_state) on every state change"""
+        self._listeners.append(listener)
+
+    def _transition(self, key: str, circuit: _Circuit, state: str) -> Callable[[], None]:
+        old, circuit.state = circuit.state, state
+        if state == OPEN:
+            circuit.opened_at = time.monotonic()
+            circuit.times_opened += 1
+        if state != HALF_OPEN:
+            circuit.probes = 0
+
+        def notify() -> None:
+            log = logger.warning if state == OPEN else logger.info
+            log(f"Circuit {key}: {old} -> {state}")
+            for listener in self._listeners:
+                listener(key, old, state)
+        return notify
+
+    def _retry_in(self, circuit: _Circuit) -> float:
+        return max(0.0, circuit.opened_at + self.recovery_timeout - time.monotonic())
+
+    def before_request(self, key: str) -> None:
+        """
+        Admit a request or fail fast
+
+        Raises:
+            CircuitOpenError: The circuit is open, or half-open with its probes in flight
+        """
+        notify = None
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state == CLOSED:
+                return
+            if circuit.state == OPEN:
+                retry_in = self._retry_in(circuit)
+                if retry_in > 0:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(key, retry_in)
+                notify = self._transition(key, circuit, HALF_OPEN)
+            if circuit.probes >= self.half_open_max_calls:
+                circuit.rejected += 1
+                raise CircuitOpenError(key, 0.0)
+            circuit.probes += 1
+        if notify:
+            notify()
+
+    def raise_if_open(self, key: str) -> None:
+        """Fail fast (e.g. instead of a retry sleep) if the circuit is open and not due for a probe"""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None and circuit.state == OPEN:
+                retry_in = self._retry_in(circuit)
+                if retry_in > 0:
+                    raise CircuitOpenError(key, retry_in)
+
+    def record(self, key: str, success: bool) -> None:
+        """Report the outcome of an admitted request"""
+        notify = None
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                if success:
+                    return
+                circuit = self._circuits[key] = _Circuit()
+            if success:
+                circuit.failures = 0
+                if circuit.state != CLOSED:
+                    notify = self._transition(key, circuit, CLOSED)
+            else:
+                circuit.failures += 1
+                if circuit.state == HALF_OPEN or (circuit.state == CLOSED
+                                                  and circuit.failures >= self.failure_threshold):
+                    notify = self._transition(key, circuit, OPEN)
+                elif circuit.state == OPEN:
+                    circuit.opened_at = time.monotonic()
+        if notify:
+            notify()
+
+    def state(self, key: str) -> str:
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return circuit.state if circuit else CLOSED
+
+    def reset(self) -> None:
+        """Close every circuit"""
+        with self._lock:
+            self._circuits.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-circuit state, consecutive failures, times opened and fail-fast rejections"""
+        with self._lock:
+            return {key: {"state": c.state, "failures": c.failures, "times_opened": c.times_opened,
+                          "rejected": c.rejected,
+                          "retry_in_s": round(self._retry_in(c), 3) if c.state == OPEN else None}
+                    for key, c in self._circuits.items()}
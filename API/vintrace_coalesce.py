@@ -0,0 +1,205 @@
+"""
+Coalescing of duplicate GET requests
+
+Fan-out helpers often ask for the same resource several times in one run
+(the same party inside a loop, the same stock code for many vessels).
+RequestCoalescer makes concurrent identical GETs share one in-flight HTTP
+call, and keeps results in a short-lived in-memory memo so repeats within
+the run are not sent at all:
+
+    client = VintraceAPIClient(base_url, api_key=key, coalescer=RequestCoalescer(memo_ttl=300))
+
+Callers may modify what they receive: results are only copied when they
+are actually shared. A caller alone on a request gets the decoded body
+itself; when others joined it or the memo keeps it, a pristine copy is
+taken once and every later recipient gets its own deep copy of that (the
+last waiter takes it as is when the memo does not hold it). A write clears
+the memo, and a GET that was already in flight when it happened is not
+memoized. Failures are never memoized; every waiting caller receives the
+exception.
+"""
+
+import asyncio
+import copy
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .vintrace_cache import ResponseCache
+
+_MISSING = object()
+
+
+class _Flight:
+    """An in-flight request: its future and the callers waiting on it"""
+
+    __slots__ = ("future", "waiters", "memoized")
+
+    def __init__(self, future: Any):
+        self.future = future
+        self.waiters = 0
+        self.memoized = False
+
+
+class RequestCoalescer:
+    """Single-flight de-duplication of GETs with a per-run memo"""
+
+    def __init__(self, memo_ttl: float = 300, max_entries: int = 10000):
+        """
+        Args:
+            memo_ttl: Seconds a result is reused for; 0 only shares in-flight calls (default: 300)
+            max_entries: Memo size before least recently used entries are dropped (default: 10000)
+        """
+        self.memo_ttl = memo_ttl
+        self.max_entries = max_entries
+        self.memo_hits = 0
+        self.coalesced = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._generation = 0  # bumped by clear(); results of older in-flight calls are not memoized
+        self._memo: "OrderedDict[str, tuple]" = OrderedDict()
+        self._inflight: Dict[str, _Flight] = {}
+        self._inflight_async: Dict[str, _Flight] = {}
+
+    def _memo_get(self, key: str) -> Any:
+        entry = self._memo.get(key)
+        if entry is None:
+            return _MISSING
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.memo_ttl:
+            del self._memo[key]
+            return _MISSING
+        self._memo.move_to_end(key)
+        return value
+
+    def _memo_set(self, key: str, value: Any, generation: int) -> bool:
+        if self.memo_ttl <= 0 or generation != self._generation:
+            return False
+        self._memo[key] = (time.monotonic(), value)
+        self._memo.move_to_end(key)
+        while len(self._memo) > self.max_entries:
+            self._memo.popitem(last=False)
+        return True
+
+    @staticmethod
+    def _forget_inflight(inflight: Dict[str, _Flight], key: str, flight: _Flight) -> None:
+        if inflight.get(key) is flight:
+            del inflight[key]
+
+    def _finish(self, inflight: Dict[str, _Flight], key: str, flight: _Flight, value: Any,
+                generation: int) -> Any:
+        """
+        Settle a leader's flight: return what waiters and the memo get (None if nobody)
+
+        Once the flight is out of ``inflight`` no caller can join it, so its
+        waiter count is final and the value is only copied if it is shared.
+        """
+        with self._lock:
+            self._forget_inflight(inflight, key, flight)
+            share = flight.waiters > 0 or (self.memo_ttl > 0 and generation == self._generation)
+        if not share:
+            return None
+        # Waiters and the memo get a pristine copy; the leader may modify its own result
+        shared = copy.deepcopy(value)
+        with self._lock:
+            flight.memoized = self._memo_set(key, shared, generation)
+        return shared
+
+    def _hand_out(self, flight: _Flight, shared: Any) -> Any:
+        """A waiter's result: the shared copy itself for the last waiter, unless the memo keeps it"""
+        with self._lock:
+            flight.waiters -= 1
+            last = flight.waiters == 0 and not flight.memoized
+        return shared if last else copy.deepcopy(shared)
+
+    def clear(self) -> None:
+        """Forget every memoized result (e.g. after a write), including ones still in flight"""
+        with self._lock:
+            self._generation += 1
+            self._memo.clear()
+            # Requests sent before the write are not joined by new callers either
+            self._inflight.clear()
+            self._inflight_async.clear()
+
+    def fetch(self, method: str, path: str, params: Optional[Dict[str, Any]],
+              loader: Callable[[], Any], base_url: str = "") -> Any:
+        """
+        Return the memoized result, join an identical in-flight call, or call loader()
+
+        Args:
+            method: HTTP method (only GET requests should be routed here)
+            path: Request path relative to the API base URL
+            params: Query parameters
+            loader: Performs the real request and returns the decoded body
+            base_url: API base URL the request goes to (part of the key)
+
+        Returns:
+            The decoded response body (a private copy when memoized or shared)
+        """
+        key = ResponseCache.make_key(method, path, params, base_url)
+        with self._lock:
+            value = self._memo_get(key)
+            if value is not _MISSING:
+                self.memo_hits += 1
+                return copy.deepcopy(value)
+            generation = self._generation
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight(Future())
+                self.misses += 1
+            else:
+                flight.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            return self._hand_out(flight, flight.future.result())
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                self._forget_inflight(self._inflight, key, flight)
+            flight.future.set_exception(e)
+            raise
+        flight.future.set_result(self._finish(self._inflight, key, flight, value, generation))
+        return value
+
+    async def fetch_async(self, method: str, path: str, params: Optional[Dict[str, Any]],
+                          loader: Callable[[], Awaitable[Any]], base_url: str = "") -> Any:
+        """Async counterpart of fetch(); loader is a coroutine function"""
+        key = ResponseCache.make_key(method, path, params, base_url)
+        with self._lock:
+            value = self._memo_get(key)
+            if value is not _MISSING:
+                self.memo_hits += 1
+                return copy.deepcopy(value)
+            generation = self._generation
+            flight = self._inflight_async.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight_async[key] = _Flight(asyncio.get_running_loop().create_future())
+                self.misses += 1
+            else:
+                flight.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            # A waiter cancelled here never hands out, so the others keep copying (safe)
+            return self._hand_out(flight, await asyncio.shield(flight.future))
+
+        try:
+            value = await loader()
+        except BaseException as e:
+            with self._lock:
+                self._forget_inflight(self._inflight_async, key, flight)
+            if isinstance(e, asyncio.CancelledError):
+                flight.future.cancel()
+            else:
+                flight.future.set_exception(e)
+                flight.future.exception()  # mark retrieved; waiting callers re-raise it themselves
+            raise
+        flight.future.set_result(self._finish(self._inflight_async, key, flight, value, generation))
+        return value
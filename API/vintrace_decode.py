@@ -0,0 +1,115 @@
+"""
+Fast response decoding for the Vintrace API clients
+
+The clients decode with the standard library by default. Two opt-in modes
+trade dependencies for speed on large payloads (vessel and stock listings):
+
+    "orjson"   parse with orjson, still returning plain dicts/lists
+    "structs"  decode straight into the compact msgspec Structs generated in
+               vintrace_structs.py (falls back to orjson/json for endpoints
+               without a response schema)
+
+    client = VintraceAPIClient(base_url, api_key=key, decode="structs")
+    orders = client.list_available_work_orders()   # WorkOrderSearchResponse
+    orders.workOrders[0].code
+"""
+
+import importlib
+import json
+import logging
+import sys
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DECODE_MODES = ("json", "orjson", "structs")
+
+
+def to_builtins(value: Any) -> Any:
+    """
+    Turn a decode="structs" result (a Struct or a list of Structs) into plain
+    dicts/lists, as the "json"/"orjson" modes return it; anything else is
+    returned unchanged
+    """
+    # Structs only exist once a "structs" decoder has imported msgspec
+    msgspec = sys.modules.get("msgspec")
+    if msgspec is None:
+        return value
+    if isinstance(value, msgspec.Struct) or (isinstance(value, list) and value
+                                             and isinstance(value[0], msgspec.Struct)):
+        return msgspec.to_builtins(value)
+    return value
+
+
+class ResponseDecoder:
+    """Decode response bodies according to the selected mode"""
+
+    def __init__(self, mode: str = "orjson"):
+        """
+        Args:
+            mode: One of DECODE_MODES
+        """
+        if mode not in DECODE_MODES:
+            raise ValueError(f"decode must be one of {DECODE_MODES}, got {mode!r}")
+        self.mode = mode
+        self._orjson = None
+        if mode != "json":
+            # Optional dependencies are only imported by the modes that use them
+            try:
+                self._orjson = importlib.import_module("orjson")
+            except ImportError:
+                if mode == "orjson":
+                    raise ImportError("decode='orjson' requires orjson (pip install orjson)") from None
+        self._msgspec = None
+        self._structs = None
+        self._decoders = {}
+        if mode == "structs":
+            try:
+                self._msgspec = importlib.import_module("msgspec")
+            except ImportError:
+                raise ImportError("decode='structs' requires msgspec (pip install msgspec)") from None
+            self._structs = importlib.import_module(".vintrace_structs", __package__)
+
+    def _loads(self, content: bytes) -> Any:
+        return self._orjson.loads(content) if self._orjson is not None else json.loads(content)
+
+    def _struct_type(self, response_type: Optional[str]) -> Optional[type]:
+        if self._structs is None or not response_type:
+            return None
+        return getattr(self._structs, response_type, None)
+
+    def decode(self, content: bytes, response_type: Optional[str] = None) -> Any:
+        """
+        Decode a response body
+
+        Args:
+            content: Raw response bytes
+            response_type: Schema name of the endpoint's response, if known
+
+        Returns:
+            A msgspec Struct in "structs" mode when the schema is known, else dicts/lists.
+            A body that does not match its schema is returned as dicts/lists instead
+            of failing the request.
+        """
+        struct_type = self._struct_type(response_type)
+        if struct_type is None:
+            return self._loads(content)
+        decoder = self._decoders.get(struct_type)
+        if decoder is None:
+            decoder = self._decoders[struct_type] = self._msgspec.json.Decoder(struct_type, strict=False)
+        try:
+            return decoder.decode(content)
+        except self._msgspec.ValidationError as e:
+            logger.warning(f"{response_type} response does not match the spec ({e}); returning plain JSON")
+            return self._loads(content)
+
+    def convert(self, value: Any, response_type: Optional[str] = None) -> Any:
+        """Convert an already-decoded value (e.g. from the response cache) to the selected type"""
+        struct_type = self._struct_type(response_type)
+        if struct_type is None:
+            return value
+        try:
+            return self._msgspec.convert(value, struct_type, strict=False)
+        except self._msgspec.ValidationError as e:
+            logger.warning(f"{response_type} response does not match the spec ({e}); returning plain JSON")
+            return value
@@ -0,0 +1,274 @@
+"""
+Request-level instrumentation for the Vintrace API clients
+
+Every HTTP attempt made by a client with ``metrics=`` set is reported as a
+RequestEvent (endpoint, status, latency, bytes, retry attempt, time spent
+waiting for a rate limiter / concurrency slot). MetricsRecorder aggregates
+them into per-endpoint latency histograms and forwards each event to any
+listeners, such as the JSON-lines exporter:
+
+    metrics = MetricsRecorder()
+    metrics.add_listener(JSONLinesExporter("Main/data/metrics/requests.jsonl"))
+    client = VintraceAPIClient(base_url, api_key=key, metrics=metrics)
+    ...
+    print(metrics.format_summary())
+
+Circuit breakers attached to the same client are reported alongside
+(``to_dict()["circuits"]`` and a section of the summary table).
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# Upper bounds of the latency buckets in milliseconds (the last bucket is open)
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (5, 10, 25, 50, 75, 100, 150, 250, 400, 600, 1000, 1500,
+                                        2500, 5000, 10000, 30000)
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_key(method: str, path: str) -> str:
+    """Group requests by endpoint: "GET /mrp/stock/123/notes" -> "GET /mrp/stock/{id}/notes\""""
+    path = path.split("?", 1)[0]
+    return f"{method.upper()} {_ID_SEGMENT.sub('/{id}', path)}"
+
+
+class RequestEvent(NamedTuple):
+    timestamp: float
+    method: str
+    endpoint: str
+    path: str
+    status: Optional[int]
+    elapsed: float
+    bytes: int
+    attempt: int
+    pool_wait: float
+    error: Optional[str]
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate percentiles"""
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self.counts[bisect_left(self.buckets_ms, ms)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Estimate the pct-th percentile (seconds) by interpolating inside its bucket"""
+        if not self.count:
+            return None
+        rank = pct / 100 * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets_ms[i - 1] / 1000 if i > 0 else 0.0
+                upper = self.buckets_ms[i] / 1000 if i < len(self.buckets_ms) else self.max
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(max(estimate, self.min), self.max)
+            seen += bucket_count
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"<={b:g}ms" for b in self.buckets_ms] + [f">{self.buckets_ms[-1]:g}ms"]
+        return {
+            "count": self.count,
+            "total_s": round(self.total, 6),
+            "min_s": self.min,
+            "max_s": self.max,
+            "p50_s": self.percentile(50),
+            "p95_s": self.percentile(95),
+            "p99_s": self.percentile(99),
+            "buckets": {label: n for label, n in zip(labels, self.counts) if n},
+        }
+
+
+class EndpointStats:
+    """Aggregates for one endpoint"""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.pool_wait = 0.0
+        self.bytes = 0
+        self.retries = 0
+        self.errors = 0
+        self.statuses = Counter()
+
+    def add(self, event: RequestEvent) -> None:
+        self.latency.observe(event.elapsed)
+        self.pool_wait += event.pool_wait
+        self.bytes += event.bytes
+        self.retries += 1 if event.attempt > 0 else 0
+        self.statuses[event.status if event.status is not None else event.error or "error"] += 1
+        if event.error or (event.status is not None and event.status >= 400):
+            self.errors += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.latency.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "pool_wait_s": round(self.pool_wait, 6),
+            "statuses": {str(k): v for k, v in self.statuses.items()},
+            "latency": self.latency.to_dict(),
+        }
+
+
+class MetricsRecorder:
+    """Thread-safe per-endpoint aggregation of RequestEvents, with pluggable listeners"""
+
+    def __init__(self):
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointStats] = {}
+        self._listeners: List[Callable[[RequestEvent], None]] = []
+        self._circuit_breakers: List[Any] = []
+
+    def add_listener(self, listener: Callable[[RequestEvent], None]) -> None:
+        """Call listener(event) for every recorded request (e.g. a JSONLinesExporter)"""
+        self._listeners.append(listener)
+
+    def add_circuit_breaker(self, breaker: Any) -> None:
+        """Report a CircuitBreaker's per-circuit state with the request metrics"""
+        if breaker not in self._circuit_breakers:
+            self._circuit_breakers.append(breaker)
+
+    def circuits(self) -> Dict[str, Dict[str, Any]]:
+        """State, failures, times opened and fail-fast rejections of every known circuit"""
+        circuits: Dict[str, Dict[str, Any]] = {}
+        for breaker in self._circuit_breakers:
+            circuits.update(breaker.snapshot())
+        return circuits
+
+    def record(self, method: str, path: str, status: Optional[int], elapsed: float,
+               nbytes: int = 0, attempt: int = 0, pool_wait: float = 0.0,
+               error: Optional[str] = None) -> RequestEvent:
+        """
+        Record one HTTP attempt
+
+        Args:
+            method: HTTP method
+            path: Request path (numeric segments are grouped as {id})
+            status: HTTP status, or None if no response was received
+            elapsed: Seconds from sending the request to receiving the response
+            nbytes: Size of the response body
+            attempt: 0 for the first try, 1+ for retries
+            pool_wait: Seconds spent waiting for a rate limiter or concurrency slot
+            error: Exception name if the request failed without a response
+
+        Returns:
+            The RequestEvent passed to the listeners
+        """
+        event = RequestEvent(time.time(), method.upper(), endpoint_key(method, path), path,
+                             status, elapsed, nbytes, attempt, pool_wait, error)
+        with self._lock:
+            stats = self._endpoints.get(event.endpoint)
+            if stats is None:
+                stats = self._endpoints[event.endpoint] = EndpointStats()
+            stats.add(event)
+        for listener in self._listeners:
+            listener(event)
+        return event
+
+    def record_response(self, method: str, path: str, response: Any, elapsed: float,
+                        attempt: int = 0, pool_wait: float = 0.0) -> RequestEvent:
+        """Record a requests/httpx response (for scripts that call the API directly)"""
+        return self.record(method, path, response.status_code, elapsed, len(response.content),
+                           attempt, pool_wait)
+
+    def endpoints(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint aggregates as plain dicts"""
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in self._endpoints.items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"started": self.started, "elapsed_s": round(time.time() - self.started, 3),
+                "endpoints": self.endpoints(), "circuits": self.circuits()}
+
+    def format_summary(self, top: Optional[int] = None) -> str:
+        """
+        Table of endpoints ordered by total time spent in them
+
+        Args:
+            top: Only show this many endpoints (default: all)
+        """
+        endpoints = sorted(self.endpoints().items(), key=lambda item: item[1]["latency"]["total_s"], reverse=True)
+        total_time = sum(stats["latency"]["total_s"] for _, stats in endpoints) or 1.0
+        lines = [f"{'Endpoint':48} {'reqs':>6} {'err':>5} {'retry':>5} {'p50 ms':>8} {'p95 ms':>8} "
+                 f"{'max ms':>8} {'total s':>8} {'share':>6} {'MB':>7} {'wait s':>7}"]
+        lines.append("-" * len(lines[0]))
+        for name, stats in endpoints[:top]:
+            latency = stats["latency"]
+            lines.append(
+                f"{name[:48]:48} {stats['requests']:6} {stats['errors']:5} {stats['retries']:5} "
+                f"{(latency['p50_s'] or 0) * 1000:8.0f} {(latency['p95_s'] or 0) * 1000:8.0f} "
+                f"{(latency['max_s'] or 0) * 1000:8.0f} {latency['total_s']:8.2f} "
+                f"{latency['total_s'] / total_time:6.1%} {stats['bytes'] / (1024 * 1024):7.2f} "
+                f"{stats['pool_wait_s']:7.2f}"
+            )
+        circuits = self.circuits()
+        if circuits:
+            lines.append("")
+            lines.append(f"{'Circuit':64} {'state':>9} {'opened':>6} {'rejected':>8}")
+            for name, circuit in sorted(circuits.items()):
+                lines.append(f"{name[:64]:64} {circuit['state']:>9} {circuit['times_opened']:6} "
+                             f"{circuit['rejected']:8}")
+        return "\n".join(lines)
+
+    def log_summary(self, logger: logging.Logger, top: Optional[int] = None) -> None:
+        """Write format_summary() to a logger, one line per endpoint"""
+        for line in self.format_summary(top).splitlines():
+            logger.info(line)
+
+    def write_summary(self, path: str) -> None:
+        """Write the per-endpoint aggregates to a JSON file"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+class JSONLinesExporter:
+    """Listener that appends each RequestEvent to a JSON-lines file"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: File to append to (created with its directory if missing)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+    def __call__(self, event: RequestEvent) -> None:
+        line = json.dumps(event._asdict(), default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,279 @@
+"""
+Adaptive page sizing for paginated endpoints
+
+Page size is a trade-off: small pages pay per-request overhead, large pages
+get slow, hit server caps and time out. AdaptivePager measures every page
+(records, seconds, bytes) and hill-climbs towards the size with the best
+records-per-second for that endpoint, within min/max bounds:
+
+    pager = AdaptivePager(initial=100, max_size=1000)
+    for page in client.iter_pages(client.list_available_work_orders, pager=pager):
+        ...
+
+The same pager drives raw limit/offset (v7) or first/max (v6) loops via
+``pager.iter_pages(fetch_page)``, where ``fetch_page(offset, size)`` returns
+a Page. Pages shorter than requested while more records remain are treated
+as a server cap and lower max_size; timeouts (including 408/504) halve the
+page size and retry the same offset. PageSizeStore remembers the best size
+per endpoint between runs.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+TIMEOUT_ERRORS = (TimeoutError, requests.exceptions.Timeout)
+
+# Gateway/request timeouts reported as HTTP statuses
+TIMEOUT_STATUSES = (408, 504)
+
+
+def is_timeout(error: BaseException) -> bool:
+    """True for client-side timeouts and 408/504 responses"""
+    if isinstance(error, TIMEOUT_ERRORS):
+        return True
+    # httpx timeouts (async client); httpx is only imported by whoever raised one
+    httpx = sys.modules.get("httpx")
+    if httpx is not None and isinstance(error, httpx.TimeoutException):
+        return True
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) in TIMEOUT_STATUSES
+
+
+class Page(NamedTuple):
+    records: List[Any]
+    total: Optional[int]
+    nbytes: int = 0
+
+
+class AdaptivePager:
+    """Chooses the next page size from observed per-page throughput"""
+
+    def __init__(self, initial: int = 100, min_size: int = 10, max_size: int = 1000,
+                 target_latency: float = 10.0, max_bytes: int = 16 * 1024 * 1024,
+                 growth: float = 2.0, max_timeouts: int = 3):
+        """
+        Args:
+            initial: First page size (default: 100)
+            min_size: Smallest page size (default: 10)
+            max_size: Largest page size the server allows (default: 1000)
+            target_latency: Pages slower than this many seconds are made smaller (default: 10)
+            max_bytes: Largest response body to aim for (default: 16MB)
+            growth: Factor page sizes are grown/shrunk by (default: 2.0)
+            max_timeouts: Consecutive timeouts before giving up on a page (default: 3)
+        """
+        self.min_size = min_size
+        self.max_size = max(min_size, max_size)
+        self.target_latency = target_latency
+        self.max_bytes = max_bytes
+        self.growth = growth
+        self.max_timeouts = max_timeouts
+        self.pages = 0
+        self.records = 0
+        self.elapsed = 0.0
+        self.timeouts = 0
+        self._consecutive_timeouts = 0
+        self._throughput: Dict[int, float] = {}
+        self._bytes_per_record: Optional[float] = None
+        self._lock = threading.Lock()
+        self.size = self._clamp(initial)
+
+    def _clamp(self, size: int) -> int:
+        ceiling = self.max_size
+        if self._bytes_per_record:
+            ceiling = min(ceiling, int(self.max_bytes / self._bytes_per_record))
+        return max(self.min_size, min(int(size), ceiling))
+
+    @property
+    def best_size(self) -> int:
+        """Page size with the highest measured records per second so far"""
+        with self._lock:
+            if not self._throughput:
+                return self.size
+            return max(self._throughput, key=self._throughput.get)
+
+    def next_size(self) -> int:
+        with self._lock:
+            return self.size
+
+    def observe(self, requested: int, records: int, elapsed: float, nbytes: int = 0,
+                more: bool = True) -> None:
+        """
+        Feed back one page and pick the next size
+
+        Args:
+            requested: Page size that was asked for
+            records: Records that came back
+            elapsed: Seconds the request took
+            nbytes: Response body size, if known
+            more: Whether records remain after this page
+        """
+        with self._lock:
+            self.pages += 1
+            self.records += records
+            self.elapsed += elapsed
+            self._consecutive_timeouts = 0
+            if not records or elapsed <= 0:
+                return
+            if nbytes:
+                per_record = nbytes / records
+                self._bytes_per_record = (per_record if self._bytes_per_record is None
+                                          else 0.5 * self._bytes_per_record + 0.5 * per_record)
+            if records < requested and more:
+                # The server returned less than asked although more remain: that is its cap
+                if records < self.max_size:
+                    logger.info(f"Server caps pages at {records} records")
+                self.max_size = max(self.min_size, records)
+                self.size = self._clamp(self.size)
+                return
+            if not more and records < requested:
+                return  # the last, short page says nothing about throughput
+
+            rate = records / elapsed
+            previous = self._throughput.get(requested)
+            self._throughput[requested] = rate if previous is None else 0.5 * previous + 0.5 * rate
+
+            if elapsed > self.target_latency:
+                self.size = self._clamp(requested / self.growth)
+                return
+            best = max(self._throughput, key=self._throughput.get)
+            if best != requested:
+                self.size = self._clamp(best)
+                return
+            bigger = self._clamp(requested * self.growth)
+            smaller = self._clamp(requested / self.growth)
+            if bigger > requested and bigger not in self._throughput:
+                self.size = bigger
+            elif smaller < requested and smaller not in self._throughput:
+                self.size = smaller
+            else:
+                self.size = requested
+
+    def on_timeout(self) -> bool:
+        """
+        Back off after a timed-out page
+
+        Returns:
+            True if the page should be retried at the new (smaller) size
+        """
+        with self._lock:
+            self.timeouts += 1
+            self._consecutive_timeouts += 1
+            failed = self.size
+            self.max_size = max(self.min_size, int(failed / self.growth))
+            self.size = self._clamp(self.max_size)
+            self._throughput = {size: rate for size, rate in self._throughput.items() if size <= self.max_size}
+            logger.warning(f"Page of {failed} timed out; retrying with {self.size}")
+            return self._consecutive_timeouts <= self.max_timeouts
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"pages": self.pages, "records": self.records, "elapsed_s": round(self.elapsed, 3),
+                    "records_per_s": round(self.records / self.elapsed, 1) if self.elapsed else None,
+                    "size": self.size, "max_size": self.max_size, "timeouts": self.timeouts}
+
+    def _more(self, offset: int, page: Page, size: int) -> bool:
+        if not page.records:
+            return False
+        if page.total is not None:
+            return offset + len(page.records) < page.total
+        return len(page.records) >= size
+
+    def iter_pages(self, fetch_page: Callable[[int, int], Page], start: int = 0) -> Iterator[List[Any]]:
+        """
+        Page through an endpoint with adaptive sizes
+
+        Args:
+            fetch_page: fetch_page(offset, size) -> Page
+            start: Offset to start at (default: 0)
+
+        Yields:
+            The records of each page, in order
+        """
+        offset = start
+        while True:
+            size = self.next_size()
+            started = time.perf_counter()
+            try:
+                page = fetch_page(offset, size)
+            except Exception as e:
+                if is_timeout(e) and self.on_timeout():
+                    continue
+                raise
+            more = self._more(offset, page, size)
+            self.observe(size, len(page.records), time.perf_counter() - started, page.nbytes, more)
+            yield page.records
+            offset += len(page.records)
+            if not more:
+                break
+
+    async def aiter_pages(self, fetch_page: Callable[[int, int], Awaitable[Page]],
+                          start: int = 0) -> AsyncIterator[List[Any]]:
+        """Async counterpart of iter_pages(); fetch_page is a coroutine function"""
+        offset = start
+        while True:
+            size = self.next_size()
+            started = time.perf_counter()
+            try:
+                page = await fetch_page(offset, size)
+            except Exception as e:
+                if is_timeout(e) and self.on_timeout():
+                    continue
+                raise
+            more = self._more(offset, page, size)
+            self.observe(size, len(page.records), time.perf_counter() - started, page.nbytes, more)
+            yield page.records
+            offset += len(page.records)
+            if not more:
+                break
+
+
+class PageSizeStore:
+    """Remembers each endpoint's best page size in a JSON file between runs"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: JSON file of endpoint -> page size (created on save)
+        """
+        self.path = path
+        self._sizes: Dict[str, int] = {}
+        self._pagers: Dict[str, AdaptivePager] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._sizes = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable page size file {path}: {e}")
+
+    def pager(self, endpoint: str, initial: int = 100, **options) -> AdaptivePager:
+        """
+        AdaptivePager for an endpoint, starting from its remembered size
+
+        Args:
+            endpoint: Name to remember the size under (e.g. "GET /report/vessel-details-report")
+            initial: Starting size if nothing is remembered yet (default: 100)
+            **options: Other AdaptivePager arguments (min_size, max_size, ...)
+        """
+        pager = AdaptivePager(initial=self._sizes.get(endpoint, initial), **options)
+        self._pagers[endpoint] = pager
+        return pager
+
+    def save(self) -> None:
+        """Store the best size of every pager handed out that fetched any records"""
+        for endpoint, pager in self._pagers.items():
+            if pager.records:
+                self._sizes[endpoint] = pager.best_size
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._sizes, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
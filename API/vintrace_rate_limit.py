@@ -0,0 +1,266 @@
+"""
+Client-side rate limiting for the Vintrace API
+
+Provides a token bucket combined with an adaptive (AIMD) concurrency limit.
+A single RateLimiter can be shared by several clients and threads:
+
+    limiter = RateLimiter(rate=10, max_concurrency=8)
+    client = VintraceAPIClient(base_url, api_key=key, rate_limiter=limiter)
+
+When the server answers 429 (or reports an exhausted quota through
+rate-limit headers) the limiter pauses all callers until the advertised
+reset time and halves the allowed concurrency. Each run of successful
+responses grows the concurrency back by one slot, up to max_concurrency.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager, asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Mapping
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value into a number of seconds
+
+    Args:
+        value: Header value, either delta-seconds ("120") or an HTTP date
+
+    Returns:
+        Seconds to wait (never negative), or None if the value is missing/invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _header(headers: Mapping[str, str], *names: str) -> Optional[str]:
+    """Return the first header present out of several spellings"""
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket with support for server-imposed pauses"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum burst size (default: one second worth of tokens)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Block all acquisitions for the given number of seconds"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def acquire(self) -> None:
+        """Wait (blocking) until a token is available"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a token is available"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class RateLimiter:
+    """
+    Token bucket plus adaptive concurrency limit, shared across requests
+
+    Concurrency follows additive-increase / multiplicative-decrease: every
+    throttled response halves the limit (down to min_concurrency) and every
+    ``increase_after`` consecutive successes raise it by one (up to
+    max_concurrency).
+    """
+
+    def __init__(self, rate: float = 10.0, burst: Optional[float] = None,
+                 max_concurrency: int = 8, min_concurrency: int = 1,
+                 increase_after: int = 20):
+        """
+        Args:
+            rate: Sustained requests per second (default: 10)
+            burst: Maximum burst of requests (default: one second worth)
+            max_concurrency: Upper bound for requests in flight (default: 8)
+            min_concurrency: Lower bound the limit can shrink to (default: 1)
+            increase_after: Consecutive successes before growing the limit (default: 20)
+        """
+        self.bucket = TokenBucket(rate, burst)
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.increase_after = increase_after
+        self.concurrency = max_concurrency
+        self.throttled_count = 0
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+        # Event loop -> [asyncio.Condition, waiting tasks], while slot_async waiters exist
+        self._async_waiters = {}
+
+    # -----------------------------------------------------------------
+    # Slot acquisition
+    # -----------------------------------------------------------------
+
+    def _try_enter(self) -> bool:
+        with self._cond:
+            if self._in_flight < self.concurrency:
+                self._in_flight += 1
+                return True
+            return False
+
+    def _leave(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+            self._notify_async()
+
+    def _notify_async(self, all_waiters: bool = False) -> None:
+        """Wake slot_async waiters on every event loop (called with self._cond held, from any thread)"""
+        for loop, (cond, _) in self._async_waiters.items():
+            try:
+                loop.call_soon_threadsafe(lambda c=cond, l=loop: l.create_task(self._wake(c, all_waiters)))
+            except RuntimeError:  # loop closed
+                pass
+
+    @staticmethod
+    async def _wake(cond: asyncio.Condition, all_waiters: bool) -> None:
+        async with cond:
+            if all_waiters:
+                cond.notify_all()
+            else:
+                cond.notify()
+
+    @contextmanager
+    def slot(self):
+        """Hold one concurrency slot and one token for the duration of a request"""
+        with self._cond:
+            while self._in_flight >= self.concurrency:
+                self._cond.wait()
+            self._in_flight += 1
+        try:
+            self.bucket.acquire()
+            yield
+        finally:
+            self._leave()
+
+    @asynccontextmanager
+    async def slot_async(self):
+        """Async counterpart of slot() for AsyncVintraceAPIClient"""
+        if not self._try_enter():
+            loop = asyncio.get_running_loop()
+            with self._cond:
+                entry = self._async_waiters.setdefault(loop, [asyncio.Condition(), 0])
+                entry[1] += 1
+            cond = entry[0]
+            try:
+                async with cond:
+                    while not self._try_enter():
+                        await cond.wait()
+            finally:
+                with self._cond:
+                    entry[1] -= 1
+                    if not entry[1] and self._async_waiters.get(loop) is entry:
+                        del self._async_waiters[loop]
+        try:
+            await self.bucket.acquire_async()
+            yield
+        finally:
+            self._leave()
+
+    # -----------------------------------------------------------------
+    # Feedback from responses
+    # -----------------------------------------------------------------
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Adjust the limiter from a response
+
+        Args:
+            status_code: HTTP status of the response
+            headers: Response headers (case-insensitive mapping)
+
+        Returns:
+            Seconds the server asked us to wait, if any
+        """
+        retry_after = parse_retry_after(_header(headers, "Retry-After"))
+        remaining = _header(headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+
+        if status_code == 429:
+            self._on_throttled(retry_after if retry_after is not None else 1.0)
+            return retry_after
+
+        if remaining is not None and remaining.strip() == "0":
+            reset = _header(headers, "X-RateLimit-Reset", "RateLimit-Reset")
+            wait = self._reset_to_seconds(reset)
+            if wait:
+                self.bucket.pause(wait)
+
+        self._on_success()
+        return retry_after
+
+    @staticmethod
+    def _reset_to_seconds(value: Optional[str]) -> Optional[float]:
+        """Reset headers are either seconds-until-reset or an epoch timestamp"""
+        if not value:
+            return None
+        try:
+            reset = float(value)
+        except ValueError:
+            return parse_retry_after(value)
+        if reset > 1e9:  # epoch seconds
+            reset -= time.time()
+        return max(0.0, reset)
+
+    def _on_throttled(self, pause: float) -> None:
+        self.bucket.pause(pause)
+        with self._cond:
+            self.throttled_count += 1
+            self._successes = 0
+            self.concurrency = max(self.min_concurrency, self.concurrency // 2)
+            self._notify_async(all_waiters=True)
+
+    def _on_success(self) -> None:
+        with self._cond:
+            self._successes += 1
+            if self._successes >= self.increase_after and self.concurrency < self.max_concurrency:
+                self.concurrency += 1
+                self._successes = 0
+                self._cond.notify()
+                self._notify_async(all_waiters=True)
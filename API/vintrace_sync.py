@@ -0,0 +1,196 @@
+"""
+Incremental sync of search endpoints using modifiedSince checkpoints
+
+fruit_intake_operation_search and maturity_samples_search accept
+``modifiedSince`` (milliseconds since epoch). IncrementalSync keeps a
+high-water mark per endpoint and set of search criteria in a local
+checkpoint file, fetches only the records added/modified/reversed since that
+mark and upserts them (keyed on operationId) into a local JSON dataset:
+
+    sync = IncrementalSync(client, data_dir=".vintrace_cache/sync")
+    result = sync.sync("intake_operations", vintage="2025")
+    intakes = sync.load_dataset("intake_operations", vintage="2025")
+
+A sync with different criteria (vintage="2024") has its own mark and dataset.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .vintrace_api_client import VintraceAPIClient
+from .vintrace_decode import to_builtins
+
+logger = logging.getLogger(__name__)
+
+# Dataset name -> (client method, results array in the response)
+SYNC_ENDPOINTS: Dict[str, Tuple[str, str]] = {
+    "intake_operations": ("fruit_intake_operation_search", "intakes"),
+    "sample_operations": ("maturity_samples_search", "samples"),
+}
+
+
+def _write_json_atomic(path: str, data: Any) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def iter_search_results(method_func: Callable[..., Dict[str, Any]], results_key: str,
+                        page_size: int = 100, **criteria) -> Iterator[Dict[str, Any]]:
+    """
+    Page through a firstResult/maxResults search endpoint
+
+    Args:
+        method_func: Search method (e.g., client.fruit_intake_operation_search)
+        results_key: Name of the results array in the response (e.g., "intakes")
+        page_size: maxResults per request (default: 100)
+        **criteria: Search criteria passed to every request
+
+    Yields:
+        Each matching record
+    """
+    first_result = 0
+    while True:
+        response = method_func(firstResult=first_result, maxResults=page_size, **criteria)
+        records = to_builtins(VintraceAPIClient._extract_page(response, results_key)[0] or [])
+        yield from records
+        if len(records) < page_size:
+            break
+        next_result = (response.get("nextResult") if isinstance(response, dict)
+                       else getattr(response, "nextResult", None))
+        first_result = next_result or first_result + len(records)
+
+
+def dataset_key(name: str, criteria: Dict[str, Any]) -> str:
+    """
+    Checkpoint/dataset key for a dataset and its search criteria
+
+    Each criteria combination (vintage, wineryId, ...) is a separate dataset
+    with its own high-water mark; without criteria the key is the name.
+    """
+    active = {k: v for k, v in sorted(criteria.items()) if v is not None}
+    if not active:
+        return name
+    digest = hashlib.sha1(json.dumps(active, default=str).encode("utf-8")).hexdigest()[:12]
+    return f"{name}-{digest}"
+
+
+class CheckpointStore:
+    """High-water marks per dataset key (see dataset_key), persisted to a small JSON file"""
+
+    def __init__(self, path: str = ".vintrace_cache/sync/checkpoints.json"):
+        self.path = path
+        self._marks: Dict[str, int] = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self._marks = json.load(f)
+
+    def get(self, name: str) -> Optional[int]:
+        """Return the high-water mark (epoch ms) for a dataset, if any"""
+        return self._marks.get(name)
+
+    def set(self, name: str, value: int) -> None:
+        """Persist a new high-water mark"""
+        self._marks[name] = value
+        _write_json_atomic(self.path, self._marks)
+
+    def reset(self, name: str) -> None:
+        """Forget a dataset's mark so the next sync is a full fetch"""
+        self._marks.pop(name, None)
+        _write_json_atomic(self.path, self._marks)
+
+
+class SyncResult(NamedTuple):
+    name: str
+    fetched: int
+    total: int
+    since: Optional[int]
+    high_water_mark: Optional[int]
+
+
+class IncrementalSync:
+    """Fetch only records modified since the last run and upsert them locally"""
+
+    def __init__(self, client: VintraceAPIClient, data_dir: str = ".vintrace_cache/sync",
+                 store: Optional[CheckpointStore] = None, page_size: int = 100):
+        """
+        Args:
+            client: Configured VintraceAPIClient instance
+            data_dir: Directory for the datasets and checkpoint file
+            store: Checkpoint store (default: data_dir/checkpoints.json)
+            page_size: maxResults per request (default: 100)
+        """
+        self.client = client
+        self.data_dir = data_dir
+        self.store = store or CheckpointStore(os.path.join(data_dir, "checkpoints.json"))
+        self.page_size = page_size
+
+    def _dataset_path(self, key: str) -> str:
+        return os.path.join(self.data_dir, f"{key}.json")
+
+    def _load_records(self, key: str) -> Dict[str, Dict[str, Any]]:
+        path = self._dataset_path(key)
+        if not os.path.exists(path):
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def load_dataset(self, name: str, **criteria) -> List[Dict[str, Any]]:
+        """Return every record synced so far for a dataset and the criteria it was synced with"""
+        return list(self._load_records(dataset_key(name, criteria)).values())
+
+    def sync(self, name: str, full: bool = False, **criteria) -> SyncResult:
+        """
+        Bring a local dataset up to date
+
+        The new high-water mark is the largest ``modified`` timestamp seen
+        (server time), so client clock skew cannot skip records. Records
+        modified exactly at the mark are fetched again and upserted
+        idempotently. Without ``modified`` timestamps no mark is kept and
+        every run is a full fetch.
+
+        A full fetch (``full=True`` or no checkpoint yet) replaces the local
+        dataset instead of merging into it, which is what drops records
+        deleted or reversed on the server since the last full run.
+
+        Args:
+            name: Dataset name, a key of SYNC_ENDPOINTS
+            full: Ignore the checkpoint, fetch everything and replace the dataset (default: False)
+            **criteria: Extra search criteria (vintage, wineryId, ...); each
+                combination is checkpointed and stored separately
+
+        Returns:
+            SyncResult with counts and the marks used
+        """
+        method_name, results_key = SYNC_ENDPOINTS[name]
+        method_func = getattr(self.client, method_name)
+        key = dataset_key(name, criteria)
+        since = None if full else self.store.get(key)
+        if since is not None:
+            criteria["modifiedSince"] = str(since)
+
+        records = {} if since is None else self._load_records(key)
+        high_water_mark = since
+        fetched = 0
+
+        for record in iter_search_results(method_func, results_key, self.page_size, **criteria):
+            records[str(record.get("operationId"))] = record
+            fetched += 1
+            modified = record.get("modified")
+            if isinstance(modified, (int, float)):
+                high_water_mark = max(high_water_mark or 0, int(modified))
+
+        _write_json_atomic(self._dataset_path(key), records)
+        if high_water_mark is not None:
+            self.store.set(key, high_water_mark)
+        elif full:
+            # No modified timestamps: the client clock is no safe substitute, so drop any old mark
+            self.store.reset(key)
+
+        logger.info(f"Synced {name}: {fetched} changed records since {since}, {len(records)} total")
+        return SyncResult(name, fetched, len(records), since, high_water_mark)
@@ -0,0 +1,299 @@
+"""
+Sharded fetching and day-partitioned caching of transaction_search results
+
+transaction_search has no pagination, so a long period is split into day or
+week shards that are fetched concurrently and merged with de-duplication.
+A shard that keeps failing (e.g. timing out) is split in half and retried.
+
+Operations completed on days well in the past no longer change, so each
+closed day is fetched once and stored permanently. The most recent
+``open_days`` days are always refetched. Any requested range is assembled by
+merging cached days with freshly fetched ones:
+
+    day_cache = TransactionDayCache(".vintrace_cache/transactions", open_days=3,
+                                    tz="America/Los_Angeles")
+    transactions = day_cache.fetch_range(client, "2023-01-01", "2025-11-11",
+                                         wineryName="Canoe Ridge")
+"""
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, tzinfo
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
+
+import requests
+
+from .vintrace_api_client import VintraceAPIClient
+from .vintrace_decode import to_builtins
+
+logger = logging.getLogger(__name__)
+
+DateLike = Union[str, date]
+TimezoneLike = Union[str, tzinfo, None]
+
+
+def to_date(value: DateLike) -> date:
+    """Accept YYYY-MM-DD strings or date objects"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def iter_days(date_from: DateLike, date_to: DateLike) -> Iterator[date]:
+    """Yield every day from date_from to date_to inclusive"""
+    day, last = to_date(date_from), to_date(date_to)
+    while day <= last:
+        yield day
+        day += timedelta(days=1)
+
+
+def date_shards(date_from: DateLike, date_to: DateLike, chunk_days: int = 7) -> List[Tuple[date, date]]:
+    """Split an inclusive date range into consecutive (start, end) chunks of chunk_days"""
+    start, last = to_date(date_from), to_date(date_to)
+    shards = []
+    while start <= last:
+        end = min(start + timedelta(days=chunk_days - 1), last)
+        shards.append((start, end))
+        start = end + timedelta(days=1)
+    return shards
+
+
+def missing_day_shards(days: List[date], chunk_days: int = 7) -> List[Tuple[date, date]]:
+    """Group sorted days into consecutive runs, each split into (start, end) chunks of chunk_days"""
+    shards = []
+    run_start = previous = None
+    for day in days:
+        if previous is not None and day != previous + timedelta(days=1):
+            shards.extend(date_shards(run_start, previous, chunk_days))
+            run_start = None
+        if run_start is None:
+            run_start = day
+        previous = day
+    if run_start is not None:
+        shards.extend(date_shards(run_start, previous, chunk_days))
+    return shards
+
+
+def to_timezone(tz: TimezoneLike) -> Optional[tzinfo]:
+    """Accept IANA names ("America/Los_Angeles"), tzinfo objects or None (local time)"""
+    return ZoneInfo(tz) if isinstance(tz, str) else tz
+
+
+def transaction_day(transaction: Dict[str, Any], tz: TimezoneLike = None) -> Optional[date]:
+    """
+    Day of a transaction row, from its ``date`` field
+
+    vintrace sends dates as epoch milliseconds or as YYYY-MM-DD strings.
+    dateFrom/dateTo select operations by the winery's local day, so
+    milliseconds are read in the winery's timezone (tz, default: local
+    time). None if the row has no readable date.
+    """
+    value = transaction.get("date")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        tz = to_timezone(tz)
+        if tz is None:
+            return datetime.fromtimestamp(value / 1000).date()
+        return datetime.fromtimestamp(value / 1000, tz=tz).date()
+    if isinstance(value, str):
+        try:
+            return to_date(value[:10])
+        except ValueError:
+            return None
+    return None
+
+
+def transaction_key(transaction: Dict[str, Any]) -> Hashable:
+    """
+    De-duplication key for a transaction row
+
+    Rows carrying a transaction id are keyed on (Op Id, Tx Id). Rows of a
+    multi-vessel operation share the same Op Id, so without a Tx Id only
+    identical rows are treated as duplicates.
+    """
+    op_id = transaction.get("operationId", transaction.get("Op Id", transaction.get("id")))
+    tx_id = transaction.get("transactionId", transaction.get("Tx Id"))
+    if tx_id is not None:
+        return (op_id, tx_id)
+    return json.dumps(transaction, sort_keys=True, default=str)
+
+
+def dedupe_transactions(transactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop duplicate rows (see transaction_key), keeping the first occurrence"""
+    seen = set()
+    unique = []
+    for transaction in transactions:
+        key = transaction_key(transaction)
+        if key not in seen:
+            seen.add(key)
+            unique.append(transaction)
+    return unique
+
+
+def fetch_shard(client: VintraceAPIClient, start: date, end: date, **filters) -> List[Dict[str, Any]]:
+    """
+    Fetch one date shard, splitting it in half if it keeps failing
+
+    The client already retries each request; a shard that still fails is
+    usually too large, so it is divided until single days remain.
+    """
+    try:
+        response = client.transaction_search(dateFrom=start.isoformat(), dateTo=end.isoformat(), **filters)
+        return to_builtins(VintraceAPIClient._extract_page(response)[0])
+    except requests.exceptions.RequestException as e:
+        if start >= end:
+            raise
+        mid = start + (end - start) // 2
+        logger.warning(f"Shard {start}..{end} failed ({e}); splitting into {start}..{mid} and "
+                       f"{mid + timedelta(days=1)}..{end}")
+        return (fetch_shard(client, start, mid, **filters)
+                + fetch_shard(client, mid + timedelta(days=1), end, **filters))
+
+
+def fetch_shards(client: VintraceAPIClient, shards: List[Tuple[date, date]], max_workers: int = 4,
+                 **filters) -> List[List[Dict[str, Any]]]:
+    """Fetch several shards concurrently, returning each shard's rows in shard order"""
+    if not shards:
+        return []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda shard: fetch_shard(client, shard[0], shard[1], **filters), shards))
+
+
+def fetch_transactions_sharded(client: VintraceAPIClient, date_from: DateLike, date_to: DateLike,
+                               chunk_days: int = 7, max_workers: int = 4,
+                               **filters) -> List[Dict[str, Any]]:
+    """
+    Fetch a long transaction_search window as concurrent date shards
+
+    Args:
+        client: VintraceAPIClient to fetch with
+        date_from: First day (YYYY-MM-DD or date)
+        date_to: Last day (YYYY-MM-DD or date)
+        chunk_days: Days per shard, e.g. 1 or 7 (default: 7)
+        max_workers: Shards fetched at once (default: 4)
+        **filters: transaction_search filters (ownerName, batchName, wineryName)
+
+    Returns:
+        De-duplicated transactions for the whole range, in date order
+    """
+    filters = {k: v for k, v in filters.items() if v is not None}
+    shards = date_shards(date_from, date_to, chunk_days)
+    logger.info(f"Fetching transactions {date_from}..{date_to} as {len(shards)} shards "
+                f"of {chunk_days} day(s) with {max_workers} workers")
+    rows = [row for shard_rows in fetch_shards(client, shards, max_workers, **filters) for row in shard_rows]
+    return dedupe_transactions(rows)
+
+
+class TransactionDayCache:
+    """Permanent per-day store of transaction_search results for closed days"""
+
+    def __init__(self, cache_dir: str = ".vintrace_cache/transactions", open_days: int = 3,
+                 tz: TimezoneLike = None):
+        """
+        Args:
+            cache_dir: Directory holding one JSON file per day and filter set
+            open_days: Number of most recent days (including today) that are always
+                refetched because operations may still be added or reversed (default: 3)
+            tz: Winery timezone used to file rows under their day, as an IANA name
+                or tzinfo (default: local time)
+        """
+        self.cache_dir = cache_dir
+        self.open_days = open_days
+        self.tz = to_timezone(tz)
+
+    def is_closed(self, day: date, today: Optional[date] = None) -> bool:
+        """True if the day is old enough that its transactions can no longer change"""
+        today = today or (datetime.now(self.tz).date() if self.tz else date.today())
+        return day <= today - timedelta(days=self.open_days)
+
+    def _partition_dir(self, filters: Dict[str, Any]) -> str:
+        """Separate directory per filter combination (ownerName, batchName, wineryName)"""
+        active = {k: v for k, v in sorted(filters.items()) if v is not None}
+        if not active:
+            return os.path.join(self.cache_dir, "all")
+        digest = hashlib.sha1(json.dumps(active).encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.cache_dir, digest)
+
+    def _day_path(self, day: date, filters: Dict[str, Any]) -> str:
+        return os.path.join(self._partition_dir(filters), f"{day.isoformat()}.json")
+
+    def load(self, day: date, filters: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached transactions for a day, or None if not cached"""
+        path = self._day_path(day, filters)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, day: date, filters: Dict[str, Any], transactions: List[Dict[str, Any]]) -> None:
+        """Store a closed day's transactions (written atomically)"""
+        path = self._day_path(day, filters)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(transactions, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def fetch_range(self, client: VintraceAPIClient, date_from: DateLike, date_to: DateLike,
+                    max_workers: int = 4, chunk_days: int = 7, **filters) -> List[Dict[str, Any]]:
+        """
+        Return all transactions between two dates (inclusive)
+
+        Closed days are read from disk when present; open days are always
+        fetched fresh. Runs of missing days are fetched as concurrent shards of
+        up to chunk_days days, and each shard's rows are split into days by
+        their ``date`` field (in the cache's timezone) so every closed day is
+        stored permanently. A shard
+        with rows that cannot be placed on one of its days (no readable date,
+        or a date outside the shard) is returned but not stored.
+
+        Args:
+            client: VintraceAPIClient used for days that are not cached
+            date_from: First day (YYYY-MM-DD or date)
+            date_to: Last day (YYYY-MM-DD or date)
+            max_workers: Shards fetched at once (default: 4)
+            chunk_days: Most days per shard (default: 7)
+            **filters: transaction_search filters (ownerName, batchName, wineryName)
+
+        Returns:
+            De-duplicated transactions for the whole range, in day order
+        """
+        filters = {k: v for k, v in filters.items() if v is not None}
+        today = datetime.now(self.tz).date() if self.tz else date.today()
+        by_day = {}
+        missing = []
+
+        for day in iter_days(date_from, date_to):
+            cached = self.load(day, filters) if self.is_closed(day, today) else None
+            if cached is None:
+                missing.append(day)
+            else:
+                by_day[day] = cached
+
+        shards = missing_day_shards(missing, chunk_days)
+        fetched = fetch_shards(client, shards, max_workers, **filters)
+        unplaced = []
+        for (start, end), shard_rows in zip(shards, fetched):
+            shard_days = {day: [] for day in iter_days(start, end)}
+            for row in shard_rows:
+                day = transaction_day(row, self.tz)
+                if day not in shard_days:
+                    break
+                shard_days[day].append(row)
+            else:
+                for day, day_transactions in shard_days.items():
+                    by_day[day] = day_transactions
+                    if self.is_closed(day, today):
+                        self.save(day, filters, day_transactions)
+                continue
+            logger.warning(f"Transactions {start}..{end} could not be split by date; not cached")
+            unplaced.extend(shard_rows)
+
+        logger.info(f"Transactions {date_from}..{date_to}: {len(by_day) - len(missing)} days from cache, "
+                    f"{len(missing)} days fetched in {len(shards)} shards")
+        return dedupe_transactions([row for day in sorted(by_day) for row in by_day[day]] + unplaced)
@@ -3,8 +3,19 @@
 import os
 import json
 import logging
+import shutil
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from API.vintrace_metrics import MetricsRecorder
+from API.vintrace_pager import PageSizeStore
+from API.vintrace_rate_limit import parse_retry_after
+from vessel_diff import CHANGE_SET_FILE, diff_snapshots, write_change_set
 
 def setup_logging():
     logging.basicConfig(
@@ -20,11 +31,43 @@ def ensure_dir(dir_path):
     if not os.path.exists(dir_path):
         os.makedirs(dir_path)
 
-def fetch_vessels_page(url, headers, params):
-    """Fetch a single page of vessels with error handling."""
+def create_session(token, pool_size=10, retries=3):
+    """
+    Keep-alive session with its own connection pool; retries 429/5xx with backoff,
+    honouring Retry-After (retries=0 for callers that retry themselves).
+    """
+    session = requests.Session()
+    session.headers.update({"Authorization": f"Bearer {token}", "Accept": "application/json"})
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ) if retries else 0
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def timed_get(session, url, metrics=None, endpoint=None, **kwargs):
+    """GET through the shared session, recording latency/size/retries when metrics are given."""
+    start = time.perf_counter()
+    response = session.get(url, timeout=30, **kwargs)
+    if metrics is not None:
+        retries = response.raw.retries if response.raw is not None else None
+        metrics.record_response("GET", endpoint or url, response, time.perf_counter() - start,
+                                attempt=len(retries.history) if retries else 0)
+    return response
+
+def fetch_vessels_page(session, url, params, with_size=False, metrics=None, endpoint=None):
+    """Fetch a single page of vessels with error handling (optionally with the body size)."""
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = timed_get(session, url, metrics, endpoint, params=params)
         response.raise_for_status()
+        if with_size:
+            return response.json(), len(response.content)
         return response.json()
     except requests.exceptions.Timeout:
         logger.error("Request timed out")
@@ -33,13 +76,246 @@ def fetch_vessels_page(url, headers, params):
         logger.error(f"Request failed: {e}")
         raise
 
-def fetch_barrel_group_details(base_url, headers, barrel_group_id):
+class VesselStaging:
+    """
+    Completed report pages kept on disk so an interrupted fetch can resume.
+
+    Each page is written to its own file in staging_dir and recorded in
+    manifest.json (offset -> vessel count). Staging left by an earlier run is
+    reused only if it is for the same totalResults/extraFields and younger
+    than max_age_hours; otherwise it is discarded and the fetch starts over.
+    Vessels inserted or deleted in between shift the offsets even when the
+    total is unchanged, so the caller probes the staged pages before resuming
+    (staged_pages_unshifted), checks the assembled ids (check_snapshot) and
+    discards the staging if either does not line up.
+    """
+
+    def __init__(self, staging_dir, total_results, extra_fields, max_age_hours=12.0):
+        self.staging_dir = staging_dir
+        self.manifest_path = os.path.join(staging_dir, "manifest.json")
+        manifest = None
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable staging manifest: {e}")
+        if manifest is not None:
+            age_hours = (time.time() - manifest.get("started", 0)) / 3600
+            if manifest.get("total_results") != total_results or manifest.get("extra_fields") != extra_fields:
+                logger.info("Staged pages are for a different snapshot (totalResults changed); starting over")
+                manifest = None
+            elif age_hours > max_age_hours:
+                logger.info(f"Staged pages are {age_hours:.1f}h old; starting over")
+                manifest = None
+        if manifest is None:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            manifest = {"started": time.time(), "total_results": total_results,
+                        "extra_fields": extra_fields, "pages": {}}
+        os.makedirs(staging_dir, exist_ok=True)
+        self.manifest = manifest
+
+    def _page_path(self, offset):
+        return os.path.join(self.staging_dir, f"page_{offset:07d}.json")
+
+    @staticmethod
+    def _write_atomic(path, data):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def covered(self):
+        """(offset, count) of every staged page whose file is present."""
+        return [(int(offset), count) for offset, count in self.manifest["pages"].items()
+                if os.path.exists(self._page_path(int(offset)))]
+
+    def staged_count(self):
+        return sum(count for _, count in self.covered())
+
+    def save_page(self, offset, vessels):
+        """Write the page first, then record it, so the manifest never lists a missing page."""
+        self._write_atomic(self._page_path(offset), vessels)
+        self.manifest["pages"][str(offset)] = len(vessels)
+        self._write_atomic(self.manifest_path, self.manifest)
+
+    def last_vessel_id(self, offset):
+        """Id of the last vessel of a staged page."""
+        with open(self._page_path(offset), "r", encoding="utf-8") as f:
+            vessels = json.load(f)
+        return vessels[-1].get("id") if vessels else None
+
+    def load_vessels(self):
+        """All staged vessels in offset order."""
+        vessels = []
+        for offset, _ in sorted(self.covered()):
+            with open(self._page_path(offset), "r", encoding="utf-8") as f:
+                vessels.extend(json.load(f))
+        return vessels
+
+    def discard(self):
+        """Drop every staged page."""
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+    def promote(self, output_path, vessels):
+        """Atomically replace output_path with the complete snapshot, then drop the staging."""
+        tmp_path = output_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(vessels, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, output_path)
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+def check_snapshot(vessels, total_results):
+    """
+    De-duplicate vessels by id (first occurrence wins).
+
+    Returns:
+        (unique_vessels, duplicates, consistent) - consistent is False if ids
+        repeat or the unique count differs from totalResults, i.e. the offsets
+        shifted while the pages were fetched
+    """
+    seen = set()
+    unique = []
+    for vessel in vessels:
+        vessel_id = vessel.get("id")
+        if vessel_id in seen:
+            continue
+        seen.add(vessel_id)
+        unique.append(vessel)
+    duplicates = len(vessels) - len(unique)
+    return unique, duplicates, duplicates == 0 and len(unique) == total_results
+
+def staged_pages_unshifted(session, url, params, staging, max_workers=4, metrics=None, endpoint=None):
+    """
+    Check that every staged page still ends at the same vessel.
+
+    An insert or delete before a page's last offset shifts the vessel found
+    there, so one limit=1 request per staged page detects offsets that moved
+    since the page was staged.
+    """
+    def probe(page):
+        offset, count = page
+        if not count:
+            return True
+        result = fetch_vessels_page(session, url, dict(params, offset=offset + count - 1, limit=1),
+                                    metrics=metrics, endpoint=endpoint)
+        current = result.get("results", [])
+        return bool(current) and current[0].get("id") == staging.last_vessel_id(offset)
+
+    pages = staging.covered()
+    if not pages:
+        return True
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return all(executor.map(probe, pages))
+
+def fetch_total_results(session, url, extra_fields, metrics=None, endpoint=None):
+    """totalResults of the vessel report (a one-vessel page)."""
+    params = {
+        "limit": 1,
+        "offset": 0,
+        "extraFields": extra_fields
+    }
+    result = fetch_vessels_page(session, url, params, metrics=metrics, endpoint=endpoint)
+    return result.get("totalResults", 0)
+
+def missing_ranges(total_results, covered, page_size):
+    """Split the offsets in [0, total_results) not covered by (offset, count) pages into pages."""
+    ranges = []
+    position = 0
+    for offset, count in sorted(covered) + [(total_results, 0)]:
+        end = min(offset, total_results)
+        while position < end:
+            limit = min(page_size, end - position)
+            ranges.append((position, limit))
+            position += limit
+        position = max(position, offset + count)
+    return ranges
+
+def fetch_vessel_pages_concurrently(session, url, params, total_results, page_size, max_workers=4,
+                                    max_attempts=5, metrics=None, endpoint=None, pager=None,
+                                    staging=None):
+    """
+    Fetch every offset of the vessel report through a bounded thread pool.
+
+    All offsets are known from total_results, so they are queued up front.
+    A failed page is re-queued (after Retry-After, or a growing delay) instead
+    of aborting the run; this is the only retry layer, so session should be
+    created with retries=0. A page the server returns short is completed by
+    queueing the rest.
+    Pages are assembled in offset order. With a VesselStaging, pages it
+    already holds are skipped and every new page is saved to it.
+
+    Returns:
+        (vessels, failed_offsets) - failed_offsets lists pages that still
+        failed after max_attempts
+    """
+    pages = {}
+    attempts = {}
+    delays = {}
+    failed_offsets = []
+    covered = staging.covered() if staging is not None else []
+    queue = deque(missing_ranges(total_results, covered, page_size))
+    fetched = sum(count for _, count in covered)
+
+    def fetch(offset, limit, delay):
+        if delay:
+            time.sleep(delay)
+        start = time.perf_counter()
+        result, nbytes = fetch_vessels_page(session, url, dict(params, offset=offset, limit=limit),
+                                            with_size=True, metrics=metrics, endpoint=endpoint)
+        return result.get("results", []), time.perf_counter() - start, nbytes
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+        while queue or pending:
+            while queue and len(pending) < max_workers * 2:
+                offset, limit = queue.popleft()
+                future = executor.submit(fetch, offset, limit, delays.pop(offset, 0))
+                pending[future] = (offset, limit)
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                offset, limit = pending.pop(future)
+                try:
+                    vessels, elapsed, nbytes = future.result()
+                except Exception as e:
+                    attempts[offset] = attempts.get(offset, 0) + 1
+                    if attempts[offset] >= max_attempts:
+                        logger.error(f"❌ Giving up on offset {offset} after {attempts[offset]} attempts: {e}")
+                        failed_offsets.append(offset)
+                    else:
+                        response = getattr(e, "response", None)
+                        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+                        delays[offset] = retry_after if retry_after is not None else min(2 ** attempts[offset], 30)
+                        logger.warning(f"Re-queueing offset {offset} (attempt {attempts[offset]}, "
+                                       f"in {delays[offset]:.0f}s): {e}")
+                        queue.append((offset, limit))
+                    continue
+                pages[offset] = vessels
+                if staging is not None:
+                    staging.save_page(offset, vessels)
+                fetched += len(vessels)
+                more = 0 < len(vessels) < limit
+                if pager is not None:
+                    pager.observe(limit, len(vessels), elapsed, nbytes, more)
+                if more:
+                    # The server capped the page; fetch the remainder as its own page
+                    queue.append((offset + len(vessels), limit - len(vessels)))
+                logger.info(f"Retrieved {len(vessels)} vessels at offset {offset} "
+                            f"(Progress: {fetched}/{total_results})")
+
+    if staging is not None:
+        vessels = staging.load_vessels()
+    else:
+        vessels = [vessel for offset in sorted(pages) for vessel in pages[offset]]
+    return vessels, sorted(failed_offsets)
+
+def fetch_barrel_group_details(session, base_url, barrel_group_id, metrics=None):
     """Fetch detailed information for a specific barrel group."""
     endpoint = f"/smwe/api/v7/vessel/barrel-groups/{barrel_group_id}"
     url = base_url + endpoint
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = timed_get(session, url, metrics, endpoint)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.Timeout:
@@ -49,6 +325,38 @@ def fetch_barrel_group_details(base_url, headers, barrel_group_id):
         logger.error(f"Failed to fetch barrel group {barrel_group_id}: {e}")
         return None
 
+def fetch_barrel_groups_concurrently(session, base_url, barrel_groups, max_workers=8, metrics=None):
+    """
+    Fetch barrel group details through a bounded thread pool.
+
+    Returns the details that were fetched, in the same order as barrel_groups;
+    progress (count, rate, failures) is logged as results come in.
+    """
+    total = len(barrel_groups)
+    details = [None] * total
+    failed = 0
+    start = time.perf_counter()
+    log_every = max(1, total // 20)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(fetch_barrel_group_details, session, base_url, bg.get("id"), metrics): idx
+            for idx, bg in enumerate(barrel_groups)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            idx = futures[future]
+            details[idx] = future.result()
+            if details[idx] is None:
+                failed += 1
+                logger.warning(f"  ⚠️ Failed to fetch details for barrel group {barrel_groups[idx].get('id')} "
+                               f"({barrel_groups[idx].get('name')})")
+            if done % log_every == 0 or done == total:
+                elapsed = time.perf_counter() - start
+                logger.info(f"Barrel groups: {done}/{total} ({done / total:.0%}) "
+                            f"{done / elapsed if elapsed else 0:.1f}/s, {failed} failed")
+
+    return [d for d in details if d]
+
 if __name__ == "__main__":
     load_dotenv()
     VINTRACE_API_TOKEN = os.getenv("VINTRACE_API_TOKEN")
@@ -65,70 +373,114 @@ if __name__ == "__main__":
     ensure_dir(output_dir)
     output_path = os.path.join(output_dir, "vessels.json")
 
-    headers = {
-        "Authorization": f"Bearer {VINTRACE_API_TOKEN}"
-    }
+    # One keep-alive session (and connection pool) for the total and the detail fetches, which
+    # urllib3 retries. Report pages get their own session without urllib3 retries:
+    # fetch_vessel_pages_concurrently re-queues failed pages itself.
+    detail_workers = int(os.getenv("VESSEL_DETAIL_WORKERS", "8"))
+    page_workers = int(os.getenv("VESSEL_PAGE_WORKERS", "4"))
+    session = create_session(VINTRACE_API_TOKEN, pool_size=detail_workers)
+    page_session = create_session(VINTRACE_API_TOKEN, pool_size=page_workers, retries=0)
+    metrics = MetricsRecorder()
 
     # Extra fields to include in the API response
     extra_fields = "composition,allocations,livemetrics"
 
-    # First, get totalResults
-    params = {
-        "limit": 1,
-        "offset": 0,
-        "extraFields": extra_fields
-    }
-    
-    logger.info(f"Getting total number of vessels from {url} ...")
-    try:
-        result = fetch_vessels_page(url, headers, params)
-        total_results = result.get("totalResults", 0)
-        logger.info(f"Total vessels to fetch: {total_results}")
-    except Exception as e:
-        logger.error(f"❌ Error fetching totalResults: {e}")
-        exit(1)
-
-    # Now, fetch all vessels in batches
-    limit = 200
-    offset = 0
-    all_vessels = []
+    # Every offset is queued up front and fetched concurrently. The page size is the
+    # best one remembered from earlier runs (VESSEL_PAGE_MAX bounds it).
+    page_sizes = PageSizeStore(os.path.join("Main", "data", "page_sizes.json"))
+    pager = page_sizes.pager(f"GET {endpoint_path}", initial=200,
+                             max_size=int(os.getenv("VESSEL_PAGE_MAX", "1000")))
+    page_size = pager.next_size()
 
-    logger.info(f"Fetching all vessels ({total_results}) from {url} with paginated params")
+    # Completed pages are staged on disk; a rerun after a crash only fetches the
+    # missing offsets (VESSEL_RESUME=0 always starts over)
+    staging_dir = os.path.join(output_dir, ".staging")
+    if os.getenv("VESSEL_RESUME", "1") == "0":
+        shutil.rmtree(staging_dir, ignore_errors=True)
 
-    while offset < total_results:
-        params = {
-            "extraFields": extra_fields,
-            "limit": limit,
-            "offset": offset,
-        }
-        logger.info(f"Requesting offset {offset} (Progress: {offset}/{total_results})")
+    # A second pass refetches everything if vessels were inserted or deleted while
+    # (or since) the pages were fetched and the offsets no longer line up
+    for snapshot_attempt in (1, 2):
+        logger.info(f"Getting total number of vessels from {url} ...")
         try:
-            result = fetch_vessels_page(url, headers, params)
-            vessels = result.get("results", [])
-            
-            if not vessels:
-                logger.info("No more vessels returned, stopping pagination.")
-                break
+            total_results = fetch_total_results(session, url, extra_fields, metrics, endpoint_path)
+            logger.info(f"Total vessels to fetch: {total_results}")
+        except Exception as e:
+            logger.error(f"❌ Error fetching totalResults: {e}")
+            exit(1)
 
-            all_vessels.extend(vessels)
-            logger.info(f"Retrieved {len(vessels)} vessels at offset {offset}")
+        staging = VesselStaging(staging_dir, total_results, extra_fields,
+                                max_age_hours=float(os.getenv("VESSEL_STAGING_MAX_AGE_HOURS", "12")))
+        already_staged = staging.staged_count()
+        if already_staged:
+            try:
+                unshifted = staged_pages_unshifted(session, url, {"extraFields": extra_fields}, staging,
+                                                   page_workers, metrics, endpoint_path)
+            except Exception as e:
+                logger.error(f"❌ Error checking the staged pages: {e}")
+                exit(1)
+            if unshifted:
+                logger.info(f"Resuming: {already_staged} vessels already staged in {staging_dir}")
+            else:
+                logger.info("Vessels were added or removed since the pages were staged; starting over")
+                staging.discard()
+                staging = VesselStaging(staging_dir, total_results, extra_fields)
 
-            offset += limit
+        logger.info(f"Fetching all vessels ({total_results}) from {url} "
+                    f"in pages of {page_size} with {page_workers} workers")
 
-        except Exception as e:
-            logger.error(f"❌ Error fetching vessels at offset {offset}: {e}")
-            logger.warning(f"Partial data saved: {len(all_vessels)} vessels collected so far")
+        start = time.perf_counter()
+        fetched_vessels, failed_offsets = fetch_vessel_pages_concurrently(
+            page_session, url, {"extraFields": extra_fields}, total_results, page_size,
+            max_workers=page_workers, metrics=metrics, endpoint=endpoint_path, pager=pager,
+            staging=staging
+        )
+        page_sizes.save()
+        logger.info(f"Fetched {len(fetched_vessels)} vessels in {time.perf_counter() - start:.1f}s")
+
+        if failed_offsets or missing_ranges(total_results, staging.covered(), page_size):
+            # Keep the previous vessels.json; the staged pages are picked up by the next run
+            logger.error(f"❌ Snapshot incomplete: {len(fetched_vessels)}/{total_results} vessels staged, "
+                         f"pages at offsets {failed_offsets} failed. Rerun to resume from {staging_dir}")
+            metrics.log_summary(logger)
+            exit(1)
+
+        all_vessels, duplicates, consistent = check_snapshot(fetched_vessels, total_results)
+        if consistent:
             break
+        logger.warning(f"⚠️ Offsets shifted while fetching: {duplicates} duplicate ids, "
+                       f"{len(all_vessels)}/{total_results} unique vessels; discarding the staged pages")
+        staging.discard()
+        if snapshot_attempt == 2:
+            logger.error("❌ Vessel list kept changing; keeping the previous vessels.json")
+            metrics.log_summary(logger)
+            exit(1)
+        logger.info("Refetching all pages")
+
+    # Compare with the previous snapshot (by vessel id and detailsAsAt) so the melt
+    # step can reprocess only the vessels that were added, changed or removed
+    previous_vessels = None
+    if os.path.exists(output_path):
+        try:
+            with open(output_path, "r", encoding="utf-8") as f:
+                previous_vessels = json.load(f)
+        except (IOError, ValueError) as e:
+            logger.warning(f"Could not read the previous snapshot for diffing: {e}")
+    change_set = diff_snapshots(previous_vessels, all_vessels)
 
-    # Save all vessels
+    # Promote the complete snapshot to vessels.json in one atomic step
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(all_vessels, f, indent=2, ensure_ascii=False)
+        staging.promote(output_path, all_vessels)
         logger.info(f"✅ Saved {len(all_vessels)} vessels to {output_path}")
     except IOError as e:
         logger.error(f"❌ Error writing vessels file: {e}")
         exit(1)
 
+    change_set_path = os.path.join(output_dir, CHANGE_SET_FILE)
+    write_change_set(change_set, change_set_path)
+    logger.info(f"✅ Change set: {len(change_set['added'])} added, {len(change_set['changed'])} changed, "
+                f"{len(change_set['removed'])} removed, {change_set['unchanged']} unchanged -> {change_set_path}")
+
     # Write first 10 records to a sample file
     sample_output_path = os.path.join(output_dir, "vessels_sample.json")
     sample_vessels = all_vessels[:10] if len(all_vessels) >= 10 else all_vessels
@@ -151,21 +503,10 @@ if __name__ == "__main__":
     logger.info(f"Found {len(barrel_groups)} barrel groups")
     
     if barrel_groups:
-        barrel_group_details = []
-        
-        for idx, barrel_group in enumerate(barrel_groups, 1):
-            barrel_group_id = barrel_group.get("id")
-            barrel_group_name = barrel_group.get("name")
-            
-            logger.info(f"Fetching barrel group {idx}/{len(barrel_groups)}: ID={barrel_group_id}, Name={barrel_group_name}")
-            
-            details = fetch_barrel_group_details(BASE_URL, headers, barrel_group_id)
-            
-            if details:
-                barrel_group_details.append(details)
-                logger.info(f"  ✅ Successfully fetched details for barrel group {barrel_group_id}")
-            else:
-                logger.warning(f"  ⚠️ Failed to fetch details for barrel group {barrel_group_id}")
+        logger.info(f"Fetching barrel group details with {detail_workers} workers")
+        barrel_group_details = fetch_barrel_groups_concurrently(
+            session, BASE_URL, barrel_groups, max_workers=detail_workers, metrics=metrics
+        )
         
         # Save barrel group details
         barrel_output_path = os.path.join(output_dir, "barrel_groups.json")
@@ -197,4 +538,6 @@ if __name__ == "__main__":
     logger.info(f"Barrel groups found: {len(barrel_groups)}")
     if barrel_groups:
         logger.info(f"Barrel group details fetched: {len(barrel_group_details)}")
-    logger.info("="*60)
\ No newline at end of file
+    logger.info("="*60)
+
+    metrics.log_summary(logger)
@@ -10,6 +10,10 @@ Usage:
     
     Or with specific filters:
     python fetch_transactions_for_analysis.py --from-date 2024-01-01 --batch-name "24CABSAUV*"
+
+Closed days are cached permanently under --cache-dir, so repeated runs over
+long ranges only call the API for the last --open-days days and for days not
+yet cached. Use --no-cache to always fetch the whole range.
 """
 
 import sys
@@ -21,7 +25,7 @@ import logging
 
 # Import the API client
 try:
-    from API import create_client_from_env, VintraceDataFetcher
+    from API import create_client_from_env, VintraceDataFetcher, TransactionDayCache
 except ImportError:
     print("ERROR: Could not import Vintrace API client")
     print("Make sure the API module is available in the API/ directory")
@@ -35,13 +39,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def fetch_transactions(from_date: str, to_date: str, **filters) -> list:
+def fetch_transactions(from_date: str, to_date: str, day_cache: TransactionDayCache = None,
+                       chunk_days: int = 7, workers: int = 4, **filters) -> list:
     """
     Fetch transactions from Vintrace API
     
+    The range is fetched as concurrent date shards (with a day cache, only
+    the days not yet cached) instead of one request for the whole period.
+    
     Args:
         from_date: Start date in YYYY-MM-DD format
         to_date: End date in YYYY-MM-DD format
+        day_cache: Per-day cache to merge closed days from (optional)
+        chunk_days: Days per shard (default: 7)
+        workers: Number of shards fetched concurrently (default: 4)
         **filters: Additional filters (ownerName, batchName, wineryName)
         
     Returns:
@@ -53,18 +64,31 @@ def fetch_transactions(from_date: str, to_date: str, **filters) -> list:
     
     logger.info(f"Fetching transactions from {from_date} to {to_date}")
     
-    # Call the transaction search API
-    response = client.transaction_search(
-        dateFrom=from_date,
-        dateTo=to_date,
+    if day_cache is not None:
+        transactions = day_cache.fetch_range(
+            client,
+            from_date,
+            to_date,
+            max_workers=workers,
+            chunk_days=chunk_days,
+            ownerName=filters.get('owner_name'),
+            batchName=filters.get('batch_name'),
+            wineryName=filters.get('winery_name')
+        )
+        logger.info(f"Retrieved {len(transactions)} transactions")
+        return transactions
+    
+    # Call the transaction search API in concurrent date shards
+    transactions = fetcher.search_transactions_sharded(
+        from_date,
+        to_date,
+        chunk_days=chunk_days,
+        max_workers=workers,
         ownerName=filters.get('owner_name'),
         batchName=filters.get('batch_name'),
         wineryName=filters.get('winery_name')
     )
     
-    # Extract transactions from the response
-    transactions = response.get('items', []) if isinstance(response, dict) else response
-    
     logger.info(f"Retrieved {len(transactions)} transactions")
     return transactions
 
@@ -186,6 +210,47 @@ def main():
         default=None
     )
     
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        help='Directory for the per-day transaction cache',
+        default='.vintrace_cache/transactions'
+    )
+    
+    parser.add_argument(
+        '--open-days',
+        type=int,
+        help='Most recent days that are always refetched (default: 3)',
+        default=3
+    )
+    
+    parser.add_argument(
+        '--timezone',
+        type=str,
+        help='Winery timezone for filing cached transactions by day, e.g. America/Los_Angeles (default: local time)',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--chunk-days',
+        type=int,
+        help='Days per request shard (default: 7)',
+        default=7
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Number of shards fetched concurrently (default: 4)',
+        default=4
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Fetch the whole range from the API without using the day cache'
+    )
+    
     parser.add_argument(
         '--output',
         type=str,
@@ -207,9 +272,15 @@ def main():
             'winery_name': args.winery_name
         }
         
+        day_cache = None if args.no_cache else TransactionDayCache(args.cache_dir, open_days=args.open_days,
+                                                                         tz=args.timezone)
+        
         api_transactions = fetch_transactions(
             args.from_date,
             args.to_date,
+            day_cache=day_cache,
+            chunk_days=args.chunk_days,
+            workers=args.workers,
             **{k: v for k, v in filters.items() if v is not None}
         )
         
@@ -7,25 +7,27 @@ import time
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def fetch_and_save_workorder(wo_id, url, headers, detail_path, max_retries=3):
+from API.vintrace_rate_limit import RateLimiter
+
+def fetch_and_save_workorder(wo_id, url, headers, detail_path, limiter, max_retries=3):
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, headers=headers)
+            # The shared limiter paces all workers and waits out any Retry-After pause
+            with limiter.slot():
+                response = requests.get(url, headers=headers)
+            retry_after = limiter.observe(response.status_code, response.headers)
             print(f"Status Code: {response.status_code} | wo_id: {wo_id} | URL: {url}")
             if response.status_code == 200:
                 with open(detail_path, "w", encoding="utf-8") as f:
                     json.dump(response.json(), f, indent=2, ensure_ascii=False)
                 return True
-            else:
-                # Save error info for troubleshooting
-                with open(detail_path, "w", encoding="utf-8") as f:
-                    json.dump({"error": response.text, "status_code": response.status_code}, f, indent=2, ensure_ascii=False)
-                if response.status_code == 429:
-                    print("Rate limit hit, sleeping for 10 seconds.")
-                    time.sleep(10)
-                else:
-                    time.sleep(0.5)
-                return False  # Don't retry except for network errors
+            if response.status_code == 429 and attempt < max_retries - 1:
+                print(f"Rate limit hit for wo_id {wo_id}, retrying (Retry-After: {retry_after}).")
+                continue
+            # Save error info for troubleshooting
+            with open(detail_path, "w", encoding="utf-8") as f:
+                json.dump({"error": response.text, "status_code": response.status_code}, f, indent=2, ensure_ascii=False)
+            return False  # Only 429s and network errors are retried
         except requests.RequestException as e:
             print(f"Network error for wo_id {wo_id} (attempt {attempt+1}/{max_retries}): {e}")
             if attempt < max_retries - 1:
@@ -72,18 +74,25 @@ def main():
 
     max_workers = 5  # Number of concurrent API calls
 
+    # Shared across workers: shrinks concurrency on 429s and grows it back afterwards
+    limiter = RateLimiter(
+        rate=float(os.getenv("VINTRACE_RATE_LIMIT", "10")),
+        max_concurrency=max_workers
+    )
+
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         futures = []
         for wo_id in ids_to_fetch:
             url = f"{BASE_URL}/smwe/api/v6/workorders/{wo_id}"
             detail_path = os.path.join(output_dir, f"{wo_id}.json")
-            futures.append(executor.submit(fetch_and_save_workorder, wo_id, url, headers, detail_path))
+            futures.append(executor.submit(fetch_and_save_workorder, wo_id, url, headers, detail_path, limiter))
 
         # (Optional) You can track progress here, as_completed yields futures as they complete
         for i, future in enumerate(as_completed(futures), 1):
             _ = future.result()  # You could check the return value if you want
-            if i % max_workers == 0:
-                time.sleep(0.5)  # Small delay to avoid hammering the API
+
+    if limiter.throttled_count:
+        print(f"Server throttled {limiter.throttled_count} requests; final concurrency {limiter.concurrency}.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,7 +5,11 @@ import json
 import logging
 from dotenv import load_dotenv
 from datetime import datetime
-from utils.endpoint_caller import EndpointCaller, setup_error_logger, setup_metrics_logger
+
+from API.vintrace_api_client import VintraceAPIClient
+from API.vintrace_metrics import MetricsRecorder, JSONLinesExporter
+from API.vintrace_pager import Page, PageSizeStore
+from API.vintrace_rate_limit import RateLimiter
 
 def setup_logging():
     logging.basicConfig(
@@ -15,8 +19,6 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 logger = setup_logging()
-metrics_logger = setup_metrics_logger("metrics.log")
-error_logger = setup_error_logger("error.log")
 
 def setup_all_logger(logfile="Log_All.log"):
     all_logger = logging.getLogger("all_logger")
@@ -31,6 +33,19 @@ def setup_all_logger(logfile="Log_All.log"):
 
 all_logger = setup_all_logger("Log_All.log")
 
+def setup_error_logger(logfile="error.log"):
+    error_logger = logging.getLogger("error_logger")
+    error_logger.setLevel(logging.ERROR)
+    if not any(isinstance(h, logging.FileHandler) and h.baseFilename.endswith(logfile) for h in error_logger.handlers):
+        fh = logging.FileHandler(logfile, encoding="utf-8")
+        fh.setLevel(logging.ERROR)
+        formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+        fh.setFormatter(formatter)
+        error_logger.addHandler(fh)
+    return error_logger
+
+error_logger = setup_error_logger("error.log")
+
 def ensure_dir(dir_path):
     if not os.path.exists(dir_path):
         os.makedirs(dir_path)
@@ -76,12 +91,9 @@ if __name__ == "__main__":
     output_dir = "Main/data/GET--work_orders_paged"
     ensure_dir(output_dir)
 
-    headers = {}
-    if VINTRACE_API_TOKEN:
-        headers["Authorization"] = f"Bearer {VINTRACE_API_TOKEN}"
-
+    # WORK_ORDER_LIMIT is only the starting page size; the pager tunes it from there
     limit = int(os.getenv("WORK_ORDER_LIMIT", "100"))
-    offset = 0
+    max_limit = int(os.getenv("WORK_ORDER_MAX_LIMIT", "1000"))
     max_offset = int(os.getenv("WORK_ORDER_MAX_OFFSET", "10000"))
 
     scheduled_since = os.getenv("WORK_ORDER_SCHEDULED_SINCE", "2025-08-25")
@@ -90,40 +102,64 @@ if __name__ == "__main__":
     logger.info(f"Fetching work orders paged using limit/offset and scheduledSince. limit={limit}, max_offset={max_offset}, scheduledSince={scheduled_since_val}")
     all_logger.info(f"Fetching work orders paged using limit/offset and scheduledSince. limit={limit}, max_offset={max_offset}, scheduledSince={scheduled_since_val}")
 
-    endpoint_caller = EndpointCaller(
-        logger=logger,
-        metrics_logger=metrics_logger,
-        error_logger=error_logger
+    # One event per request in metrics.jsonl, plus a per-endpoint summary at the end
+    metrics = MetricsRecorder()
+    metrics_exporter = JSONLinesExporter("metrics.jsonl")
+    metrics.add_listener(metrics_exporter)
+    # Size of the latest response body, for the pager's bytes-per-record estimate
+    last_response = {"bytes": 0}
+    metrics.add_listener(lambda event: last_response.update(bytes=event.bytes))
+
+    # The client retries timeouts, 429s (honouring Retry-After) and 5xx responses,
+    # paced by a shared RateLimiter, and reports every attempt to the metrics recorder
+    client = VintraceAPIClient(
+        BASE_URL,
+        api_key=VINTRACE_API_TOKEN,
+        timeout=60,
+        max_retries=int(os.getenv("WORK_ORDER_MAX_RETRIES", "5")),
+        rate_limiter=RateLimiter(rate=float(os.getenv("VINTRACE_RATE_LIMIT", "10"))),
+        metrics=metrics,
     )
 
-    all_work_orders = []
-    more_data = True
+    # Page size that gave the best throughput is remembered for the next run
+    page_sizes = PageSizeStore(os.path.join("Main", "data", "page_sizes.json"))
+    pager = page_sizes.pager(f"GET {endpoint_path}", initial=limit, max_size=max_limit)
 
-    while more_data and offset < max_offset:
+    def fetch_page(page_offset, page_limit):
         params = {
-            "limit": limit,
-            "offset": offset,
+            "limit": page_limit,
+            "offset": page_offset,
             "scheduledSince": scheduled_since_val if scheduled_since_val else None
         }
         params = {k: v for k, v in params.items() if v is not None}
         try:
-            result = endpoint_caller.call(url, headers=headers, params=params)
-            work_orders = result.get("results", [])
-            logger.info(f"Retrieved {len(work_orders)} work orders [offset {offset}]")
-            all_logger.info(
-                f"✅ {len(work_orders)} work orders [offset {offset}] | Endpoint: {url} | Params: {params}"
-            )
-            all_work_orders.extend(work_orders)
-            if len(work_orders) < limit:
-                more_data = False
-            else:
-                offset += limit
+            result = client._request_with_retry("GET", endpoint_path, params=params)
         except Exception as e:
-            logger.error(f"❌ Error fetching work orders (offset {offset}): {e}")
-            all_logger.error(
-                f"❌ Error fetching work orders (offset {offset}): {e} | Endpoint: {url} | Params: {params}"
+            error_logger.error(
+                f"❌ Failed work orders page [offset {page_offset}, limit {page_limit}]: {e} | "
+                f"Endpoint: {url} | Params: {params}"
             )
-            more_data = False
+            raise
+        work_orders = result.get("results", [])
+        logger.info(f"Retrieved {len(work_orders)} work orders [offset {page_offset}, limit {page_limit}]")
+        all_logger.info(
+            f"✅ {len(work_orders)} work orders [offset {page_offset}] | Endpoint: {url} | Params: {params}"
+        )
+        return Page(work_orders, result.get("totalResults"), last_response["bytes"])
+
+    all_work_orders = []
+    try:
+        for work_orders in pager.iter_pages(fetch_page):
+            all_work_orders.extend(work_orders)
+            if len(all_work_orders) >= max_offset:
+                break
+    except Exception as e:
+        logger.error(f"❌ Error fetching work orders (offset {len(all_work_orders)}): {e}")
+        all_logger.error(
+            f"❌ Error fetching work orders (offset {len(all_work_orders)}): {e} | Endpoint: {url}"
+        )
+    page_sizes.save()
+    logger.info(f"Pager: {pager.stats()}")
 
     output_path = os.path.join(output_dir, "work_orders_paged.json")
     with open(output_path, "w", encoding="utf-8") as f:
@@ -142,4 +178,7 @@ if __name__ == "__main__":
         json.dump(job_ids, f, indent=2, ensure_ascii=False)
 
     print(f"Saved work order IDs ({len(wo_ids)}) to: {wo_ids_path}")
-    print(f"Saved job IDs ({len(job_ids)}) to: {job_ids_path}")
\ No newline at end of file
+    print(f"Saved job IDs ({len(job_ids)}) to: {job_ids_path}")
+
+    metrics.log_summary(logger)
+    metrics_exporter.close()
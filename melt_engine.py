@@ -0,0 +1,316 @@
+# Declarative melt engine: column-mapping specs compiled into single-pass row builders,
+# plus a streaming mode (ijson in, NDJSON/CSV out) whose memory does not grow with the input
+
+import csv
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+STREAM_FORMATS = ("ndjson", "csv")
+
+# Shared stand-in for missing/null nested objects (never modified)
+_EMPTY: Dict = {}
+
+
+def flatten_nested_object(obj: Optional[Dict], prefix: str = '') -> Dict:
+    """Flatten nested dictionary objects into dot notation."""
+    flattened = {}
+    if obj is None:
+        return flattened
+
+    for key, value in obj.items():
+        new_key = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict) and key not in ['unit']:  # Keep unit/value pairs together
+            flattened.update(flatten_nested_object(value, new_key))
+        else:
+            flattened[new_key] = value
+    return flattened
+
+
+class _Scope:
+    """
+    Code generation for one record variable (the top-level record or an item of
+    a nested array). Every distinct object path is resolved once, into a local,
+    and shared by all columns below it.
+    """
+
+    def __init__(self, var: str, lines: List[str], indent: str):
+        self.var = var
+        self.lines = lines
+        self.indent = indent
+        self._objects: Dict[Tuple[str, ...], str] = {(): var}
+
+    def _object(self, path: Tuple[str, ...]) -> str:
+        if path not in self._objects:
+            parent = self._object(path[:-1])
+            name = f"{self.var}_{len(self._objects)}"
+            self.lines.append(f"{self.indent}{name} = {parent}.get({path[-1]!r}) or _EMPTY")
+            self._objects[path] = name
+        return self._objects[path]
+
+    def value(self, path: str) -> str:
+        """Expression for the value at a dotted source path"""
+        keys = tuple(path.split('.'))
+        return f"{self._object(keys[:-1])}.get({keys[-1]!r})"
+
+
+def _check_table(name: str, table: Mapping[str, Any]) -> None:
+    unknown = set(table) - {'source', 'columns', 'parent_columns', 'index_column', 'flatten'}
+    if unknown:
+        raise ValueError(f"Table {name!r}: unknown spec keys {sorted(unknown)}")
+    if 'source' not in table and (table.get('parent_columns') or table.get('index_column')
+                                   or table.get('flatten')):
+        raise ValueError(f"Table {name!r}: parent_columns, index_column and flatten need a 'source' array")
+
+
+def _generate(tables: Mapping[str, Mapping[str, Any]]) -> str:
+    lines = ["def melt_record(r):"]
+    record = _Scope('r', lines, '    ')
+    results = []
+    for t, (name, table) in enumerate(tables.items()):
+        _check_table(name, table)
+        rows = f"t{t}"
+        results.append(rows)
+        if 'source' not in table:
+            body = record
+            fields = []
+        else:
+            # Parent columns are resolved once per record, before the item loop
+            fields = []
+            for column, path in (table.get('parent_columns') or {}).items():
+                local = f"p{t}_{len(fields)}"
+                lines.append(f"    {local} = {record.value(path)}")
+                fields.append(f"{column!r}: {local}")
+            item = f"i{t}"
+            lines.append(f"    {rows} = []")
+            source = record.value(table['source'])
+            if table.get('index_column'):
+                lines.append(f"    for n{t}, {item} in enumerate({source} or ()):")
+                fields.append(f"{table['index_column']!r}: n{t}")
+            else:
+                lines.append(f"    for {item} in {source} or ():")
+            body = _Scope(item, lines, '        ')
+
+        for column, path in (table.get('columns') or {}).items():
+            fields.append(f"{column!r}: {body.value(path)}")
+        row = "{" + ", ".join(fields) + "}"
+
+        if 'source' not in table:
+            lines.append(f"    {rows} = [{row}]")
+        elif table.get('flatten'):
+            lines.append(f"        row = {row}")
+            lines.append(f"        row.update(_flatten({item}))")
+            lines.append(f"        {rows}.append(row)")
+        else:
+            lines.append(f"        {rows}.append({row})")
+    lines.append(f"    return ({', '.join(results)}{',' if len(results) == 1 else ''})")
+    return "\n".join(lines) + "\n"
+
+
+class MeltSpec:
+    """
+    A column-mapping spec compiled once into a row-building function
+
+    A spec maps output table names to table specs, in output order:
+
+        {
+            "vessels_main.json": {
+                "columns": {"vessel_id": "id", "winery_name": "winery.name"},
+            },
+            "vessels_composition.json": {
+                "source": "composition",               # array of the record to emit one row per item of
+                "parent_columns": {"vessel_id": "id"},  # record columns repeated on every item row
+                "index_column": "composition_index",   # position of the item in the array
+                "columns": {"block_id": "block.id"},   # paths relative to the item
+            },
+            "vessels_allocations.json": {
+                "source": "allocations",
+                "parent_columns": {"vessel_id": "id"},
+                "flatten": True,                       # every item field, flattened to dot notation
+            },
+        }
+
+    Columns are dotted source paths; a missing or null object anywhere along
+    a path gives None. Row keys come out in parent_columns, index_column,
+    columns, flatten order.
+    """
+
+    def __init__(self, tables: Mapping[str, Mapping[str, Any]]):
+        """
+        Args:
+            tables: Output table name -> table spec (see class docstring)
+
+        Raises:
+            ValueError: A table spec has unknown keys or needs a 'source'
+        """
+        self.tables = dict(tables)
+        self.names = list(self.tables)
+        self.source = _generate(self.tables)
+        namespace = {'_EMPTY': _EMPTY, '_flatten': flatten_nested_object}
+        exec(compile(self.source, f"<melt spec: {', '.join(self.names)}>", 'exec'), namespace)
+        self.melt_record: Callable[[Dict], Tuple[List[Dict], ...]] = namespace['melt_record']
+        self._single: Dict[str, 'MeltSpec'] = {}
+
+    def melt(self, records: Iterable[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Melt records into every table in one pass
+
+        Returns:
+            Table name -> rows
+        """
+        outputs = [[] for _ in self.names]
+        extenders = [rows.extend for rows in outputs]
+        melt_record = self.melt_record
+        for record in records:
+            for extend, rows in zip(extenders, melt_record(record)):
+                extend(rows)
+        return dict(zip(self.names, outputs))
+
+    def table(self, name: str) -> 'MeltSpec':
+        """Spec of a single table, compiled on first use"""
+        if name not in self._single:
+            self._single[name] = MeltSpec({name: self.tables[name]})
+        return self._single[name]
+
+    def rows(self, name: str, records: Iterable[Dict]) -> List[Dict]:
+        """Rows of one table only"""
+        return self.table(name).melt(records)[name]
+
+    def columns(self, name: str) -> Optional[List[str]]:
+        """Columns of a table in row order, or None if they depend on the data (flatten)"""
+        table = self.tables[name]
+        if table.get('flatten'):
+            return None
+        columns = list(table.get('parent_columns') or ())
+        if table.get('index_column'):
+            columns.append(table['index_column'])
+        return columns + list(table.get('columns') or ())
+
+
+def iter_json_array(path: str) -> Iterator[Dict]:
+    """
+    Yield the items of a top-level JSON array one at a time
+
+    Raises:
+        ImportError: ijson is not installed
+    """
+    if ijson is None:
+        raise ImportError("Streaming melt requires ijson: pip install ijson")
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, 'item', use_float=True)
+
+
+def stream_file_name(name: str, fmt: str) -> str:
+    """Output file of a table in a stream format (vessels_main.json -> vessels_main.ndjson)"""
+    return f"{os.path.splitext(name)[0]}.{fmt}"
+
+
+class _NDJSONTable:
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self._f = open(path + '.tmp', 'w', encoding='utf-8')
+
+    def write(self, row: Dict) -> None:
+        self._f.write(json.dumps(row, ensure_ascii=False, default=str))
+        self._f.write('\n')
+        self.count += 1
+
+    def close(self) -> None:
+        self._f.close()
+        os.replace(self.path + '.tmp', self.path)
+
+    def abort(self) -> None:
+        self._f.close()
+        os.remove(self.path + '.tmp')
+
+
+class _CSVTable:
+    """
+    CSV with a fixed header; tables whose columns depend on the data are
+    spooled as NDJSON and converted once every column is known
+    """
+
+    def __init__(self, path: str, columns: Optional[List[str]]):
+        self.path = path
+        self.count = 0
+        self._columns = columns
+        if columns is not None:
+            self._f = open(path + '.tmp', 'w', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._f, fieldnames=columns)
+            self._writer.writeheader()
+        else:
+            self._seen: Dict[str, None] = {}  # insertion-ordered set
+            self._f = open(path + '.spool', 'w', encoding='utf-8')
+
+    def write(self, row: Dict) -> None:
+        if self._columns is not None:
+            self._writer.writerow(row)
+        else:
+            for key in row:
+                if key not in self._seen:
+                    self._seen[key] = None
+            self._f.write(json.dumps(row, ensure_ascii=False, default=str))
+            self._f.write('\n')
+        self.count += 1
+
+    def close(self) -> None:
+        self._f.close()
+        if self._columns is None:
+            with open(self.path + '.spool', 'r', encoding='utf-8') as spool, \
+                    open(self.path + '.tmp', 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=list(self._seen))
+                writer.writeheader()
+                for line in spool:
+                    writer.writerow(json.loads(line))
+            os.remove(self.path + '.spool')
+        os.replace(self.path + '.tmp', self.path)
+
+    def abort(self) -> None:
+        self._f.close()
+        os.remove(self.path + ('.tmp' if self._columns is not None else '.spool'))
+
+
+def stream_melt(spec: MeltSpec, records: Iterable[Dict], output_dir: str, fmt: str = "ndjson") -> Dict[str, int]:
+    """
+    Melt records straight to one NDJSON or CSV file per table, row by row
+
+    Only the current record and its rows are held in memory. Files are
+    written under temporary names and only replace existing outputs once
+    every record has been melted.
+
+    Args:
+        spec: Compiled tables to write
+        records: Input records, e.g. iter_json_array(path)
+        output_dir: Directory for the table files
+        fmt: "ndjson" or "csv" (default: "ndjson")
+
+    Returns:
+        Output file name -> rows written
+    """
+    if fmt not in STREAM_FORMATS:
+        raise ValueError(f"Unknown stream format {fmt!r}; expected one of {STREAM_FORMATS}")
+    os.makedirs(output_dir, exist_ok=True)
+    tables = []
+    try:
+        for name in spec.names:
+            path = os.path.join(output_dir, stream_file_name(name, fmt))
+            tables.append(_NDJSONTable(path) if fmt == "ndjson" else _CSVTable(path, spec.columns(name)))
+        writers = [table.write for table in tables]
+        melt_record = spec.melt_record
+        for record in records:
+            for write, rows in zip(writers, melt_record(record)):
+                for row in rows:
+                    write(row)
+    except BaseException:
+        for table in tables:
+            table.abort()
+        raise
+    for table in tables:
+        table.close()
+    return {os.path.basename(table.path): table.count for table in tables}
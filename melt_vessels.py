@@ -6,9 +6,13 @@ import os
 import json
 import logging
 import csv
-from typing import List, Dict, Any
+import argparse
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from melt_engine import STREAM_FORMATS, MeltSpec, iter_json_array, stream_melt
+from vessel_diff import CHANGE_SET_FILE, load_change_set, snapshot_id
+
 def setup_logging():
     logging.basicConfig(
         level=logging.INFO,
@@ -23,203 +27,172 @@ def ensure_dir(dir_path):
     if not os.path.exists(dir_path):
         os.makedirs(dir_path)
 
-def flatten_nested_object(obj: Dict, prefix: str = '') -> Dict:
-    """Flatten nested dictionary objects into dot notation."""
-    flattened = {}
-    if obj is None:
-        return flattened
-    
-    for key, value in obj.items():
-        new_key = f"{prefix}.{key}" if prefix else key
-        if isinstance(value, dict) and key not in ['unit']:  # Keep unit/value pairs together
-            flattened.update(flatten_nested_object(value, new_key))
-        else:
-            flattened[new_key] = value
-    return flattened
-
-def extract_main_vessels(vessels: List[Dict]) -> List[Dict]:
-    """Extract main vessel information without nested arrays."""
-    main_vessels = []
-    
-    for vessel in vessels:
-        main_vessel = {
+# Output table -> column mapping (see melt_engine.MeltSpec). Columns are dotted paths
+# into a vessel; the nested tables emit one row per item of a vessel array and carry
+# vessel_id. To add a column, add it here.
+VESSEL_TABLES = {
+    "vessels_main.json": {
+        "columns": {
             # Basic vessel info
-            'vessel_id': vessel.get('id'),
-            'product_id': vessel.get('productId'),
-            'name': vessel.get('name'),
-            'description': vessel.get('description'),
-            'vessel_type': vessel.get('vesselType'),
-            'details_as_at': vessel.get('detailsAsAt'),
-            
+            'vessel_id': 'id',
+            'product_id': 'productId',
+            'name': 'name',
+            'description': 'description',
+            'vessel_type': 'vesselType',
+            'details_as_at': 'detailsAsAt',
+
             # Winery info
-            'winery_id': vessel.get('winery', {}).get('id'),
-            'winery_name': vessel.get('winery', {}).get('name'),
-            'winery_business_unit': vessel.get('winery', {}).get('businessUnit'),
-            
+            'winery_id': 'winery.id',
+            'winery_name': 'winery.name',
+            'winery_business_unit': 'winery.businessUnit',
+
             # Wine Batch info
-            'wine_batch_designated_sub_region': vessel.get('wineBatch', {}).get('designatedSubRegion'),
-            'wine_batch_id': vessel.get('wineBatch', {}).get('id'),
-            'wine_batch_name': vessel.get('wineBatch', {}).get('name'),
-            'wine_batch_description': vessel.get('wineBatch', {}).get('description'),
-            'vintage': vessel.get('wineBatch', {}).get('vintage'),
-            'program': vessel.get('wineBatch', {}).get('program'),
-            
+            'wine_batch_designated_sub_region': 'wineBatch.designatedSubRegion',
+            'wine_batch_id': 'wineBatch.id',
+            'wine_batch_name': 'wineBatch.name',
+            'wine_batch_description': 'wineBatch.description',
+            'vintage': 'wineBatch.vintage',
+            'program': 'wineBatch.program',
+
             # Grading info
-            'grading_scale_name': vessel.get('wineBatch', {}).get('grading', {}).get('scaleName') if vessel.get('wineBatch', {}).get('grading') else None,
-            
-            'product_category': vessel.get('wineBatch', {}).get('productCategory'),
-            'designated_product': vessel.get('wineBatch', {}).get('designatedProduct'),
-            
+            'grading_scale_name': 'wineBatch.grading.scaleName',
+
+            'product_category': 'wineBatch.productCategory',
+            'designated_product': 'wineBatch.designatedProduct',
+
             # Designated Variety
-            'designated_variety_id': vessel.get('wineBatch', {}).get('designatedVariety', {}).get('id'),
-            'designated_variety_code': vessel.get('wineBatch', {}).get('designatedVariety', {}).get('code'),
-            'designated_variety_name': vessel.get('wineBatch', {}).get('designatedVariety', {}).get('name'),
-            
+            'designated_variety_id': 'wineBatch.designatedVariety.id',
+            'designated_variety_code': 'wineBatch.designatedVariety.code',
+            'designated_variety_name': 'wineBatch.designatedVariety.name',
+
             # Designated Region
-            'designated_region_id': vessel.get('wineBatch', {}).get('designatedRegion', {}).get('id') if vessel.get('wineBatch', {}).get('designatedRegion') else None,
-            'designated_region_name': vessel.get('wineBatch', {}).get('designatedRegion', {}).get('name') if vessel.get('wineBatch', {}).get('designatedRegion') else None,
-            'designated_region_code': vessel.get('wineBatch', {}).get('designatedRegion', {}).get('code') if vessel.get('wineBatch', {}).get('designatedRegion') else None,
-            
+            'designated_region_id': 'wineBatch.designatedRegion.id',
+            'designated_region_name': 'wineBatch.designatedRegion.name',
+            'designated_region_code': 'wineBatch.designatedRegion.code',
+
             # Product State
-            'product_state_id': vessel.get('productState', {}).get('id'),
-            'product_state_name': vessel.get('productState', {}).get('name'),
-            'expected_losses_percentage': vessel.get('productState', {}).get('expectedLossesPercentage'),
-            
+            'product_state_id': 'productState.id',
+            'product_state_name': 'productState.name',
+            'expected_losses_percentage': 'productState.expectedLossesPercentage',
+
             # Volume metrics
-            'volume_value': vessel.get('volume', {}).get('value'),
-            'volume_unit': vessel.get('volume', {}).get('unit'),
-            'capacity_value': vessel.get('capacity', {}).get('value'),
-            'capacity_unit': vessel.get('capacity', {}).get('unit'),
-            'ullage_value': vessel.get('ullage', {}).get('value'),
-            'ullage_unit': vessel.get('ullage', {}).get('unit'),
-            'unallocated_volume_value': vessel.get('unallocatedVolume', {}).get('value'),
-            'unallocated_volume_unit': vessel.get('unallocatedVolume', {}).get('unit'),
-            'unallocated_percentage_of_vessel': vessel.get('unallocatedPercentageOfVessel'),
-            
+            'volume_value': 'volume.value',
+            'volume_unit': 'volume.unit',
+            'capacity_value': 'capacity.value',
+            'capacity_unit': 'capacity.unit',
+            'ullage_value': 'ullage.value',
+            'ullage_unit': 'ullage.unit',
+            'unallocated_volume_value': 'unallocatedVolume.value',
+            'unallocated_volume_unit': 'unallocatedVolume.unit',
+            'unallocated_percentage_of_vessel': 'unallocatedPercentageOfVessel',
+
             # TTB Details
-            'ttb_bond_id': vessel.get('ttbDetails', {}).get('bond', {}).get('id'),
-            'ttb_bond_name': vessel.get('ttbDetails', {}).get('bond', {}).get('name'),
-            'ttb_tax_state': vessel.get('ttbDetails', {}).get('taxState'),
-            
+            'ttb_bond_id': 'ttbDetails.bond.id',
+            'ttb_bond_name': 'ttbDetails.bond.name',
+            'ttb_tax_state': 'ttbDetails.taxState',
+
             # TTB Tax Class (can be null)
-            'ttb_tax_class_id': vessel.get('ttbDetails', {}).get('taxClass', {}).get('id') if vessel.get('ttbDetails', {}).get('taxClass') else None,
-            'ttb_tax_class_name': vessel.get('ttbDetails', {}).get('taxClass', {}).get('name') if vessel.get('ttbDetails', {}).get('taxClass') else None,
-            'ttb_tax_class_federal_name': vessel.get('ttbDetails', {}).get('taxClass', {}).get('federalName') if vessel.get('ttbDetails', {}).get('taxClass') else None,
-            'ttb_tax_class_state_name': vessel.get('ttbDetails', {}).get('taxClass', {}).get('stateName') if vessel.get('ttbDetails', {}).get('taxClass') else None,
-            
-            'ttb_alcohol_percentage': vessel.get('ttbDetails', {}).get('alcoholPercentage'),
-            
+            'ttb_tax_class_id': 'ttbDetails.taxClass.id',
+            'ttb_tax_class_name': 'ttbDetails.taxClass.name',
+            'ttb_tax_class_federal_name': 'ttbDetails.taxClass.federalName',
+            'ttb_tax_class_state_name': 'ttbDetails.taxClass.stateName',
+
+            'ttb_alcohol_percentage': 'ttbDetails.alcoholPercentage',
+
             # Cost breakdown
-            'cost_total': vessel.get('cost', {}).get('total'),
-            'cost_fruit': vessel.get('cost', {}).get('fruit'),
-            'cost_overhead': vessel.get('cost', {}).get('overhead'),
-            'cost_storage': vessel.get('cost', {}).get('storage'),
-            'cost_additive': vessel.get('cost', {}).get('additive'),
-            'cost_bulk': vessel.get('cost', {}).get('bulk'),
-            'cost_packaging': vessel.get('cost', {}).get('packaging'),
-            'cost_operation': vessel.get('cost', {}).get('operation'),
-            'cost_freight': vessel.get('cost', {}).get('freight'),
-            'cost_other': vessel.get('cost', {}).get('other'),
-            
+            'cost_total': 'cost.total',
+            'cost_fruit': 'cost.fruit',
+            'cost_overhead': 'cost.overhead',
+            'cost_storage': 'cost.storage',
+            'cost_additive': 'cost.additive',
+            'cost_bulk': 'cost.bulk',
+            'cost_packaging': 'cost.packaging',
+            'cost_operation': 'cost.operation',
+            'cost_freight': 'cost.freight',
+            'cost_other': 'cost.other',
+
             # Beverage Type
-            'beverage_type_id': vessel.get('beverageType', {}).get('id'),
-            'beverage_type_name': vessel.get('beverageType', {}).get('name'),
-            
+            'beverage_type_id': 'beverageType.id',
+            'beverage_type_name': 'beverageType.name',
+
             # Owner
-            'owner_id': vessel.get('owner', {}).get('id'),
-            'owner_name': vessel.get('owner', {}).get('name'),
-            'owner_ext_id': vessel.get('owner', {}).get('extId'),
-            
+            'owner_id': 'owner.id',
+            'owner_name': 'owner.name',
+            'owner_ext_id': 'owner.extId',
+
             # Sparkling Info
-            'sparkling_state': vessel.get('sparklingInfo', {}).get('state'),
-        }
-        
-        main_vessels.append(main_vessel)
-    
-    return main_vessels
+            'sparkling_state': 'sparklingInfo.state',
+        },
+    },
+    "vessels_composition.json": {
+        "source": "composition",
+        "parent_columns": {'vessel_id': 'id'},
+        "index_column": 'composition_index',  # To maintain order and uniqueness
+        "columns": {
+            'weighting': 'weighting',
+            'percentage': 'percentage',
+            'component_volume_value': 'componentVolume.value',
+            'component_volume_unit': 'componentVolume.unit',
+            'vintage': 'vintage',
+
+            # Block info
+            'block_id': 'block.id',
+            'block_name': 'block.name',
+            'block_ext_id': 'block.extId',
+
+            # Region info
+            'region_id': 'region.id',
+            'region_name': 'region.name',
+            'region_code': 'region.code',
+
+            # Variety info
+            'variety_id': 'variety.id',
+            'variety_name': 'variety.name',
+            'variety_code': 'variety.code',
+
+            # SubRegion info
+            'sub_region_id': 'subRegion.id',
+            'sub_region_name': 'subRegion.name',
+            'sub_region_code': 'subRegion.code',
+        },
+    },
+    "vessels_live_metrics.json": {
+        "source": "liveMetrics",
+        "parent_columns": {'vessel_id': 'id'},
+        "columns": {
+            'metric_name': 'name',
+            'value': 'value',
+            'non_numeric_value': 'nonNumericValue',
+            'interface_mapped_name': 'interfaceMappedName',
+        },
+    },
+    "vessels_allocations.json": {
+        "source": "allocations",
+        "parent_columns": {'vessel_id': 'id'},
+        "index_column": 'allocation_index',
+        "flatten": True,  # Allocation structure may vary
+    },
+}
+
+# Compiled once at import; melt_all() builds every table in a single pass over the vessels
+VESSEL_MELT = MeltSpec(VESSEL_TABLES)
+melt_all = VESSEL_MELT.melt
+
+def extract_main_vessels(vessels: List[Dict]) -> List[Dict]:
+    """Extract main vessel information without nested arrays."""
+    return VESSEL_MELT.rows("vessels_main.json", vessels)
 
 def extract_compositions(vessels: List[Dict]) -> List[Dict]:
     """Extract composition data linked to vessel_id."""
-    compositions = []
-    
-    for vessel in vessels:
-        vessel_id = vessel.get('id')
-        composition_list = vessel.get('composition', [])
-        
-        for idx, comp in enumerate(composition_list):
-            composition = {
-                'vessel_id': vessel_id,
-                'composition_index': idx,  # To maintain order and uniqueness
-                'weighting': comp.get('weighting'),
-                'percentage': comp.get('percentage'),
-                'component_volume_value': comp.get('componentVolume', {}).get('value'),
-                'component_volume_unit': comp.get('componentVolume', {}).get('unit'),
-                'vintage': comp.get('vintage'),
-                
-                # Block info
-                'block_id': comp.get('block', {}).get('id'),
-                'block_name': comp.get('block', {}).get('name'),
-                'block_ext_id': comp.get('block', {}).get('extId'),
-                
-                # Region info
-                'region_id': comp.get('region', {}).get('id'),
-                'region_name': comp.get('region', {}).get('name'),
-                'region_code': comp.get('region', {}).get('code'),
-                
-                # Variety info
-                'variety_id': comp.get('variety', {}).get('id'),
-                'variety_name': comp.get('variety', {}).get('name'),
-                'variety_code': comp.get('variety', {}).get('code'),
-                
-                # SubRegion info
-                'sub_region_id': comp.get('subRegion', {}).get('id'),
-                'sub_region_name': comp.get('subRegion', {}).get('name'),
-                'sub_region_code': comp.get('subRegion', {}).get('code'),
-            }
-            
-            compositions.append(composition)
-    
-    return compositions
+    return VESSEL_MELT.rows("vessels_composition.json", vessels)
 
 def extract_live_metrics(vessels: List[Dict]) -> List[Dict]:
     """Extract live metrics data linked to vessel_id."""
-    live_metrics = []
-    
-    for vessel in vessels:
-        vessel_id = vessel.get('id')
-        metrics_list = vessel.get('liveMetrics', [])
-        
-        for metric in metrics_list:
-            metric_data = {
-                'vessel_id': vessel_id,
-                'metric_name': metric.get('name'),
-                'value': metric.get('value'),
-                'non_numeric_value': metric.get('nonNumericValue'),
-                'interface_mapped_name': metric.get('interfaceMappedName'),
-            }
-            
-            live_metrics.append(metric_data)
-    
-    return live_metrics
+    return VESSEL_MELT.rows("vessels_live_metrics.json", vessels)
 
 def extract_allocations(vessels: List[Dict]) -> List[Dict]:
     """Extract allocation data linked to vessel_id."""
-    allocations = []
-    
-    for vessel in vessels:
-        vessel_id = vessel.get('id')
-        allocation_list = vessel.get('allocations', [])
-        
-        for idx, alloc in enumerate(allocation_list):
-            allocation = {
-                'vessel_id': vessel_id,
-                'allocation_index': idx,
-            }
-            # Flatten all allocation fields (structure may vary)
-            allocation.update(flatten_nested_object(alloc))
-            allocations.append(allocation)
-    
-    return allocations
+    return VESSEL_MELT.rows("vessels_allocations.json", vessels)
 
 def write_to_json(data: List[Dict], filepath: str):
     """Write data to JSON file."""
@@ -240,12 +213,109 @@ def write_to_csv(data: List[Dict], filepath: str):
         dict_writer.writerows(data)
     logger.info(f"✅ Wrote {len(data)} records to {filepath}")
 
+MELT_STATE_FILE = "_melt_state.json"
+
+def load_melt_state(output_dir: str) -> Dict[str, Any]:
+    """Snapshot fingerprint the current melt outputs were built from."""
+    path = os.path.join(output_dir, MELT_STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return {}
+
+def save_melt_state(output_dir: str, snapshot: str, mode: str):
+    with open(os.path.join(output_dir, MELT_STATE_FILE), 'w', encoding='utf-8') as f:
+        json.dump({'snapshot': snapshot, 'mode': mode, 'melted_at': datetime.now().isoformat()}, f, indent=2)
+
+def apply_changes(rows: List[Dict], replacements: Dict[Any, List[Dict]], removed_ids: set) -> List[Dict]:
+    """
+    Update a melted table in place.
+
+    Rows of removed vessels are dropped; the rows of each vessel in
+    replacements take the place of its old rows (or are appended if the
+    vessel is new). Every other row keeps its position.
+    """
+    updated = []
+    replaced = set()
+    for row in rows:
+        vessel_id = row.get('vessel_id')
+        if vessel_id in removed_ids:
+            continue
+        if vessel_id in replacements:
+            if vessel_id not in replaced:
+                updated.extend(replacements[vessel_id])
+                replaced.add(vessel_id)
+            continue
+        updated.append(row)
+    for vessel_id, vessel_rows in replacements.items():
+        if vessel_id not in replaced:
+            updated.extend(vessel_rows)
+    return updated
+
+def melt_differential(vessels: List[Dict], change_set: Dict[str, Any], output_dir: str) -> Optional[Dict[str, List[Dict]]]:
+    """
+    Re-melt only the added/changed vessels of a change set and patch the existing outputs.
+
+    Returns the updated tables, or None if an output file could not be read
+    (the caller then falls back to a full melt).
+    """
+    touched_ids = set(change_set['added']) | set(change_set['changed'])
+    touched = [v for v in vessels if v.get('id') in touched_ids]
+    removed_ids = set(change_set['removed'])
+    melted = melt_all(touched)
+
+    tables = {}
+    for filename in VESSEL_TABLES:
+        path = os.path.join(output_dir, filename)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                rows = json.load(f)
+        except (IOError, ValueError) as e:
+            logger.warning(f"Cannot update {path} in place ({e}); doing a full melt")
+            return None
+        replacements = {vessel_id: [] for vessel_id in touched_ids}
+        for row in melted[filename]:
+            replacements[row['vessel_id']].append(row)
+        tables[filename] = apply_changes(rows, replacements, removed_ids)
+    return tables
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Melt vessels.json into main/composition/live metrics/allocation tables")
+    parser.add_argument("--full", action="store_true",
+                        help="Re-melt every vessel even if a change set allows a differential update")
+    parser.add_argument("--stream", action="store_true",
+                        help="Parse vessels.json incrementally and write each table row by row (needs ijson)")
+    parser.add_argument("--format", choices=STREAM_FORMATS, default="ndjson",
+                        help="Output format of --stream (default: ndjson)")
+    args = parser.parse_args()
+
     # Input and output paths
     input_file = "Main/data/GET--vessels/vessels.json"
     output_dir = "Main/data/processed_vessels"
     ensure_dir(output_dir)
-    
+
+    # Streaming mode: constant memory however many vessels there are. Always a full
+    # melt, written as .ndjson/.csv next to (not instead of) the JSON tables.
+    if args.stream:
+        logger.info(f"Streaming vessels from {input_file} to {args.format.upper()}...")
+        try:
+            counts = stream_melt(VESSEL_MELT, iter_json_array(input_file), output_dir, args.format)
+        except ImportError as e:
+            logger.error(f"❌ {e}")
+            exit(1)
+        except FileNotFoundError:
+            logger.error(f"❌ File not found: {input_file}")
+            exit(1)
+        except ValueError as e:
+            logger.error(f"❌ Error parsing JSON: {e}")
+            exit(1)
+        for filename, count in counts.items():
+            logger.info(f"✅ Wrote {count} records to {os.path.join(output_dir, filename)}")
+        exit(0)
+
     # Load vessels data
     logger.info(f"Loading vessels from {input_file}...")
     try:
@@ -259,25 +329,47 @@ if __name__ == "__main__":
         logger.error(f"❌ Error parsing JSON: {e}")
         exit(1)
     
-    # Extract data
-    logger.info("Extracting main vessel information...")
-    main_vessels = extract_main_vessels(vessels)
-    
-    logger.info("Extracting composition data...")
-    compositions = extract_compositions(vessels)
-    
-    logger.info("Extracting live metrics data...")
-    live_metrics = extract_live_metrics(vessels)
-    
-    logger.info("Extracting allocation data...")
-    allocations = extract_allocations(vessels)
-    
+    # Differential mode: fetch_Vessels.py leaves a change set next to vessels.json. If the
+    # current outputs were melted from its base snapshot, only the changed vessels are re-melted.
+    current_snapshot = snapshot_id(vessels)
+    change_set = load_change_set(os.path.join(os.path.dirname(input_file), CHANGE_SET_FILE))
+    melted_snapshot = load_melt_state(output_dir).get('snapshot')
+    tables = None
+    mode = 'full'
+    if args.full:
+        logger.info("Full melt requested")
+    elif melted_snapshot == current_snapshot:
+        logger.info("Melt outputs are already at this snapshot; nothing to re-melt")
+        change_set = {'added': [], 'changed': [], 'removed': [], 'unchanged': len(vessels)}
+        tables = melt_differential(vessels, change_set, output_dir)
+        mode = 'differential'
+    elif change_set is None:
+        logger.info("No change set found; doing a full melt")
+    elif change_set.get('to_snapshot') != current_snapshot:
+        logger.info("Change set does not match vessels.json; doing a full melt")
+    elif melted_snapshot is None or melted_snapshot != change_set.get('from_snapshot'):
+        logger.info("Melt outputs are not at the change set's base snapshot; doing a full melt")
+    else:
+        logger.info(f"Differential melt: {len(change_set['added'])} added, {len(change_set['changed'])} changed, "
+                    f"{len(change_set['removed'])} removed, {change_set['unchanged']} unchanged")
+        tables = melt_differential(vessels, change_set, output_dir)
+        mode = 'differential'
+
+    if tables is None:
+        mode = 'full'
+        logger.info("Melting all vessels (single pass)...")
+        tables = melt_all(vessels)
+
+    main_vessels = tables["vessels_main.json"]
+    compositions = tables["vessels_composition.json"]
+    live_metrics = tables["vessels_live_metrics.json"]
+    allocations = tables["vessels_allocations.json"]
+
     # Write to JSON files
     logger.info("Writing JSON files...")
-    write_to_json(main_vessels, os.path.join(output_dir, "vessels_main.json"))
-    write_to_json(compositions, os.path.join(output_dir, "vessels_composition.json"))
-    write_to_json(live_metrics, os.path.join(output_dir, "vessels_live_metrics.json"))
-    write_to_json(allocations, os.path.join(output_dir, "vessels_allocations.json"))
+    for filename, rows in tables.items():
+        write_to_json(rows, os.path.join(output_dir, filename))
+    save_melt_state(output_dir, current_snapshot, mode)
 
     
     # Summary statistics
@@ -0,0 +1,71 @@
+# Differential vessel snapshots shared by fetch_Vessels.py and melt_vessels.py
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+CHANGE_SET_FILE = "vessels_changes.json"
+
+
+def vessel_version(vessel: Dict[str, Any]) -> str:
+    """What identifies one version of a vessel: detailsAsAt, or the whole record if it has none."""
+    details_as_at = vessel.get("detailsAsAt")
+    if details_as_at is not None:
+        return str(details_as_at)
+    return hashlib.sha1(json.dumps(vessel, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def snapshot_id(vessels: Iterable[Dict[str, Any]]) -> str:
+    """Fingerprint of a snapshot: every (vessel_id, version) pair, order independent."""
+    pairs = sorted((str(v.get("id")), vessel_version(v)) for v in vessels)
+    return hashlib.sha1(json.dumps(pairs).encode("utf-8")).hexdigest()
+
+
+def diff_snapshots(previous: Optional[List[Dict[str, Any]]], current: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Compare two snapshots by vessel id and detailsAsAt.
+
+    Returns:
+        Change set with added/changed/removed vessel ids (in current/previous
+        order), the unchanged count and the fingerprints of both snapshots.
+        With no previous snapshot every vessel is added.
+    """
+    previous = previous or []
+    old_versions = {v.get("id"): vessel_version(v) for v in previous}
+    new_ids = set()
+    added, changed = [], []
+    for vessel in current:
+        vessel_id = vessel.get("id")
+        new_ids.add(vessel_id)
+        if vessel_id not in old_versions:
+            added.append(vessel_id)
+        elif old_versions[vessel_id] != vessel_version(vessel):
+            changed.append(vessel_id)
+    removed = [v.get("id") for v in previous if v.get("id") not in new_ids]
+    return {
+        "generated_at": datetime.now().isoformat(),
+        "from_snapshot": snapshot_id(previous) if previous else None,
+        "to_snapshot": snapshot_id(current),
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+        "unchanged": len(current) - len(added) - len(changed),
+    }
+
+
+def write_change_set(change_set: Dict[str, Any], path: str) -> None:
+    """Write a change set atomically."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(change_set, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def load_change_set(path: str) -> Optional[Dict[str, Any]]:
+    """Read a change set, or None if there is none."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)